@@ -77,7 +77,7 @@ class RuntimeService:
 
     def stop(self) -> None:
         if self._running:
-            self.runtime.stop()
+            self.runtime.close()
             self._running = False
 
     def run_forever(self) -> None:
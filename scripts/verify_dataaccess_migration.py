@@ -91,8 +91,8 @@ def test_backtest_analytics():
         print("  ✅ BacktestAnalytics 导入成功")
         
         # 测试实例化
-        analytics = BacktestAnalytics()
-        print(f"     - BacktestAnalytics 实例: {analytics}")
+        with BacktestAnalytics() as analytics:
+            print(f"     - BacktestAnalytics 实例: {analytics}")
         
         return True
     except Exception as e:
@@ -5,17 +5,20 @@ Common Data Access Layer - 公共数据访问层
 - OrmBase: SQLAlchemy 声明式基类
 - DatabaseEngine: 数据库引擎管理
 - BaseRepository: 通用仓储基类
+- json_dumps / json_loads: JSON 编解码（优先使用 orjson）
 
 使用方式：
     from src.common.dataaccess import OrmBase, DatabaseEngine, BaseRepository
 """
 
 from .orm_base import OrmBase
-from .database_engine import DatabaseEngine
+from .database_engine import DatabaseEngine, json_dumps, json_loads
 from .base_repository import BaseRepository
 
 __all__ = [
     'OrmBase',
     'DatabaseEngine',
     'BaseRepository',
+    'json_dumps',
+    'json_loads',
 ]
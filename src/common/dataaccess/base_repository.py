@@ -5,6 +5,7 @@ Base Repository - 仓储基类
 """
 
 from typing import TypeVar, Generic, Type, List, Optional, Any, Dict
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from .orm_base import OrmBase
 
@@ -79,6 +80,86 @@ class BaseRepository(Generic[T]):
             self.session.refresh(entity)
         return entities
 
+    def bulk_insert(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        批量插入原始数据行
+
+        绕过 ORM 对象构建，在单个事务中以一条多值 INSERT 写入，
+        适合大批量写入且不需要回读实体的场景。
+
+        Args:
+            rows: 字段名到值的字典列表
+
+        Returns:
+            插入的行数
+
+        Example:
+            repository.bulk_insert([
+                {"symbol": "AAPL", "metric_type": "sharpe_ratio"},
+                {"symbol": "MSFT", "metric_type": "sharpe_ratio"},
+            ])
+        """
+        if not rows:
+            return 0
+        try:
+            self.session.execute(self.model.__table__.insert(), rows)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return len(rows)
+
+    def insert_returning_id(self, values: Dict[str, Any]) -> Any:
+        """
+        插入单行并返回主键 ID（不提交事务）
+
+        不经过 ORM 对象和标识映射，支持 RETURNING 的方言由 INSERT
+        语句本身带回主键，省去 flush 后的回读查询。适合只需要 ID 的写入。
+
+        Args:
+            values: 字段名到值的字典
+
+        Returns:
+            新行的主键 ID
+
+        Example:
+            new_id = repository.insert_returning_id({"symbol": "AAPL"})
+            repository.session.commit()
+        """
+        stmt = insert(self.model).values(**values)
+        if self.session.get_bind().dialect.insert_returning:
+            return self.session.execute(stmt.returning(self.model.id)).scalar_one()
+        return self.session.execute(stmt).inserted_primary_key[0]
+
+    def insert_many_returning_ids(self, rows: List[Dict[str, Any]]) -> List[Any]:
+        """
+        批量插入多行并按输入顺序返回主键 ID 列表（不提交事务）
+
+        支持 executemany + RETURNING 的方言以批量多值 INSERT 一次带回全部主键，
+        并按参数顺序排序；其余方言逐行回退到 insert_returning_id。
+
+        Args:
+            rows: 字段名到值的字典列表
+
+        Returns:
+            新行的主键 ID 列表，与 rows 顺序一致
+
+        Example:
+            ids = repository.insert_many_returning_ids([
+                {"symbol": "AAPL"},
+                {"symbol": "MSFT"},
+            ])
+            repository.session.commit()
+        """
+        if not rows:
+            return []
+        if self.session.get_bind().dialect.insert_executemany_returning:
+            stmt = insert(self.model).returning(
+                self.model.id, sort_by_parameter_order=True
+            )
+            return list(self.session.scalars(stmt, rows))
+        return [self.insert_returning_id(row) for row in rows]
+
     # ==================== 查询 ====================
 
     def get_by_id(self, entity_id: Any) -> Optional[T]:
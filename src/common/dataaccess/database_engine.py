@@ -5,15 +5,91 @@ Database Engine - 数据库引擎管理器
 支持多种数据库（SQLite、MySQL、PostgreSQL等）
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.schema import CreateColumn
 from sqlalchemy.ext.declarative import DeclarativeMeta
+from datetime import date, datetime
+from decimal import Decimal
 from pathlib import Path
+import json
 import logging
+import math
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+def _json_default(value):
+    """JSON 列序列化兜底：日期转 ISO 字符串，Decimal 转 float，其余转字符串"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value) if value.is_finite() else None
+    return str(value)
+
+
+def _finite(value):
+    """把 NaN/Infinity 替换为 None（与 orjson 输出 null 的行为一致）"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+# 复用同一个编码器实例，避免 json.dumps 每次调用都新建 JSONEncoder；
+# allow_nan=False 保证写出的都是标准 JSON
+_stdlib_encode = json.JSONEncoder(
+    ensure_ascii=False, allow_nan=False, default=_json_default
+).encode
+
+
+def json_dumps(value) -> str:
+    """
+    序列化为 JSON 字符串（JSON 列与手工存储 JSON 文本共用）
+
+    安装了 orjson 时优先使用，否则回退到标准库编码器。
+    """
+    # 空容器与 None 很常见（无错误、无快照），直接返回常量
+    if value is None:
+        return "null"
+    if type(value) is dict and not value:
+        return "{}"
+    if type(value) is list and not value:
+        return "[]"
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                value,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            ).decode()
+        except TypeError:
+            # 超出 64 位的整数等 orjson 不支持的值，交给标准库处理
+            pass
+    return _stdlib_encode(_finite(value))
+
+
+def json_loads(value):
+    """解析 JSON 文本，安装了 orjson 时优先使用"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # 标准库 json 写入的旧数据可能含 NaN/Infinity，orjson 拒绝解析
+            pass
+    return json.loads(value)
+
+
 class DatabaseEngine:
     """
     数据库引擎管理器 - 管理 SQLAlchemy Engine 和 Session
@@ -44,21 +120,52 @@ class DatabaseEngine:
         # 创建 SQLAlchemy Engine
         # 配置选项：
         # - echo: 打印 SQL 语句（调试用）
-        # - pool_pre_ping: 连接前检查连接是否有效
+        # - pool_pre_ping: 连接前检查连接是否有效（本地 SQLite 文件不会断线，不检查）
         # - check_same_thread: SQLite 多线程支持
+        # - QueuePool: 复用连接，保留 SQLite 每连接的页缓存
+        # - pool_use_lifo: 优先复用最近归还的连接，空闲的溢出连接可尽快回收
         connect_args = {}
-        if db_url.startswith("sqlite"):
+        pool_args = {}
+        is_sqlite = db_url.startswith("sqlite")
+        in_memory = db_url == "sqlite://" or ":memory:" in db_url
+        if is_sqlite:
             connect_args["check_same_thread"] = False
+        if not in_memory:
+            pool_args = dict(
+                poolclass=QueuePool,
+                pool_size=10,
+                max_overflow=5,
+                pool_recycle=1800,
+                pool_use_lifo=True,
+            )
 
         self.engine = create_engine(
-            db_url, echo=echo, pool_pre_ping=True, connect_args=connect_args
+            db_url,
+            echo=echo,
+            pool_pre_ping=not is_sqlite,
+            # executemany + RETURNING 时每条多值 INSERT 携带的行数
+            insertmanyvalues_page_size=1000,
+            connect_args=connect_args,
+            json_serializer=json_dumps,
+            json_deserializer=json_loads,
+            **pool_args,
         )
 
+        if is_sqlite:
+            # WAL 模式：读写互不阻塞；配合 NORMAL 同步级别，每个事务只在检查点 fsync
+            @event.listens_for(self.engine, "connect")
+            def _enable_wal(dbapi_connection, _connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.close()
+
         # 创建 Session 工厂
         # Session 是数据库操作的主要接口
         self.session_factory = sessionmaker(
             autocommit=False,  # 手动提交事务
             autoflush=False,  # 手动刷新
+            expire_on_commit=False,  # 提交后不重新加载对象
             bind=self.engine,  # 绑定到引擎
         )
 
@@ -90,7 +197,8 @@ class DatabaseEngine:
         创建所有表
 
         根据 OrmBase 的元数据创建数据库表结构。
-        如果表已存在，不会重复创建。
+        如果表已存在，不会重复创建，但会补齐模型中新增的可空列与索引
+        （能力有限，见 _add_missing_columns）。
 
         Args:
             orm_base: OrmBase 类（包含所有模型的元数据）
@@ -100,8 +208,56 @@ class DatabaseEngine:
             engine.create_tables(OrmBase)
         """
         orm_base.metadata.create_all(bind=self.engine)
+        self._add_missing_columns(orm_base)
+        self._create_missing_indexes(orm_base)
         logger.info("数据库表已创建")
 
+    def _add_missing_columns(self, orm_base: DeclarativeMeta):
+        """
+        为已存在的表补齐模型新增的可空列（幂等）
+
+        create_all 不会修改已有表，旧库缺少新列时查询会直接失败。
+        这里只以 ALTER TABLE ... ADD COLUMN 追加可空且无服务端默认值的列，
+        旧行的新列为 NULL，各数据库（包括 SQLite）均支持。
+
+        不处理的情况（只记录警告，需要手工迁移）：
+        - 非空列，或带 server_default 的列（SQLite 不允许追加
+          CURRENT_TIMESTAMP 等非常量默认值）
+        - 列类型、约束、外键的变化，以及模型中已删除的列
+        """
+        dialect = self.engine.dialect
+        preparer = dialect.identifier_preparer
+        existing_tables = set(inspect(self.engine).get_table_names())
+
+        for table in orm_base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing = {
+                col["name"] for col in inspect(self.engine).get_columns(table.name)
+            }
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                if not column.nullable or column.server_default is not None:
+                    logger.warning(
+                        f"无法自动补齐列 {table.name}.{column.name}"
+                        f"（非空或带服务端默认值），请手工迁移"
+                    )
+                    continue
+                ddl = (
+                    f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN "
+                    f"{CreateColumn(column).compile(dialect=dialect)}"
+                )
+                with self.engine.begin() as conn:
+                    conn.execute(text(ddl))
+                logger.info(f"已补齐数据库列: {table.name}.{column.name}")
+
+    def _create_missing_indexes(self, orm_base: DeclarativeMeta):
+        """为已存在的表创建模型中新增的索引（已存在的索引跳过）"""
+        for table in orm_base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=self.engine, checkfirst=True)
+
     def drop_tables(self, orm_base: DeclarativeMeta):
         """
         删除所有表（慎用！）
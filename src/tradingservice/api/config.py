@@ -21,6 +21,9 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     WORKERS: int = 1
+    # "auto" lets uvicorn use uvloop when it is importable and the stock
+    # asyncio loop otherwise; set "uvloop" to require it
+    EVENT_LOOP: str = "auto"
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:5173"]
@@ -28,6 +31,9 @@ class Settings(BaseSettings):
     CORS_METHODS: List[str] = ["*"]
     CORS_HEADERS: List[str] = ["*"]
 
+    # Response compression
+    GZIP_MINIMUM_SIZE: int = 1024
+
     # Security
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
     API_KEY_HEADER: str = "X-API-Key"
@@ -7,6 +7,8 @@ portfolio management, and real-time data streaming.
 """
 
 import sys
+import time
+import asyncio
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -18,6 +20,7 @@ sys.path.insert(0, str(project_root))
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -29,8 +32,10 @@ from .middleware import (
     general_exception_handler,
 )
 from .routes import tasks, scheduler, strategies
-from .dependencies import get_scheduler
-from .models.common_models import HealthCheckResponse
+from api.dependencies import get_scheduler
+from api.models.common_models import HealthCheckResponse
+from api.responses import ORJSONModelResponse
+from api.services.strategy_service import shutdown_executor
 
 
 # Configure logging
@@ -44,6 +49,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Process start time, used for health-check uptime reporting
+_STARTED_AT = time.time()
+
+# Pre-built health response; each probe only copies it with fresh fields
+_HEALTH_TEMPLATE = HealthCheckResponse.model_construct(
+    status="healthy",
+    version=settings.APP_VERSION,
+    uptime_seconds=0.0,
+    dependencies={"scheduler": "healthy"},
+    timestamp="",
+)
+
 
 # Application lifespan management
 @asynccontextmanager
@@ -54,6 +71,12 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info("=" * 60)
 
+    # Run coroutines eagerly until their first real suspension (Python 3.12+)
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+        logger.info("✓ Eager task factory enabled")
+
     # Initialize scheduler
     try:
         scheduler_instance = get_scheduler()
@@ -73,10 +96,15 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down...")
     try:
-        scheduler_instance = get_scheduler()
-        if scheduler_instance.is_running:
-            scheduler_instance.stop()
-            logger.info("✓ Scheduler stopped")
+        await asyncio.to_thread(shutdown_executor)
+        logger.info("✓ Strategy analysis pool stopped")
+
+        await asyncio.to_thread(tasks.get_task_service().shutdown)
+        logger.info("✓ Task execution pools stopped")
+
+        # Stops the scheduler if running and flushes queued execution records
+        await asyncio.to_thread(get_scheduler().close)
+        logger.info("✓ Scheduler stopped")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
 
@@ -109,6 +137,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONModelResponse,
     lifespan=lifespan,
 )
 
@@ -123,6 +152,10 @@ app.add_middleware(
 )
 
 
+# Compress larger JSON payloads (e.g. scheduler execution history)
+app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MINIMUM_SIZE)
+
+
 # Add custom middleware
 app.add_middleware(LoggingMiddleware)
 
@@ -161,15 +194,15 @@ async def health_check() -> HealthCheckResponse:
     else:
         status = "degraded"
 
-    return HealthCheckResponse(
-        status=status,
-        version=settings.APP_VERSION,
-        uptime_seconds=0.0,  # TODO: Track actual uptime
-        dependencies={
-            "scheduler": scheduler_status,
-        },
-        timestamp=datetime.now().isoformat(),
-    )
+    update = {
+        "uptime_seconds": time.time() - _STARTED_AT,
+        "timestamp": datetime.now().isoformat(),
+    }
+    if status != "healthy":
+        update["status"] = status
+        update["dependencies"] = {"scheduler": scheduler_status}
+
+    return _HEALTH_TEMPLATE.model_copy(update=update)
 
 
 # Root endpoint
@@ -205,5 +238,6 @@ if __name__ == "__main__":
         port=settings.PORT,
         reload=settings.DEBUG,
         workers=settings.WORKERS,
+        loop=settings.EVENT_LOOP,
         log_level="info",
     )
@@ -3,11 +3,25 @@ Common response models used across the API.
 """
 
 from typing import Optional, Any, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Shared model configuration: keep the generated core schemas lean and defer
+# building them until a model is first used.
+BASE_CONFIG = ConfigDict(
+    extra="ignore",
+    populate_by_name=False,
+    arbitrary_types_allowed=False,
+    validate_default=False,
+    defer_build=True,
+    use_enum_values=True,
+    frozen=False,
+)
 
 
 class SuccessResponse(BaseModel):
     """Generic success response."""
+    model_config = BASE_CONFIG
     success: bool = True
     message: str
     data: Optional[Any] = None
@@ -15,6 +29,7 @@ class SuccessResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Generic error response."""
+    model_config = BASE_CONFIG
     success: bool = False
     error: str
     detail: Optional[str] = None
@@ -23,6 +38,7 @@ class ErrorResponse(BaseModel):
 
 class HealthCheckResponse(BaseModel):
     """Health check response."""
+    model_config = BASE_CONFIG
     status: str = Field(..., description="Service status: healthy, degraded, unhealthy")
     version: str
     uptime_seconds: float
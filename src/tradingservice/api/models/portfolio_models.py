@@ -4,11 +4,14 @@ Portfolio and risk management models for API.
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from api.models.common_models import BASE_CONFIG
 
 
 class PositionModel(BaseModel):
     """Individual position in portfolio."""
+    model_config = BASE_CONFIG
     symbol: str
     quantity: float = Field(..., gt=0)
     entry_price: float = Field(..., gt=0)
@@ -21,6 +24,7 @@ class PositionModel(BaseModel):
 
 class PortfolioSummary(BaseModel):
     """Portfolio summary statistics."""
+    model_config = BASE_CONFIG
     total_value: float
     cash: float
     invested_value: float
@@ -39,19 +43,22 @@ class TradeRequest(BaseModel):
     order_type: str = Field(default="market", description="Order type: market, limit, stop")
     limit_price: Optional[float] = Field(None, gt=0, description="Limit price for limit orders")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **BASE_CONFIG,
+        json_schema_extra={
             "example": {
                 "symbol": "AAPL",
                 "action": "buy",
                 "quantity": 10,
                 "order_type": "market"
             }
-        }
+        },
+    )
 
 
 class TradeResponse(BaseModel):
     """Response model for trade execution."""
+    model_config = BASE_CONFIG
     trade_id: str
     symbol: str
     action: str
@@ -66,6 +73,7 @@ class TradeResponse(BaseModel):
 
 class RiskMetrics(BaseModel):
     """Portfolio risk metrics."""
+    model_config = BASE_CONFIG
     portfolio_var: float = Field(..., description="Value at Risk")
     portfolio_cvar: float = Field(..., description="Conditional Value at Risk")
     sharpe_ratio: Optional[float] = None
@@ -77,6 +85,7 @@ class RiskMetrics(BaseModel):
 
 class PortfolioOptimizationRequest(BaseModel):
     """Request for portfolio optimization."""
+    model_config = BASE_CONFIG
     symbols: List[str] = Field(..., min_items=2, max_items=100)
     target_return: Optional[float] = Field(None, description="Target annual return")
     risk_tolerance: str = Field(default="moderate", description="Risk tolerance: conservative, moderate, aggressive")
@@ -85,6 +94,7 @@ class PortfolioOptimizationRequest(BaseModel):
 
 class PortfolioOptimizationResponse(BaseModel):
     """Response with optimized portfolio allocation."""
+    model_config = BASE_CONFIG
     allocations: Dict[str, float] = Field(..., description="Symbol to weight mapping")
     expected_return: float
     expected_volatility: float
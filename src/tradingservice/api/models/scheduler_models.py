@@ -2,13 +2,49 @@
 Scheduler-related models for API.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+)
+
+from api.models.common_models import BASE_CONFIG
+
+
+# Execution records validate from serialized dicts and, by attribute, from the
+# ORM rows themselves; ORM column names are accepted as input aliases.
+ORM_CONFIG = ConfigDict(**BASE_CONFIG, from_attributes=True)
+
+
+def _from_epoch_ms(value: Optional[int]) -> Optional[datetime]:
+    """Convert epoch milliseconds to an aware UTC datetime on egress."""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+
+
+def _to_epoch_ms(value: Any, local: bool = False) -> Any:
+    """Convert an ORM datetime to epoch milliseconds on ingress.
+
+    Naive values are UTC unless ``local`` (run start/end times are stored
+    from ``datetime.now()``). Anything else is passed through to validation.
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.astimezone() if local else value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp() * 1000)
+    return value
 
 
 class SchedulerStatus(BaseModel):
     """Scheduler status information."""
+    model_config = BASE_CONFIG
     is_running: bool
     task_count: int
     running_tasks: int
@@ -19,6 +55,7 @@ class SchedulerStatus(BaseModel):
 
 class SchedulerControlResponse(BaseModel):
     """Response for scheduler control operations."""
+    model_config = BASE_CONFIG
     status: str = Field(..., description="Operation status: started, stopped, already_running, already_stopped")
     message: str
     current_status: SchedulerStatus
@@ -26,6 +63,7 @@ class SchedulerControlResponse(BaseModel):
 
 class SchedulerExecutionOrder(BaseModel):
     """Representation of an order attached to a scheduler execution run."""
+    model_config = ORM_CONFIG
     order_id: Optional[str]
     symbol: Optional[str]
     action: Optional[str]
@@ -33,46 +71,143 @@ class SchedulerExecutionOrder(BaseModel):
     quantity: Optional[float]
     filled_quantity: Optional[float]
     average_price: Optional[float]
-    submitted_at: Optional[datetime]
-    completed_at: Optional[datetime]
-    raw: Dict[str, Any]
+    submitted_at_ms: Optional[int] = Field(
+        None, validation_alias=AliasChoices("submitted_at_ms", "submitted_at")
+    )
+    completed_at_ms: Optional[int] = Field(
+        None, validation_alias=AliasChoices("completed_at_ms", "completed_at")
+    )
+    raw: Dict[str, Any] = Field(validation_alias=AliasChoices("raw", "raw_order_json"))
+
+    @field_validator("submitted_at_ms", "completed_at_ms", mode="before")
+    @classmethod
+    def _timestamp_ms(cls, value: Any) -> Any:
+        return _to_epoch_ms(value)
+
+    @field_validator("raw", mode="before")
+    @classmethod
+    def _raw_default(cls, value: Any) -> Any:
+        return {} if value is None else value
+
+    @computed_field
+    @property
+    def submitted_at(self) -> Optional[datetime]:
+        return _from_epoch_ms(self.submitted_at_ms)
+
+    @computed_field
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        return _from_epoch_ms(self.completed_at_ms)
 
 
 class SchedulerRiskSnapshot(BaseModel):
     """Risk snapshot captured during scheduler execution."""
+    model_config = ORM_CONFIG
     equity: Optional[float]
     cash: Optional[float]
     buying_power: Optional[float]
     exposure: Optional[float]
     maintenance_margin: Optional[float]
-    captured_at: Optional[datetime]
-    raw: Dict[str, Any]
+    captured_at_ms: Optional[int] = Field(
+        None, validation_alias=AliasChoices("captured_at_ms", "captured_at")
+    )
+    raw: Dict[str, Any] = Field(validation_alias=AliasChoices("raw", "raw_metrics_json"))
+
+    @field_validator("captured_at_ms", mode="before")
+    @classmethod
+    def _timestamp_ms(cls, value: Any) -> Any:
+        return _to_epoch_ms(value)
+
+    @field_validator("raw", mode="before")
+    @classmethod
+    def _raw_default(cls, value: Any) -> Any:
+        return {} if value is None else value
+
+    @computed_field
+    @property
+    def captured_at(self) -> Optional[datetime]:
+        return _from_epoch_ms(self.captured_at_ms)
 
 
 class SchedulerExecutionRecord(BaseModel):
     """Scheduler execution history record."""
+    model_config = ORM_CONFIG
     run_id: str
     task_id: str
     task_name: str
     scheduler_status: str
     orchestration_status: str
-    started_at: Optional[datetime]
-    completed_at: Optional[datetime]
+    started_at_ms: Optional[int] = Field(
+        None, validation_alias=AliasChoices("started_at_ms", "started_at")
+    )
+    completed_at_ms: Optional[int] = Field(
+        None, validation_alias=AliasChoices("completed_at_ms", "completed_at")
+    )
     executed_signals: Optional[int]
     rejected_signals: Optional[int]
     total_signals: Optional[int]
     order_count: Optional[int]
-    task_errors: List[str]
-    summary: Dict[str, Any]
-    symbol_details: Dict[str, Any]
-    account_snapshot: Dict[str, Any]
-    payload: Dict[str, Any]
+    task_errors: List[str] = Field(
+        validation_alias=AliasChoices("task_errors", "task_errors_json")
+    )
+    summary: Dict[str, Any] = Field(validation_alias=AliasChoices("summary", "summary_json"))
+    symbol_details: Dict[str, Any] = Field(
+        validation_alias=AliasChoices("symbol_details", "symbol_details_json")
+    )
+    account_snapshot: Dict[str, Any] = Field(
+        validation_alias=AliasChoices("account_snapshot", "account_snapshot_json")
+    )
+    payload: Dict[str, Any] = Field(validation_alias=AliasChoices("payload", "payload_json"))
     orders: List[SchedulerExecutionOrder]
     risk_snapshot: Optional[SchedulerRiskSnapshot]
-    created_at: Optional[datetime]
+    created_at_ms: Optional[int] = Field(
+        None, validation_alias=AliasChoices("created_at_ms", "created_at")
+    )
+
+    @field_validator("started_at_ms", "completed_at_ms", mode="before")
+    @classmethod
+    def _local_timestamp_ms(cls, value: Any) -> Any:
+        return _to_epoch_ms(value, local=True)
+
+    @field_validator("created_at_ms", mode="before")
+    @classmethod
+    def _timestamp_ms(cls, value: Any) -> Any:
+        return _to_epoch_ms(value)
+
+    @field_validator("task_errors", mode="before")
+    @classmethod
+    def _error_list(cls, value: Any) -> Any:
+        if isinstance(value, (list, tuple, set)):
+            return [str(item) for item in value if item]
+        return [str(value)] if value else []
+
+    @field_validator("summary", "symbol_details", "account_snapshot", "payload", mode="before")
+    @classmethod
+    def _mapping_default(cls, value: Any) -> Any:
+        return {} if value is None else value
+
+    @computed_field
+    @property
+    def started_at(self) -> Optional[datetime]:
+        return _from_epoch_ms(self.started_at_ms)
+
+    @computed_field
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        return _from_epoch_ms(self.completed_at_ms)
+
+    @computed_field
+    @property
+    def created_at(self) -> Optional[datetime]:
+        return _from_epoch_ms(self.created_at_ms)
 
 
 class SchedulerExecutionHistoryResponse(BaseModel):
     """Paginated-like wrapper for scheduler execution history."""
+    model_config = BASE_CONFIG
     count: int = Field(..., description="Number of records returned in this response")
     items: List[SchedulerExecutionRecord]
+
+
+# Shared adapter for the history decode path
+HISTORY_LIST_ADAPTER = TypeAdapter(List[SchedulerExecutionRecord])
@@ -4,9 +4,11 @@ Strategy and signal-related Pydantic models for API.
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
+from api.models.common_models import BASE_CONFIG
+
 
 class SignalType(str, Enum):
     """Trading signal types."""
@@ -26,31 +28,59 @@ class StrategyType(str, Enum):
     ALL = "all"
 
 
+# Value -> member lookup tables so inbound strings resolve with one hash lookup
+_SIGNAL_TYPE_BY_VALUE: Dict[str, SignalType] = {m.value: m for m in SignalType}
+_STRATEGY_TYPE_BY_VALUE: Dict[str, StrategyType] = {m.value: m for m in StrategyType}
+
+
+def _lookup_strategy_types(value: Any) -> Any:
+    """Resolve a list of strategy strings to StrategyType members."""
+    if isinstance(value, list):
+        return [
+            _STRATEGY_TYPE_BY_VALUE.get(item, item) if isinstance(item, str) else item
+            for item in value
+        ]
+    return value
+
+
 class StrategyAnalysisRequest(BaseModel):
     """Request model for strategy analysis."""
     symbol: str = Field(..., description="Stock symbol to analyze")
     strategies: List[StrategyType] = Field(default=[StrategyType.ALL], description="Strategies to run")
     period: str = Field(default="1mo", description="Data period: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, max")
     interval: str = Field(default="1d", description="Data interval: 1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo")
+
+    @field_validator("strategies", mode="before")
+    @classmethod
+    def _fast_strategies(cls, value: Any) -> Any:
+        return _lookup_strategy_types(value)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **BASE_CONFIG,
+        json_schema_extra={
             "example": {
                 "symbol": "AAPL",
                 "strategies": ["ma_crossover", "rsi"],
                 "period": "1mo",
                 "interval": "1d"
             }
-        }
+        },
+    )
 
 
 class BatchAnalysisRequest(BaseModel):
     """Request model for batch strategy analysis."""
+    model_config = BASE_CONFIG
     symbols: List[str] = Field(..., description="List of symbols to analyze", min_items=1, max_items=50)
     strategies: List[StrategyType] = Field(default=[StrategyType.ALL])
     period: str = Field(default="1mo")
     interval: str = Field(default="1d")
 
+    @field_validator("strategies", mode="before")
+    @classmethod
+    def _fast_strategies(cls, value: Any) -> Any:
+        return _lookup_strategy_types(value)
+
 
 class SignalResponse(BaseModel):
     """Response model for trading signal."""
@@ -62,9 +92,17 @@ class SignalResponse(BaseModel):
     timestamp: str
     indicators: Dict[str, Any] = Field(default_factory=dict, description="Relevant indicator values")
     reason: Optional[str] = Field(None, description="Signal generation reason")
+
+    @field_validator("signal_type", mode="before")
+    @classmethod
+    def _fast_signal_type(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return _SIGNAL_TYPE_BY_VALUE.get(value, value)
+        return value
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **BASE_CONFIG,
+        json_schema_extra={
             "example": {
                 "symbol": "AAPL",
                 "signal_type": "buy",
@@ -78,11 +116,13 @@ class SignalResponse(BaseModel):
                 },
                 "reason": "Short MA crossed above long MA"
             }
-        }
+        },
+    )
 
 
 class StrategyAnalysisResponse(BaseModel):
     """Response model for strategy analysis results."""
+    model_config = BASE_CONFIG
     symbol: str
     strategy: str
     signal: Optional[SignalResponse] = None
@@ -95,6 +135,7 @@ class StrategyAnalysisResponse(BaseModel):
 
 class BatchAnalysisResponse(BaseModel):
     """Response model for batch analysis."""
+    model_config = BASE_CONFIG
     results: List[StrategyAnalysisResponse]
     total_analyzed: int
     successful: int
@@ -4,9 +4,11 @@ Task-related Pydantic models for API request/response validation.
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
+from api.models.common_models import BASE_CONFIG
+
 
 class ScheduleFrequencyEnum(str, Enum):
     """Task execution frequency options."""
@@ -22,6 +24,19 @@ class ScheduleFrequencyEnum(str, Enum):
     MONTHLY = "monthly"
 
 
+# Value -> member lookup table so inbound strings resolve with one hash lookup
+_FREQUENCY_BY_VALUE: Dict[str, ScheduleFrequencyEnum] = {
+    m.value: m for m in ScheduleFrequencyEnum
+}
+
+
+def _lookup_frequency(value: Any) -> Any:
+    """Resolve a frequency string to its ScheduleFrequencyEnum member."""
+    if isinstance(value, str):
+        return _FREQUENCY_BY_VALUE.get(value, value)
+    return value
+
+
 class TaskCreateRequest(BaseModel):
     """Request model for creating a new task."""
     name: str = Field(..., description="Task name", min_length=1, max_length=100)
@@ -30,9 +45,15 @@ class TaskCreateRequest(BaseModel):
     strategies: List[str] = Field(default=["all"], description="Strategy types to execute")
     enabled: bool = Field(default=True, description="Whether the task is enabled")
     description: Optional[str] = Field(None, description="Task description", max_length=500)
+
+    @field_validator("frequency", mode="before")
+    @classmethod
+    def _fast_frequency(cls, value: Any) -> Any:
+        return _lookup_frequency(value)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **BASE_CONFIG,
+        json_schema_extra={
             "example": {
                 "name": "Daily AAPL Analysis",
                 "frequency": "daily",
@@ -41,11 +62,13 @@ class TaskCreateRequest(BaseModel):
                 "enabled": True,
                 "description": "Analyze tech stocks daily"
             }
-        }
+        },
+    )
 
 
 class TaskUpdateRequest(BaseModel):
     """Request model for updating a task."""
+    model_config = BASE_CONFIG
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     frequency: Optional[ScheduleFrequencyEnum] = None
     symbols: Optional[List[str]] = Field(None, min_items=1, max_items=50)
@@ -53,6 +76,11 @@ class TaskUpdateRequest(BaseModel):
     enabled: Optional[bool] = None
     description: Optional[str] = Field(None, max_length=500)
 
+    @field_validator("frequency", mode="before")
+    @classmethod
+    def _fast_frequency(cls, value: Any) -> Any:
+        return _lookup_frequency(value)
+
 
 class TaskResponse(BaseModel):
     """Response model for task information."""
@@ -68,8 +96,9 @@ class TaskResponse(BaseModel):
     run_count: int = Field(default=0, description="Number of times task has been executed")
     description: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **BASE_CONFIG,
+        json_schema_extra={
             "example": {
                 "task_id": "task_1729567890",
                 "name": "Daily AAPL Analysis",
@@ -83,16 +112,19 @@ class TaskResponse(BaseModel):
                 "run_count": 5,
                 "description": "Analyze tech stocks daily"
             }
-        }
+        },
+    )
 
 
 class TaskExecutionRequest(BaseModel):
     """Request model for manual task execution."""
+    model_config = BASE_CONFIG
     async_mode: bool = Field(default=False, description="Execute task asynchronously")
 
 
 class TaskExecutionResponse(BaseModel):
     """Response model for task execution."""
+    model_config = BASE_CONFIG
     task_id: str
     status: str = Field(..., description="Execution status: success, failed, running")
     message: str
@@ -103,6 +135,7 @@ class TaskExecutionResponse(BaseModel):
 
 class TaskListResponse(BaseModel):
     """Response model for task list."""
+    model_config = BASE_CONFIG
     tasks: List[TaskResponse]
     total: int
     enabled_count: int
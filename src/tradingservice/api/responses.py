@@ -0,0 +1,35 @@
+"""
+API Response Classes
+
+Custom response classes for fast JSON rendering.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback encoder for objects orjson cannot serialize natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONModelResponse(JSONResponse):
+    """JSON response rendered by orjson that accepts Pydantic models directly.
+
+    Returning a model through this class skips FastAPI's ``jsonable_encoder``
+    pass: the model tree is dumped once and orjson encodes the result.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_SERIALIZE_NUMPY,
+        )
@@ -2,14 +2,23 @@
 API Routes Package
 
 FastAPI route handlers organized by domain.
+
+Route modules are loaded lazily (PEP 562) so that importing the package does
+not pull in every Pydantic model hierarchy up front.
 """
 
-from api.routes import tasks
-from api.routes import scheduler
-from api.routes import strategies
+import importlib
 
 __all__ = [
     "tasks",
     "scheduler",
     "strategies",
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
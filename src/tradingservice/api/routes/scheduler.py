@@ -4,9 +4,11 @@ Scheduler Control Routes
 API endpoints for managing the task scheduler.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Depends, status
+from starlette.concurrency import run_in_threadpool
 
 from api.models.scheduler_models import (
     SchedulerStatus,
@@ -14,17 +16,23 @@ from api.models.scheduler_models import (
     SchedulerExecutionHistoryResponse,
 )
 from api.models.common_models import ErrorResponse
+from api.responses import ORJSONModelResponse
 from api.services.scheduler_service import SchedulerService
+from api.dependencies import get_scheduler
 
 
 router = APIRouter(prefix="/api/scheduler", tags=["Scheduler"])
 
 
+@lru_cache(maxsize=1)
+def _scheduler_service() -> SchedulerService:
+    """Build the process-wide scheduler service once."""
+    return SchedulerService(get_scheduler())
+
+
 def get_scheduler_service() -> SchedulerService:
     """Dependency injection for scheduler service."""
-    from api.dependencies import get_scheduler
-    scheduler = get_scheduler()
-    return SchedulerService(scheduler)
+    return _scheduler_service()
 
 
 @router.get(
@@ -37,14 +45,19 @@ async def get_status(
     service: SchedulerService = Depends(get_scheduler_service)
 ) -> SchedulerStatus:
     """Get current scheduler status."""
-    return service.get_status()
+    return await run_in_threadpool(service.get_status)
 
 
 @router.get(
     "/executions",
     response_model=SchedulerExecutionHistoryResponse,
+    response_class=ORJSONModelResponse,
     summary="List recent scheduler executions",
-    description="Fetch recent scheduler execution runs persisted by the automation pipeline.",
+    description=(
+        "Fetch recent scheduler execution runs persisted by the automation pipeline. "
+        "History is eventually consistent: runs are written in the background, "
+        "so a run that has just finished may appear a moment later."
+    ),
 )
 async def list_executions(
     limit: int = 50,
@@ -52,14 +65,17 @@ async def list_executions(
     scheduler_status: Optional[str] = None,
     orchestration_status: Optional[str] = None,
     service: SchedulerService = Depends(get_scheduler_service),
-) -> SchedulerExecutionHistoryResponse:
+) -> ORJSONModelResponse:
     """Return recent scheduler execution history."""
-    return service.get_execution_history(
+    history = await run_in_threadpool(
+        service.get_execution_history,
         limit=limit,
         task_id=task_id,
         scheduler_status=scheduler_status,
         orchestration_status=orchestration_status,
     )
+    # Already validated by the service; hand the model straight to orjson
+    return ORJSONModelResponse(history)
 
 
 @router.post(
@@ -74,7 +90,7 @@ async def start_scheduler(
 ) -> SchedulerControlResponse:
     """Start the scheduler."""
     try:
-        return service.start_scheduler()
+        return await run_in_threadpool(service.start_scheduler)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -94,7 +110,7 @@ async def stop_scheduler(
 ) -> SchedulerControlResponse:
     """Stop the scheduler."""
     try:
-        return service.stop_scheduler()
+        return await run_in_threadpool(service.stop_scheduler)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -114,7 +130,7 @@ async def restart_scheduler(
 ) -> SchedulerControlResponse:
     """Restart the scheduler."""
     try:
-        return service.restart_scheduler()
+        return await service.restart_scheduler()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
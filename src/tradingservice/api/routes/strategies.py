@@ -4,7 +4,10 @@ Strategy Analysis Routes
 API endpoints for running strategy analysis and generating trading signals.
 """
 
+from functools import lru_cache
+
 from fastapi import APIRouter, HTTPException, Depends, status
+from starlette.concurrency import run_in_threadpool
 
 from api.models.strategy_models import (
     StrategyAnalysisRequest,
@@ -19,9 +22,15 @@ from api.services.strategy_service import StrategyService
 router = APIRouter(prefix="/api/strategies", tags=["Strategies"])
 
 
+@lru_cache(maxsize=1)
+def _strategy_service() -> StrategyService:
+    """Build the process-wide strategy service once so its cache is shared."""
+    return StrategyService()
+
+
 def get_strategy_service() -> StrategyService:
     """Dependency injection for strategy service."""
-    return StrategyService()
+    return _strategy_service()
 
 
 @router.post(
@@ -37,7 +46,7 @@ async def analyze_symbol(
 ) -> StrategyAnalysisResponse:
     """Analyze a single symbol with specified strategies."""
     try:
-        return service.analyze_symbol(request)
+        return await run_in_threadpool(service.analyze_symbol, request)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -58,7 +67,7 @@ async def batch_analyze(
 ) -> BatchAnalysisResponse:
     """Analyze multiple symbols in parallel."""
     try:
-        return service.batch_analyze(request)
+        return await service.batch_analyze(request)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
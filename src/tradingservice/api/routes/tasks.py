@@ -4,8 +4,10 @@ Task Management Routes
 API endpoints for creating, reading, updating, and deleting automated trading tasks.
 """
 
-from typing import List
-from fastapi import APIRouter, HTTPException, Depends, status
+from functools import lru_cache, wraps
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
+from starlette.concurrency import run_in_threadpool
 
 from api.models.task_models import (
     TaskCreateRequest,
@@ -17,16 +19,44 @@ from api.models.task_models import (
 )
 from api.models.common_models import SuccessResponse, ErrorResponse
 from api.services.task_service import TaskService
+from api.dependencies import get_scheduler
 
 
 router = APIRouter(prefix="/api/tasks", tags=["Tasks"])
 
 
+@lru_cache(maxsize=1)
+def _task_service() -> TaskService:
+    """Build the process-wide task service once."""
+    return TaskService(get_scheduler())
+
+
 def get_task_service() -> TaskService:
     """Dependency injection for task service."""
-    from api.dependencies import get_scheduler
-    scheduler = get_scheduler()
-    return TaskService(scheduler)
+    return _task_service()
+
+
+def _map_errors(action: str):
+    """Translate service errors into HTTP 400/500 responses for a route."""
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except HTTPException:
+                raise
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Failed to {action}: {str(e)}"
+                )
+        return wrapper
+    return decorator
 
 
 @router.get(
@@ -35,9 +65,21 @@ def get_task_service() -> TaskService:
     summary="Get all tasks",
     description="Retrieve a list of all automated trading tasks with summary statistics."
 )
-async def get_tasks(service: TaskService = Depends(get_task_service)) -> TaskListResponse:
-    """Get all tasks."""
-    return service.get_all_tasks()
+async def get_tasks(
+    request: Request,
+    response: Response,
+    service: TaskService = Depends(get_task_service)
+) -> TaskListResponse:
+    """Get all tasks; answers 304 when the client's ETag is still current."""
+    etag, tasks = await run_in_threadpool(
+        service.get_all_tasks_with_etag, request.headers.get("if-none-match")
+    )
+    if tasks is None:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+    return tasks
 
 
 @router.get(
@@ -52,7 +94,7 @@ async def get_task(
     service: TaskService = Depends(get_task_service)
 ) -> TaskResponse:
     """Get a specific task by ID."""
-    task = service.get_task_by_id(task_id)
+    task = await run_in_threadpool(service.get_task_by_id, task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -69,23 +111,13 @@ async def get_task(
     description="Create a new automated trading task with specified parameters.",
     responses={400: {"model": ErrorResponse, "description": "Invalid request data"}}
 )
+@_map_errors("create task")
 async def create_task(
     request: TaskCreateRequest,
     service: TaskService = Depends(get_task_service)
 ) -> TaskResponse:
     """Create a new scheduled task."""
-    try:
-        return service.create_task(request)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create task: {str(e)}"
-        )
+    return await run_in_threadpool(service.create_task, request)
 
 
 @router.put(
@@ -95,30 +127,20 @@ async def create_task(
     description="Update an existing task's configuration.",
     responses={404: {"model": ErrorResponse, "description": "Task not found"}}
 )
+@_map_errors("update task")
 async def update_task(
     task_id: str,
     request: TaskUpdateRequest,
     service: TaskService = Depends(get_task_service)
 ) -> TaskResponse:
     """Update an existing task."""
-    try:
-        task = service.update_task(task_id, request)
-        if not task:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Task {task_id} not found"
-            )
-        return task
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
+    task = await run_in_threadpool(service.update_task, task_id, request)
+    if not task:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update task: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task {task_id} not found"
         )
+    return task
 
 
 @router.delete(
@@ -128,27 +150,22 @@ async def update_task(
     description="Permanently delete a task.",
     responses={404: {"model": ErrorResponse, "description": "Task not found"}}
 )
+@_map_errors("delete task")
 async def delete_task(
     task_id: str,
     service: TaskService = Depends(get_task_service)
 ) -> SuccessResponse:
     """Delete a task."""
-    try:
-        result = service.delete_task(task_id)
-        if not result:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Task {task_id} not found"
-            )
-        return SuccessResponse(
-            success=True,
-            message=f"Task {task_id} deleted successfully"
-        )
-    except Exception as e:
+    result = await run_in_threadpool(service.delete_task, task_id)
+    if not result:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete task: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task {task_id} not found"
         )
+    return SuccessResponse(
+        success=True,
+        message=f"Task {task_id} deleted successfully"
+    )
 
 
 @router.post(
@@ -160,11 +177,14 @@ async def delete_task(
 )
 async def execute_task(
     task_id: str,
-    request: TaskExecutionRequest = TaskExecutionRequest(),
+    request: Optional[TaskExecutionRequest] = None,
     service: TaskService = Depends(get_task_service)
 ) -> TaskExecutionResponse:
     """Execute a task manually."""
-    result = service.execute_task(task_id, request.async_mode)
+    request = request or TaskExecutionRequest()
+    result = await run_in_threadpool(
+        service.execute_task, task_id, request.async_mode
+    )
     if result.status == "failed" and "not found" in result.message.lower():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -180,27 +200,22 @@ async def execute_task(
     description="Temporarily pause task execution.",
     responses={404: {"model": ErrorResponse, "description": "Task not found"}}
 )
+@_map_errors("pause task")
 async def pause_task(
     task_id: str,
     service: TaskService = Depends(get_task_service)
 ) -> SuccessResponse:
     """Pause a task."""
-    try:
-        result = service.pause_task(task_id)
-        if not result:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Task {task_id} not found"
-            )
-        return SuccessResponse(
-            success=True,
-            message=f"Task {task_id} paused successfully"
-        )
-    except Exception as e:
+    result = await run_in_threadpool(service.pause_task, task_id)
+    if not result:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to pause task: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task {task_id} not found"
         )
+    return SuccessResponse(
+        success=True,
+        message=f"Task {task_id} paused successfully"
+    )
 
 
 @router.post(
@@ -210,24 +225,19 @@ async def pause_task(
     description="Resume a paused task.",
     responses={404: {"model": ErrorResponse, "description": "Task not found"}}
 )
+@_map_errors("resume task")
 async def resume_task(
     task_id: str,
     service: TaskService = Depends(get_task_service)
 ) -> SuccessResponse:
     """Resume a paused task."""
-    try:
-        result = service.resume_task(task_id)
-        if not result:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Task {task_id} not found"
-            )
-        return SuccessResponse(
-            success=True,
-            message=f"Task {task_id} resumed successfully"
-        )
-    except Exception as e:
+    result = await run_in_threadpool(service.resume_task, task_id)
+    if not result:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to resume task: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task {task_id} not found"
         )
+    return SuccessResponse(
+        success=True,
+        message=f"Task {task_id} resumed successfully"
+    )
@@ -5,16 +5,19 @@ Business logic for scheduler management operations.
 """
 
 import time
+import asyncio
 import logging
+import threading
 from typing import Optional
-from datetime import datetime
 
-from automation.scheduler import TaskScheduler
+from src.tradingservice.services.automation import (
+    AutoTradingScheduler as TaskScheduler,
+)
 from api.models.scheduler_models import (
     SchedulerStatus,
     SchedulerControlResponse,
     SchedulerExecutionHistoryResponse,
-    SchedulerExecutionRecord,
+    HISTORY_LIST_ADAPTER,
 )
 
 
@@ -27,85 +30,123 @@ class SchedulerService:
     def __init__(self, scheduler: TaskScheduler):
         """Initialize scheduler service."""
         self.scheduler = scheduler
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+
+        # Collapse rapid status polling into one underlying call
+        self.status_cache_ttl = 0.25
+        self._status_cache: Optional[SchedulerStatus] = None
+        self._status_cached_at = 0.0
+
+        # Short-lived history cache keyed by the query filters
+        self.history_cache_ttl = 1.0
+        self.history_cache_max_entries = 128
+        self._history_cache = {}
+        self._history_lock = threading.Lock()
 
     def get_status(self) -> SchedulerStatus:
         """Get current scheduler status."""
-        tasks = self.scheduler.get_all_tasks()
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cached_at < self.status_cache_ttl:
+            return self._status_cache
+
+        tasks = self.scheduler.get_all_task_statuses()
         running_tasks = sum(1 for t in tasks if t.get("enabled", False))
 
-        return SchedulerStatus(
+        status = SchedulerStatus(
             is_running=self.scheduler.is_running,
             task_count=len(tasks),
             running_tasks=running_tasks,
             uptime_seconds=(
-                time.time() - self.start_time if self.scheduler.is_running else 0
+                now - self.start_time if self.scheduler.is_running else 0
             ),
             last_execution=None,  # TODO: Track last execution
             next_execution=None,  # TODO: Calculate next execution
         )
+        self._status_cache = status
+        self._status_cached_at = now
+        return status
+
+    def _invalidate_status(self) -> None:
+        """Drop the cached status after a state change."""
+        self._status_cache = None
+
+    def _start(self) -> bool:
+        """Start the underlying scheduler; return False if it was already running."""
+        if self.scheduler.is_running:
+            return False
+        self.scheduler.start()
+        self.start_time = time.monotonic()
+        self._invalidate_status()
+        return True
+
+    def _stop(self) -> bool:
+        """Stop the underlying scheduler; return False if it was already stopped."""
+        if not self.scheduler.is_running:
+            return False
+        self.scheduler.stop()
+        self._invalidate_status()
+        return True
 
     def start_scheduler(self) -> SchedulerControlResponse:
         """Start the scheduler."""
-        if self.scheduler.is_running:
+        try:
+            started = self._start()
+        except Exception as e:
+            logger.error(f"Failed to start scheduler: {e}")
+            raise
+
+        if not started:
             return SchedulerControlResponse(
                 status="already_running",
                 message="Scheduler is already running",
                 current_status=self.get_status(),
             )
 
-        try:
-            self.scheduler.start()
-            self.start_time = time.time()
-            logger.info("Scheduler started successfully")
+        logger.info("Scheduler started successfully")
+        return SchedulerControlResponse(
+            status="started",
+            message="Scheduler started successfully",
+            current_status=self.get_status(),
+        )
 
-            return SchedulerControlResponse(
-                status="started",
-                message="Scheduler started successfully",
-                current_status=self.get_status(),
-            )
+    def stop_scheduler(self) -> SchedulerControlResponse:
+        """Stop the scheduler."""
+        try:
+            stopped = self._stop()
         except Exception as e:
-            logger.error(f"Failed to start scheduler: {e}")
+            logger.error(f"Failed to stop scheduler: {e}")
             raise
 
-    def stop_scheduler(self) -> SchedulerControlResponse:
-        """Stop the scheduler."""
-        if not self.scheduler.is_running:
+        if not stopped:
             return SchedulerControlResponse(
                 status="already_stopped",
                 message="Scheduler is already stopped",
                 current_status=self.get_status(),
             )
 
-        try:
-            self.scheduler.stop()
-            logger.info("Scheduler stopped successfully")
-
-            return SchedulerControlResponse(
-                status="stopped",
-                message="Scheduler stopped successfully",
-                current_status=self.get_status(),
-            )
-        except Exception as e:
-            logger.error(f"Failed to stop scheduler: {e}")
-            raise
+        logger.info("Scheduler stopped successfully")
+        return SchedulerControlResponse(
+            status="stopped",
+            message="Scheduler stopped successfully",
+            current_status=self.get_status(),
+        )
 
-    def restart_scheduler(self) -> SchedulerControlResponse:
-        """Restart the scheduler."""
+    async def restart_scheduler(self) -> SchedulerControlResponse:
+        """Restart the scheduler without blocking the event loop."""
         try:
-            if self.scheduler.is_running:
-                self.scheduler.stop()
+            await asyncio.to_thread(self._stop)
 
-            time.sleep(0.5)  # Brief pause
+            await asyncio.sleep(0.5)  # Brief pause
 
-            self.scheduler.start()
-            self.start_time = time.time()
+            await asyncio.to_thread(self._start)
             logger.info("Scheduler restarted successfully")
 
-            return SchedulerControlResponse(
+            # Both transitions are folded into a single response; the status
+            # comes from a validated SchedulerStatus so construction is safe.
+            return SchedulerControlResponse.model_construct(
                 status="restarted",
                 message="Scheduler restarted successfully",
-                current_status=self.get_status(),
+                current_status=await asyncio.to_thread(self.get_status),
             )
         except Exception as e:
             logger.error(f"Failed to restart scheduler: {e}")
@@ -119,13 +160,37 @@ class SchedulerService:
         scheduler_status: Optional[str] = None,
         orchestration_status: Optional[str] = None,
     ) -> SchedulerExecutionHistoryResponse:
-        """Retrieve execution history from the automation scheduler."""
+        """
+        Retrieve execution history from the automation scheduler.
+
+        Eventually consistent: the scheduler persists runs in the background
+        and responses are cached for ``history_cache_ttl`` seconds.
+        """
         limit = max(1, min(int(limit or 50), 200))
+        key = (task_id, scheduler_status, orchestration_status, limit)
+        now = time.monotonic()
+        with self._history_lock:
+            cached = self._history_cache.get(key)
+        if cached is not None and now - cached[0] < self.history_cache_ttl:
+            return cached[1]
+
         records = self.scheduler.get_execution_history(
             limit=limit,
             task_id=task_id,
             scheduler_status=scheduler_status,
             orchestration_status=orchestration_status,
         )
-        items = [SchedulerExecutionRecord(**record) for record in records]
-        return SchedulerExecutionHistoryResponse(count=len(items), items=items)
+        items = HISTORY_LIST_ADAPTER.validate_python(records)
+        response = SchedulerExecutionHistoryResponse(count=len(items), items=items)
+
+        with self._history_lock:
+            if len(self._history_cache) >= self.history_cache_max_entries:
+                self._history_cache = {
+                    k: v
+                    for k, v in self._history_cache.items()
+                    if now - v[0] < self.history_cache_ttl
+                }
+                if len(self._history_cache) >= self.history_cache_max_entries:
+                    self._history_cache.clear()
+            self._history_cache[key] = (now, response)
+        return response
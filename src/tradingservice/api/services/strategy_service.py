@@ -4,11 +4,14 @@ Strategy Service Layer
 Business logic for strategy analysis and signal generation.
 """
 
+import os
 import time
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Tuple
 
 from api.models.strategy_models import (
     StrategyAnalysisRequest,
@@ -22,34 +25,85 @@ from api.models.strategy_models import (
 
 logger = logging.getLogger(__name__)
 
+# Simple period conversion (could be improved)
+_PERIOD_DAYS = {"1mo": 30, "3mo": 90, "6mo": 180, "1y": 365, "2y": 730}
+
+# One pool for the whole process; its threads keep their per-thread
+# DataManager and strategy instances across requests. Created on first use
+# so a new application lifespan after shutdown_executor() gets a fresh pool
+_shared_executor: Optional[ThreadPoolExecutor] = None
+_shared_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the shared analysis pool, creating it if needed."""
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4),
+                thread_name_prefix="strategy",
+            )
+        return _shared_executor
+
+
+def shutdown_executor() -> None:
+    """Shut down the shared analysis pool (called on application shutdown)."""
+    global _shared_executor
+    with _shared_executor_lock:
+        executor, _shared_executor = _shared_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
 
 class StrategyService:
     """Service for strategy analysis operations."""
     
     def __init__(self):
         """Initialize strategy service."""
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        # Short-lived cache of successful analyses
+        self.cache: Dict[Tuple, StrategyAnalysisResponse] = {}
+        self.cache_timestamps: Dict[Tuple, float] = {}
+        self.cache_expiry = timedelta(seconds=60)
+        self.cache_max_entries = 2048
+        self._cache_lock = threading.Lock()
+
+        # Historical OHLCV frames, shared by analyses with different strategies
+        self.history_cache: Dict[Tuple, Any] = {}
+        self.history_cache_timestamps: Dict[Tuple, float] = {}
+        self.history_cache_expiry = timedelta(minutes=15)
+        self.history_cache_max_entries = 512
+        self._history_lock = threading.Lock()
+
+        # Per worker thread: one DataManager (it holds a DB session) and one
+        # set of strategy instances (generate_signals writes to self.signals)
+        self._local = threading.local()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Shared analysis pool; looked up per use so it survives a pool restart."""
+        return get_executor()
     
     def analyze_symbol(self, request: StrategyAnalysisRequest) -> StrategyAnalysisResponse:
         """Analyze a single symbol with specified strategies."""
         start_time = time.time()
+
+        cache_key = self._cache_key(request)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            # Import here to avoid circular dependencies
-            from src.tradingagent.modules.strategies import MovingAverageStrategy as MovingAverageCrossover
-            from src.tradingagent.modules.strategies import RSIStrategy
-            from src.tradingagent.modules import DataManager
-            
             # Fetch data through Agent's DataProvider
-            data_provider = DataManager()
+            data_provider = self._get_data_provider()
             # Convert period to date range
-            end_date = datetime.now().strftime("%Y-%m-%d")
-            # Simple period conversion (could be improved)
-            days_map = {"1mo": 30, "3mo": 90, "6mo": 180, "1y": 365, "2y": 730}
-            days = days_map.get(request.period, 365)
-            start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+            now = datetime.now()
+            end_date = now.strftime("%Y-%m-%d")
+            days = _PERIOD_DAYS.get(request.period, 365)
+            start_date = (now - timedelta(days=days)).strftime("%Y-%m-%d")
             
-            df = data_provider.get_historical_data(
+            df = self._get_historical_data(
+                data_provider,
                 symbol=request.symbol,
                 start_date=start_date,
                 end_date=end_date,
@@ -68,25 +122,20 @@ class StrategyService:
             # Run strategies based on request
             signals = []
             performance_metrics = {}
+            run_all = "all" in request.strategies
             
-            if "all" in request.strategies or "ma_crossover" in request.strategies:
-                ma_strategy = MovingAverageCrossover()
-                signal = ma_strategy.generate_signals(df)
-                if signal:
-                    signals.append(signal)
-                    performance_metrics['ma_crossover'] = self._calculate_metrics(df, signal)
-            
-            if "all" in request.strategies or "rsi" in request.strategies:
-                rsi_strategy = RSIStrategy()
-                signal = rsi_strategy.generate_signals(df)
+            for name, strategy in self._get_strategies().items():
+                if not run_all and name not in request.strategies:
+                    continue
+                signal = strategy.generate_signals(df)
                 if signal:
                     signals.append(signal)
-                    performance_metrics['rsi'] = self._calculate_metrics(df, signal)
+                    performance_metrics[name] = self._calculate_metrics(df, signal)
             
             # Combine signals
             combined_signal = self._combine_signals(signals) if signals else None
             
-            return StrategyAnalysisResponse(
+            response = StrategyAnalysisResponse(
                 symbol=request.symbol,
                 strategy=",".join(request.strategies),
                 signal=combined_signal,
@@ -94,6 +143,8 @@ class StrategyService:
                 analysis_time=datetime.now().isoformat(),
                 success=True
             )
+            self._store_cached(cache_key, response)
+            return response
             
         except Exception as e:
             logger.error(f"Strategy analysis failed for {request.symbol}: {e}")
@@ -105,54 +156,71 @@ class StrategyService:
                 analysis_time=datetime.now().isoformat()
             )
     
-    def batch_analyze(self, request: BatchAnalysisRequest) -> BatchAnalysisResponse:
-        """Analyze multiple symbols in parallel."""
+    async def batch_analyze(self, request: BatchAnalysisRequest) -> BatchAnalysisResponse:
+        """Analyze multiple symbols in parallel without blocking the event loop."""
         start_time = time.time()
-        results = []
         
-        # Create individual analysis requests
-        analysis_requests = [
-            StrategyAnalysisRequest(
+        # Analyze each distinct symbol once; duplicates reuse the same result
+        unique_symbols = list(dict.fromkeys(request.symbols))
+        result_by_symbol: Dict[str, StrategyAnalysisResponse] = {}
+
+        # Create individual analysis requests, serving cached analyses directly
+        pending = []
+        for symbol in unique_symbols:
+            req = StrategyAnalysisRequest(
                 symbol=symbol,
                 strategies=request.strategies,
                 period=request.period,
                 interval=request.interval
             )
-            for symbol in request.symbols
-        ]
-        
-        # Execute in parallel
-        futures = {
-            self.executor.submit(self.analyze_symbol, req): req.symbol 
-            for req in analysis_requests
-        }
-        
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                symbol = futures[future]
-                logger.error(f"Batch analysis failed for {symbol}: {e}")
-                results.append(StrategyAnalysisResponse(
-                    symbol=symbol,
+            cached = self._get_cached(self._cache_key(req))
+            if cached is not None:
+                result_by_symbol[symbol] = cached
+            else:
+                pending.append(req)
+
+        # Execute in parallel on the shared analysis pool
+        loop = asyncio.get_running_loop()
+        outcomes = await asyncio.gather(
+            *(loop.run_in_executor(self.executor, self.analyze_symbol, req) for req in pending),
+            return_exceptions=True,
+        )
+
+        for req, outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Batch analysis failed for {req.symbol}: {outcome}")
+                outcome = StrategyAnalysisResponse(
+                    symbol=req.symbol,
                     strategy="all",
                     success=False,
-                    error=str(e),
+                    error=str(outcome),
                     analysis_time=datetime.now().isoformat()
-                ))
+                )
+            result_by_symbol[req.symbol] = outcome
+
+        results = [result_by_symbol[symbol] for symbol in request.symbols]
         
-        # Calculate summary
-        successful = sum(1 for r in results if r.success)
+        # Calculate summary in a single pass
+        successful = buy_signals = sell_signals = signal_count = 0
+        confidence_sum = 0.0
+        buy, sell = SignalType.BUY, SignalType.SELL
+        for r in results:
+            if r.success:
+                successful += 1
+            signal = r.signal
+            if signal:
+                signal_count += 1
+                confidence_sum += signal.confidence
+                if signal.signal_type == buy:
+                    buy_signals += 1
+                elif signal.signal_type == sell:
+                    sell_signals += 1
         failed = len(results) - successful
         
-        buy_signals = sum(1 for r in results if r.signal and r.signal.signal_type == SignalType.BUY)
-        sell_signals = sum(1 for r in results if r.signal and r.signal.signal_type == SignalType.SELL)
-        
         summary = {
             "buy_signals": buy_signals,
             "sell_signals": sell_signals,
-            "avg_confidence": sum(r.signal.confidence for r in results if r.signal) / len([r for r in results if r.signal]) if any(r.signal for r in results) else 0
+            "avg_confidence": confidence_sum / signal_count if signal_count else 0
         }
         
         execution_time = time.time() - start_time
@@ -166,6 +234,113 @@ class StrategyService:
             summary=summary
         )
     
+    @staticmethod
+    def _cache_key(request: StrategyAnalysisRequest) -> Tuple:
+        """Build the cache key for an analysis request."""
+        return (
+            request.symbol,
+            tuple(sorted(request.strategies)),
+            request.period,
+            request.interval,
+        )
+
+    def _get_cached(self, key: Tuple) -> Optional[StrategyAnalysisResponse]:
+        """Return a cached analysis if it has not expired."""
+        with self._cache_lock:
+            cached_at = self.cache_timestamps.get(key)
+            if cached_at is None:
+                return None
+            if time.monotonic() - cached_at > self.cache_expiry.total_seconds():
+                self.cache.pop(key, None)
+                self.cache_timestamps.pop(key, None)
+                return None
+            return self.cache.get(key)
+
+    def _store_cached(self, key: Tuple, response: StrategyAnalysisResponse) -> None:
+        """Cache a successful analysis, evicting the oldest entry when full."""
+        with self._cache_lock:
+            if key not in self.cache and len(self.cache) >= self.cache_max_entries:
+                oldest = next(iter(self.cache))
+                self.cache.pop(oldest, None)
+                self.cache_timestamps.pop(oldest, None)
+            self.cache[key] = response
+            self.cache_timestamps[key] = time.monotonic()
+
+    def clear_cache(self) -> None:
+        """Clear cached analyses and historical data."""
+        with self._cache_lock:
+            self.cache.clear()
+            self.cache_timestamps.clear()
+        with self._history_lock:
+            self.history_cache.clear()
+            self.history_cache_timestamps.clear()
+
+    def _get_data_provider(self):
+        """Return this thread's DataManager, creating it on first use."""
+        data_provider = getattr(self._local, "data_provider", None)
+        if data_provider is None:
+            # Import here to avoid circular dependencies
+            from src.tradingagent.modules import DataManager
+
+            data_provider = DataManager()
+            self._local.data_provider = data_provider
+        return data_provider
+
+    def _get_strategies(self) -> Dict[str, Any]:
+        """Return this thread's strategy instances, building them on first use."""
+        strategies = getattr(self._local, "strategies", None)
+        if strategies is None:
+            # Import here to avoid circular dependencies
+            from src.tradingagent.modules.strategies import MovingAverageStrategy as MovingAverageCrossover
+            from src.tradingagent.modules.strategies import RSIStrategy
+
+            strategies = {
+                "ma_crossover": MovingAverageCrossover(),
+                "rsi": RSIStrategy(),
+            }
+            self._local.strategies = strategies
+        return strategies
+
+    def _get_historical_data(
+        self,
+        data_provider,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        interval: str,
+    ):
+        """Fetch historical data, reusing frames fetched for the same range.
+
+        Dates are day-granular strings, so calls within the same day share an
+        entry. Callers get a copy so strategies cannot mutate the cached frame.
+        """
+        key = (symbol, start_date, end_date, interval)
+        with self._history_lock:
+            cached_at = self.history_cache_timestamps.get(key)
+            if cached_at is not None:
+                if time.monotonic() - cached_at <= self.history_cache_expiry.total_seconds():
+                    return self.history_cache[key].copy()
+                self.history_cache.pop(key, None)
+                self.history_cache_timestamps.pop(key, None)
+
+        df = data_provider.get_historical_data(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            interval=interval
+        )
+        if df is None or df.empty:
+            return df
+
+        with self._history_lock:
+            if key not in self.history_cache and len(self.history_cache) >= self.history_cache_max_entries:
+                oldest = next(iter(self.history_cache))
+                self.history_cache.pop(oldest, None)
+                self.history_cache_timestamps.pop(oldest, None)
+            self.history_cache[key] = df
+            self.history_cache_timestamps[key] = time.monotonic()
+        return df.copy()
+
     def _calculate_metrics(self, df, signal) -> Dict[str, Any]:
         """Calculate performance metrics for a strategy."""
         # Simplified metrics calculation
@@ -179,16 +354,22 @@ class StrategyService:
         if not signals:
             return None
         
-        # Simple voting mechanism
-        buy_votes = sum(1 for s in signals if s.get('action') == 'buy')
-        sell_votes = sum(1 for s in signals if s.get('action') == 'sell')
+        # Simple voting mechanism, counted in a single pass
+        buy_votes = sell_votes = 0
+        for s in signals:
+            action = s.get('action')
+            if action == 'buy':
+                buy_votes += 1
+            elif action == 'sell':
+                sell_votes += 1
+        n = len(signals)
         
         if buy_votes > sell_votes:
             signal_type = SignalType.BUY
-            confidence = buy_votes / len(signals)
+            confidence = buy_votes / n
         elif sell_votes > buy_votes:
             signal_type = SignalType.SELL
-            confidence = sell_votes / len(signals)
+            confidence = sell_votes / n
         else:
             signal_type = SignalType.HOLD
             confidence = 0.5
@@ -204,5 +385,5 @@ class StrategyService:
             price=first_signal.get('price', 0),
             timestamp=datetime.now().isoformat(),
             indicators={},
-            reason=f"Combined {len(signals)} signals: {buy_votes} buy, {sell_votes} sell"
+            reason=f"Combined {n} signals: {buy_votes} buy, {sell_votes} sell"
         )
@@ -5,12 +5,19 @@ Business logic for task management operations.
 Decouples API routes from core automation logic.
 """
 
+import os
 import time
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
-from automation.scheduler import TaskScheduler, ScheduleFrequency
+from src.tradingservice.services.automation import (
+    AutoTradingScheduler as TaskScheduler,
+    ScheduleFrequency,
+)
 from api.models.task_models import (
     TaskCreateRequest,
     TaskUpdateRequest,
@@ -22,6 +29,18 @@ from api.models.task_models import (
 
 logger = logging.getLogger(__name__)
 
+_SCHEDULE_FREQUENCY_BY_VALUE: Dict[str, ScheduleFrequency] = {
+    m.value: m for m in ScheduleFrequency
+}
+
+
+def _to_frequency(value: Any) -> Any:
+    """Coerce a frequency string to its ScheduleFrequency member."""
+    if isinstance(value, ScheduleFrequency) or not isinstance(value, str):
+        return value
+    member = _SCHEDULE_FREQUENCY_BY_VALUE.get(value)
+    return member if member is not None else ScheduleFrequency(value)
+
 
 class TaskService:
     """Service for managing automated trading tasks."""
@@ -29,40 +48,74 @@ class TaskService:
     def __init__(self, scheduler: TaskScheduler):
         """Initialize task service with scheduler instance."""
         self.scheduler = scheduler
+
+        # (scheduler revision, etag, response) of the last task list built
+        self._tasks_cache: Optional[Tuple[int, str, TaskListResponse]] = None
+
+        # Background pools for async_mode executions, one in-flight run per
+        # task: network-bound runs wait on brokers/data feeds, compute-bound
+        # runs (backtests) are capped at the CPU count so they cannot starve them.
+        # Created on first use and dropped again by shutdown()
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._cpu_pool: Optional[ThreadPoolExecutor] = None
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
     
     def get_all_tasks(self) -> TaskListResponse:
         """Get all tasks with summary statistics."""
-        tasks_data = self.scheduler.get_all_tasks()
+        return self.get_all_tasks_with_etag()[1]
+
+    def get_all_tasks_with_etag(
+        self, if_none_match: Optional[str] = None
+    ) -> Tuple[str, Optional[TaskListResponse]]:
+        """
+        Get all tasks along with an ETag of their current state.
+
+        The response is None when ``if_none_match`` already matches the ETag,
+        so unchanged polls skip building and serializing the task list.
+        """
+        revision = getattr(self.scheduler, "revision", None)
+        cached = self._tasks_cache
+        if revision is not None and cached is not None and cached[0] == revision:
+            etag = cached[1]
+            return etag, (None if if_none_match == etag else cached[2])
+
+        tasks_data = self.scheduler.get_all_task_statuses()
+        etag = '"%s"' % hashlib.blake2b(
+            repr(tasks_data).encode(), digest_size=8
+        ).hexdigest()
+        if if_none_match == etag:
+            return etag, None
+
         task_responses = []
-        
+        enabled_count = 0
         for task_data in tasks_data:
-            task_responses.append(TaskResponse(**task_data))
+            task = TaskResponse.model_construct(**task_data)
+            enabled_count += task.enabled
+            task_responses.append(task)
         
-        enabled_count = sum(1 for t in task_responses if t.enabled)
-        disabled_count = len(task_responses) - enabled_count
-        
-        return TaskListResponse(
+        response = TaskListResponse(
             tasks=task_responses,
             total=len(task_responses),
             enabled_count=enabled_count,
-            disabled_count=disabled_count
+            disabled_count=len(task_responses) - enabled_count
         )
+        if revision is not None:
+            self._tasks_cache = (revision, etag, response)
+        return etag, response
     
     def get_task_by_id(self, task_id: str) -> Optional[TaskResponse]:
         """Get a specific task by ID."""
         task_data = self.scheduler.get_task_status(task_id)
         if not task_data:
             return None
-        return TaskResponse(**task_data)
+        return TaskResponse.model_construct(**task_data)
     
     def create_task(self, request: TaskCreateRequest) -> TaskResponse:
         """Create a new scheduled task."""
         try:
             # Convert string frequency to enum if needed
-            if isinstance(request.frequency, str):
-                frequency = ScheduleFrequency(request.frequency)
-            else:
-                frequency = request.frequency
+            frequency = _to_frequency(request.frequency)
             
             # Add task to scheduler
             task_id = self.scheduler.add_task(
@@ -78,11 +131,11 @@ class TaskService:
             if request.description:
                 task_data['description'] = request.description
             
-            logger.info(f"Created task: {task_id} - {request.name}")
-            return TaskResponse(**task_data)
+            logger.info("Created task: %s - %s", task_id, request.name)
+            return TaskResponse.model_construct(**task_data)
             
         except Exception as e:
-            logger.error(f"Failed to create task: {e}")
+            logger.error("Failed to create task: %s", e)
             raise
     
     def update_task(self, task_id: str, request: TaskUpdateRequest) -> Optional[TaskResponse]:
@@ -94,32 +147,21 @@ class TaskService:
         
         try:
             # Update task properties
-            update_data = request.model_dump(exclude_unset=True)
+            update_data = {k: getattr(request, k) for k in request.model_fields_set}
             
             # Handle frequency conversion
             if 'frequency' in update_data and update_data['frequency']:
-                if isinstance(update_data['frequency'], str):
-                    update_data['frequency'] = ScheduleFrequency(update_data['frequency'])
-            
-            # Apply updates (this is simplified - actual implementation would update scheduler)
-            # For now, remove and re-add with updated data
-            self.scheduler.remove_task(task_id)
+                update_data['frequency'] = _to_frequency(update_data['frequency'])
             
-            updated_data = {**existing_task, **update_data}
-            new_task_id = self.scheduler.add_task(
-                name=updated_data.get('name'),
-                symbols=updated_data.get('symbols'),
-                frequency=updated_data.get('frequency'),
-                strategies=updated_data.get('strategies', ['all']),
-                enabled=updated_data.get('enabled', True)
-            )
+            # Apply only the changed fields; the task keeps its id and schedule
+            self.scheduler.modify_task(task_id, **update_data)
             
-            result = self.scheduler.get_task_status(new_task_id)
-            logger.info(f"Updated task: {task_id} -> {new_task_id}")
-            return TaskResponse(**result)
+            result = self.scheduler.get_task_status(task_id)
+            logger.info("Updated task: %s", task_id)
+            return TaskResponse.model_construct(**result)
             
         except Exception as e:
-            logger.error(f"Failed to update task {task_id}: {e}")
+            logger.error("Failed to update task %s: %s", task_id, e)
             raise
     
     def delete_task(self, task_id: str) -> bool:
@@ -127,10 +169,10 @@ class TaskService:
         try:
             result = self.scheduler.remove_task(task_id)
             if result:
-                logger.info(f"Deleted task: {task_id}")
+                logger.info("Deleted task: %s", task_id)
             return result
         except Exception as e:
-            logger.error(f"Failed to delete task {task_id}: {e}")
+            logger.error("Failed to delete task %s: %s", task_id, e)
             raise
     
     def execute_task(self, task_id: str, async_mode: bool = False) -> TaskExecutionResponse:
@@ -148,7 +190,24 @@ class TaskService:
             start_time = time.time()
             
             if async_mode:
-                # TODO: Implement async execution with background tasks
+                with self._inflight_lock:
+                    if task_id in self._inflight:
+                        return TaskExecutionResponse(
+                            task_id=task_id,
+                            status="running",
+                            message="Task execution already in progress",
+                            execution_time=0
+                        )
+                    pool = self._execution_pool(task_data.get("task_kind"))
+                    # wait=True keeps the worker busy for the whole run, so
+                    # the pool size really bounds concurrent executions
+                    future = pool.submit(
+                        self.scheduler.execute_task, task_id, wait=True
+                    )
+                    self._inflight[task_id] = future
+                future.add_done_callback(
+                    lambda f, tid=task_id: self._on_execution_done(tid, f)
+                )
                 return TaskExecutionResponse(
                     task_id=task_id,
                     status="running",
@@ -169,7 +228,7 @@ class TaskService:
                 
         except Exception as e:
             execution_time = time.time() - start_time
-            logger.error(f"Task execution failed for {task_id}: {e}")
+            logger.error("Task execution failed for %s: %s", task_id, e)
             return TaskExecutionResponse(
                 task_id=task_id,
                 status="failed",
@@ -178,15 +237,55 @@ class TaskService:
                 error=str(e)
             )
     
+    def _execution_pool(self, task_kind: Optional[str]) -> ThreadPoolExecutor:
+        """Return the pool for a task kind, creating it on first use (lock held)."""
+        if task_kind == "cpu":
+            if self._cpu_pool is None:
+                self._cpu_pool = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    thread_name_prefix="task-cpu",
+                )
+            return self._cpu_pool
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=int(os.getenv("TASK_EXEC_WORKERS", "16")),
+                thread_name_prefix="task-io",
+            )
+        return self._io_pool
+
+    def shutdown(self) -> None:
+        """
+        Stop the background execution pools (called on application shutdown).
+
+        Queued runs are cancelled; runs already in progress finish on their
+        worker. A later async execution creates fresh pools.
+        """
+        with self._inflight_lock:
+            pools = (self._io_pool, self._cpu_pool)
+            self._io_pool = self._cpu_pool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def _on_execution_done(self, task_id: str, future: Future) -> None:
+        """Release the in-flight slot of a background execution and log failures."""
+        with self._inflight_lock:
+            self._inflight.pop(task_id, None)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error("Background execution failed for %s: %s", task_id, error)
+    
     def pause_task(self, task_id: str) -> bool:
         """Pause a task."""
         try:
             result = self.scheduler.pause_task(task_id)
             if result:
-                logger.info(f"Paused task: {task_id}")
+                logger.info("Paused task: %s", task_id)
             return result
         except Exception as e:
-            logger.error(f"Failed to pause task {task_id}: {e}")
+            logger.error("Failed to pause task %s: %s", task_id, e)
             raise
     
     def resume_task(self, task_id: str) -> bool:
@@ -194,8 +293,8 @@ class TaskService:
         try:
             result = self.scheduler.resume_task(task_id)
             if result:
-                logger.info(f"Resumed task: {task_id}")
+                logger.info("Resumed task: %s", task_id)
             return result
         except Exception as e:
-            logger.error(f"Failed to resume task {task_id}: {e}")
+            logger.error("Failed to resume task %s: %s", task_id, e)
             raise
@@ -8,6 +8,7 @@ Data Access Layer - 数据访问层
 """
 
 import logging
+import threading
 from pathlib import Path
 from src.common.dataaccess import DatabaseEngine, OrmBase, BaseRepository
 from .models import (
@@ -29,8 +30,12 @@ from .repositories import (
 
 logger = logging.getLogger(__name__)
 
-# 数据库引擎单例
+# 数据库引擎单例，按 (db_type, db_name) 区分
 _engines = {}
+_engines_lock = threading.Lock()
+
+# 数据库文件根目录：db/{db_type}/{db_name}.db
+_DB_ROOT = Path(__file__).parent / 'db'
 
 
 def get_engine(db_name: str = 'business', db_type: str = 'business', echo: bool = False) -> DatabaseEngine:
@@ -45,25 +50,33 @@ def get_engine(db_name: str = 'business', db_type: str = 'business', echo: bool
     Returns:
         DatabaseEngine 实例
     """
-    if db_name not in _engines:
-        # 数据库文件路径：db/{db_type}/{db_name}.db
-        db_path = Path(__file__).parent / 'db' / db_type / f'{db_name}.db'
-        
-        # 转换为 SQLAlchemy URL 格式
-        db_url = f'sqlite:///{db_path.as_posix()}'
-        
-        # 创建引擎
-        engine = DatabaseEngine(db_url, echo=echo)
-        
-        # 创建所有表
-        engine.create_tables(OrmBase)
-        
-        _engines[db_name] = engine
-        logger.info(f"数据库引擎已创建: {db_type}/{db_name}.db")
+    key = (db_type, db_name)
+    engine = _engines.get(key)
+    if engine is not None:
+        return engine
+
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            db_path = _DB_ROOT / db_type / f'{db_name}.db'
+            
+            # 转换为 SQLAlchemy URL 格式
+            db_url = f'sqlite:///{db_path.as_posix()}'
+            
+            # 创建引擎
+            engine = DatabaseEngine(db_url, echo=echo)
+            
+            # 创建所有表
+            engine.create_tables(OrmBase)
+            
+            _engines[key] = engine
+            logger.info(f"数据库引擎已创建: {db_type}/{db_name}.db")
     
-    return _engines[db_name]
+    return engine
 
 
+# 每个仓储持有独立的 Session：关闭一个仓储不会影响其他仓储。
+# 调用方在一次工作单元结束后调用 repository.session.close() 归还连接。
 def get_backtest_repository() -> BacktestRepository:
     """
     获取回测仓储（便捷方法）
@@ -4,46 +4,64 @@
 用于存储单次回测的核心绩效指标与配置参数。
 """
 
-from datetime import datetime
-
-from sqlalchemy import Column, DateTime, Float, Integer, String, Text
+from sqlalchemy import JSON, Column, DateTime, Float, Index, Integer, String, Text, func
 
 from src.common.dataaccess import OrmBase
 
 
 class BacktestResult(OrmBase):
-    """回测表现快照的持久化对象。"""
+    """回测表现快照的持久化对象。
+
+    :symbol: Ticker symbol
+    :strategy_name: Strategy name
+    :strategy_params: Strategy parameters (JSON)
+    :backtest_config: Backtest configuration (JSON)
+    :total_return: Total return for the backtest period
+    :annualized_return: Annualized return percentage
+    :sharpe_ratio: Sharpe ratio
+    :max_drawdown: Maximum drawdown
+    :volatility: Return volatility
+    :win_rate: Winning trade percentage
+    :total_trades: Number of trades executed
+    :avg_trade_return: Average return per trade
+    :created_at: Record creation timestamp (UTC)
+    :notes: Additional notes
+    """
 
     __tablename__ = "backtest_results"
+    __table_args__ = (
+        # 按标的取最近 N 次回测，可直接由索引完成排序
+        Index("ix_backtest_symbol_created", "symbol", "created_at"),
+        Index("ix_backtest_strategy", "strategy_name"),
+        # 常用排行指标，ORDER BY metric DESC LIMIT n 走索引而非全表排序
+        Index("ix_backtest_total_return", "total_return"),
+        Index("ix_backtest_annualized_return", "annualized_return"),
+        Index("ix_backtest_sharpe", "sharpe_ratio"),
+        Index("ix_backtest_win_rate", "win_rate"),
+    )
 
     # 主键
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # 策略元数据
-    symbol = Column(String(20), nullable=False, index=True, comment="Ticker symbol")
-    strategy_name = Column(String(100), nullable=False, comment="Strategy name")
-    strategy_params = Column(
-        Text, comment="Serialized strategy parameters (JSON formatted)"
-    )
-    backtest_config = Column(
-        Text, comment="Serialized backtest configuration (JSON formatted)"
-    )
+    symbol = Column(String(20), nullable=False)
+    strategy_name = Column(String(100), nullable=False)
+    strategy_params = Column(JSON)
+    backtest_config = Column(JSON)
 
     # 绩效指标
-    total_return = Column(Float, comment="Total return for the backtest period")
-    annualized_return = Column(Float, comment="Annualized return percentage")
-    sharpe_ratio = Column(Float, comment="Sharpe ratio")
-    max_drawdown = Column(Float, comment="Maximum drawdown")
-    volatility = Column(Float, comment="Return volatility")
-    win_rate = Column(Float, comment="Winning trade percentage")
-    total_trades = Column(Integer, comment="Number of trades executed")
-    avg_trade_return = Column(Float, comment="Average return per trade")
+    total_return = Column(Float)
+    annualized_return = Column(Float)
+    sharpe_ratio = Column(Float)
+    max_drawdown = Column(Float)
+    volatility = Column(Float)
+    win_rate = Column(Float)
+    total_trades = Column(Integer)
+    avg_trade_return = Column(Float)
 
     # 审计信息
-    created_at = Column(
-        DateTime, default=datetime.now, comment="Record creation timestamp"
-    )
-    notes = Column(Text, comment="Additional notes")
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    notes = Column(Text)
 
     def __repr__(self) -> str:
         return (
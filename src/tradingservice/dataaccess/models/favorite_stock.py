@@ -2,13 +2,23 @@
 Favorite Stock Model - 收藏股票模型
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
-from datetime import datetime
+from sqlalchemy import Column, Integer, Float, String, DateTime, Text, ForeignKey, func
 from src.common.dataaccess import OrmBase
 
 
 class FavoriteStock(OrmBase):
-    """收藏股票模型"""
+    """收藏股票模型
+
+    :symbol: 股票代码
+    :name: 股票名称
+    :sector: 所属板块
+    :last_backtest_id: 最新回测ID
+    :last_sharpe: 最新回测夏普比率
+    :last_total_return: 最新回测总收益率
+    :last_backtest_at: 最新回测时间（UTC）
+    :added_at: 添加时间（UTC）
+    :notes: 备注
+    """
     
     __tablename__ = 'favorite_stocks'
     
@@ -16,16 +26,21 @@ class FavoriteStock(OrmBase):
     id = Column(Integer, primary_key=True, autoincrement=True)
     
     # 股票信息
-    symbol = Column(String(20), unique=True, nullable=False, index=True, comment='股票代码')
-    name = Column(String(100), comment='股票名称')
-    sector = Column(String(100), comment='所属板块')
+    symbol = Column(String(20), unique=True, nullable=False, index=True)
+    name = Column(String(100))
+    sector = Column(String(100))
     
     # 关联信息
-    last_backtest_id = Column(Integer, ForeignKey('backtest_results.id'), comment='最新回测ID')
+    last_backtest_id = Column(Integer, ForeignKey('backtest_results.id'))
+    
+    # 最新回测指标冗余（由 BacktestRepository.save_result 维护，列表页无需联表）
+    last_sharpe = Column(Float)
+    last_total_return = Column(Float)
+    last_backtest_at = Column(DateTime)
     
     # 元数据
-    added_at = Column(DateTime, default=datetime.now, comment='添加时间')
-    notes = Column(Text, comment='备注')
+    added_at = Column(DateTime, server_default=func.now(), nullable=False)
+    notes = Column(Text)
     
     def __repr__(self):
         return f"<FavoriteStock(id={self.id}, symbol={self.symbol}, name={self.name})>"
@@ -4,42 +4,55 @@
 用于追踪策略参数调优的历史结果。
 """
 
-from datetime import datetime
-
-from sqlalchemy import Column, DateTime, Float, Integer, String, Text
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text, func
 
 from src.common.dataaccess import OrmBase
 
 
 class OptimizationRecord(OrmBase):
-    """策略优化结果的历史记录实体。"""
+    """策略优化结果的历史记录实体。
+
+    :symbol: Ticker symbol
+    :parameter_name: Name of the parameter being optimized
+    :parameter_value: Serialized parameter value (JSON formatted)
+    :performance_metric: Metric value produced by the optimization run
+    :metric_type: Type of performance metric (e.g. sharpe_ratio, total_return)
+    :created_at: Record creation timestamp (UTC)
+    """
 
     __tablename__ = "optimization_history"
+    __table_args__ = (
+        # 按标的与指标类型取 Top-K 结果
+        Index("ix_opt_symbol_metric", "symbol", "metric_type", "performance_metric"),
+        # 优化历史按标的（可选参数名）过滤、按创建时间倒序；
+        # PostgreSQL 上 INCLUDE 其余查询列，可走仅索引扫描
+        Index(
+            "ix_opt_sym_param_created",
+            "symbol",
+            "parameter_name",
+            "created_at",
+            postgresql_include=["performance_metric", "metric_type"],
+        ),
+        Index(
+            "ix_opt_sym_created",
+            "symbol",
+            "created_at",
+            postgresql_include=["performance_metric", "metric_type"],
+        ),
+    )
 
     # 主键
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # 优化相关信息
-    symbol = Column(String(20), nullable=False, index=True, comment="Ticker symbol")
-    parameter_name = Column(
-        String(100), nullable=False, comment="Name of the parameter being optimized"
-    )
-    parameter_value = Column(
-        Text, nullable=False, comment="Serialized parameter value (JSON formatted)"
-    )
-    performance_metric = Column(
-        Float, comment="Metric value produced by the optimization run"
-    )
-    metric_type = Column(
-        String(50),
-        nullable=False,
-        comment="Type of performance metric (e.g. sharpe_ratio, total_return)",
-    )
+    symbol = Column(String(20), nullable=False)
+    parameter_name = Column(String(100), nullable=False)
+    parameter_value = Column(Text, nullable=False)
+    performance_metric = Column(Float)
+    metric_type = Column(String(50), nullable=False)
 
     # 审计信息
-    created_at = Column(
-        DateTime, default=datetime.now, comment="Record creation timestamp"
-    )
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     def __repr__(self) -> str:
         return (
@@ -14,72 +14,90 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    JSON,
     String,
-    Text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from src.common.dataaccess import OrmBase
 
 
 class AutomationTaskExecution(OrmBase):
-    """自动化任务的一次执行记录。"""
+    """自动化任务的一次执行记录。
+
+    :run_id: 执行批次的唯一标识（UUID hex，32 位）
+    :task_id: 调度任务 ID
+    :task_name: 任务名称
+    :scheduler_status: 调度层状态
+    :orchestration_status: TaskManager 返回的状态
+    :started_at: 执行开始时间
+    :completed_at: 执行结束时间
+    :executed_signals: 通过风控的信号数量
+    :rejected_signals: 被拒绝的信号数量
+    :total_signals: 总信号数量
+    :order_count: 执行生成的订单数量
+    :task_errors_json: 任务错误列表（JSON）
+    :symbol_details_json: 标的维度的执行详情（JSON）
+    :summary_json: 执行摘要（JSON）
+    :account_snapshot_json: 账户快照（JSON）
+    :payload_json: TaskManager 原始执行结果（JSON）
+    :created_at: 记录创建时间（UTC）
+    """
 
     __tablename__ = "automation_task_executions"
+    __table_args__ = (
+        # fetch_recent_executions 按 task_id / scheduler_status 过滤并以
+        # started_at DESC, id DESC 排序取前 N 条：等值列在前、排序列在后，
+        # 可反向扫描索引直接满足 LIMIT，无需排序
+        Index("ix_ate_task_started", "task_id", "started_at"),
+        Index("ix_ate_sched_started", "scheduler_status", "started_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     run_id = Column(
-        String(36),
-        default=lambda: str(uuid4()),
+        String(32),
+        default=lambda: uuid4().hex,
         unique=True,
         nullable=False,
         index=True,
-        comment="执行批次的唯一标识（UUID）",
     )
 
-    task_id = Column(String(128), nullable=False, index=True, comment="调度任务 ID")
-    task_name = Column(String(255), nullable=False, comment="任务名称")
-    scheduler_status = Column(String(32), nullable=False, comment="调度层状态")
-    orchestration_status = Column(
-        String(32),
-        nullable=False,
-        comment="TaskManager 返回的状态",
-    )
+    task_id = Column(String(128), nullable=False)
+    task_name = Column(String(255), nullable=False)
+    scheduler_status = Column(String(32), nullable=False)
+    orchestration_status = Column(String(32), nullable=False)
 
-    started_at = Column(DateTime, nullable=True, comment="执行开始时间")
-    completed_at = Column(DateTime, nullable=True, comment="执行结束时间")
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
 
-    executed_signals = Column(Integer, default=0, comment="通过风控的信号数量")
-    rejected_signals = Column(Integer, default=0, comment="被拒绝的信号数量")
-    total_signals = Column(Integer, default=0, comment="总信号数量")
-    order_count = Column(Integer, default=0, comment="执行生成的订单数量")
+    executed_signals = Column(Integer, default=0)
+    rejected_signals = Column(Integer, default=0)
+    total_signals = Column(Integer, default=0)
+    order_count = Column(Integer, default=0)
 
-    task_errors_json = Column(Text, comment="任务错误列表（JSON）")
-    symbol_details_json = Column(Text, comment="标的维度的执行详情（JSON）")
-    summary_json = Column(Text, comment="执行摘要（JSON）")
-    account_snapshot_json = Column(Text, comment="账户快照（JSON）")
-    payload_json = Column(Text, comment="TaskManager 原始执行结果（JSON）")
+    # 大字段延迟加载（"payloads" 组），列表查询默认不取；需要时 undefer_group("payloads")
+    task_errors_json = deferred(Column(JSON), group="payloads")
+    symbol_details_json = deferred(Column(JSON), group="payloads")
+    summary_json = deferred(Column(JSON), group="payloads")
+    account_snapshot_json = deferred(Column(JSON), group="payloads")
+    payload_json = deferred(Column(JSON), group="payloads")
 
-    created_at = Column(
-        DateTime,
-        default=datetime.utcnow,
-        nullable=False,
-        comment="记录创建时间（UTC）",
-    )
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     orders = relationship(
         "AutomationTaskOrder",
         back_populates="execution",
         cascade="all, delete-orphan",
-        lazy="joined",
+        lazy="selectin",
     )
     risk_snapshot = relationship(
         "AutomationRiskSnapshot",
         back_populates="execution",
         cascade="all, delete-orphan",
         uselist=False,
-        lazy="joined",
+        lazy="selectin",
     )
 
     def __repr__(self) -> str:
@@ -87,35 +105,46 @@ class AutomationTaskExecution(OrmBase):
 
 
 class AutomationTaskOrder(OrmBase):
-    """自动化任务执行过程中生成的订单记录。"""
+    """自动化任务执行过程中生成的订单记录。
+
+    :order_id: 券商返回的订单 ID
+    :symbol: 交易标的
+    :action: 方向（买/卖）
+    :status: 订单最新状态
+    :quantity: 提交数量
+    :filled_quantity: 成交数量
+    :average_price: 成交均价
+    :submitted_at: 提交时间
+    :completed_at: 完成时间
+    :raw_order_json: 订单原始数据（JSON）
+    :created_at: 记录创建时间（UTC）
+    """
 
     __tablename__ = "automation_task_orders"
+    __table_args__ = (
+        # execution_id 为前缀列，同时覆盖按执行记录查询订单
+        Index("ix_order_exec_status", "execution_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     execution_id = Column(
         Integer,
         ForeignKey("automation_task_executions.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
-    order_id = Column(String(128), nullable=False, index=True, comment="券商返回的订单 ID")
-    symbol = Column(String(32), nullable=True, comment="交易标的")
-    action = Column(String(16), nullable=True, comment="方向（买/卖）")
-    status = Column(String(32), nullable=True, comment="订单最新状态")
-    quantity = Column(Float, nullable=True, comment="提交数量")
-    filled_quantity = Column(Float, nullable=True, comment="成交数量")
-    average_price = Column(Float, nullable=True, comment="成交均价")
-    submitted_at = Column(DateTime, nullable=True, comment="提交时间")
-    completed_at = Column(DateTime, nullable=True, comment="完成时间")
-
-    raw_order_json = Column(Text, comment="订单原始数据（JSON）")
-    created_at = Column(
-        DateTime,
-        default=datetime.utcnow,
-        nullable=False,
-        comment="记录创建时间（UTC）",
-    )
+    order_id = Column(String(128), nullable=False, index=True)
+    symbol = Column(String(32), nullable=True)
+    action = Column(String(16), nullable=True)
+    status = Column(String(32), nullable=True)
+    quantity = Column(Float, nullable=True)
+    filled_quantity = Column(Float, nullable=True)
+    average_price = Column(Float, nullable=True)
+    submitted_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
+    raw_order_json = Column(JSON)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     execution = relationship("AutomationTaskExecution", back_populates="orders")
 
@@ -124,7 +153,16 @@ class AutomationTaskOrder(OrmBase):
 
 
 class AutomationRiskSnapshot(OrmBase):
-    """自动化任务执行后的风险指标快照。"""
+    """自动化任务执行后的风险指标快照。
+
+    :equity: 账户净值
+    :cash: 可用现金
+    :buying_power: 可用杠杆/购买力
+    :exposure: 当前敞口
+    :maintenance_margin: 维持保证金需求
+    :raw_metrics_json: 风险指标原始数据（JSON）
+    :captured_at: 快照采集时间（UTC）
+    """
 
     __tablename__ = "automation_risk_snapshots"
 
@@ -137,19 +175,14 @@ class AutomationRiskSnapshot(OrmBase):
         index=True,
     )
 
-    equity = Column(Float, nullable=True, comment="账户净值")
-    cash = Column(Float, nullable=True, comment="可用现金")
-    buying_power = Column(Float, nullable=True, comment="可用杠杆/购买力")
-    exposure = Column(Float, nullable=True, comment="当前敞口")
-    maintenance_margin = Column(Float, nullable=True, comment="维持保证金需求")
+    equity = Column(Float, nullable=True)
+    cash = Column(Float, nullable=True)
+    buying_power = Column(Float, nullable=True)
+    exposure = Column(Float, nullable=True)
+    maintenance_margin = Column(Float, nullable=True)
 
-    raw_metrics_json = Column(Text, comment="风险指标原始数据（JSON）")
-    captured_at = Column(
-        DateTime,
-        default=datetime.utcnow,
-        nullable=False,
-        comment="快照采集时间（UTC）",
-    )
+    raw_metrics_json = Column(JSON)
+    captured_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     execution = relationship("AutomationTaskExecution", back_populates="risk_snapshot")
 
@@ -4,15 +4,20 @@
 用于保存多策略对比时的聚合结果。
 """
 
-from datetime import datetime
-
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy import Column, DateTime, Integer, String, Text, func
 
 from src.common.dataaccess import OrmBase
 
 
 class StrategyComparison(OrmBase):
-    """策略对比结果的汇总实体。"""
+    """策略对比结果的汇总实体。
+
+    :comparison_name: Comparison task name
+    :symbols: Symbols included in the comparison (JSON formatted)
+    :results: Serialized comparison results (JSON formatted)
+    :best_performer: Best performing strategy or instrument
+    :created_at: Record creation timestamp (UTC)
+    """
 
     __tablename__ = "strategy_comparison"
 
@@ -20,27 +25,13 @@ class StrategyComparison(OrmBase):
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # 对比元数据
-    comparison_name = Column(
-        String(200), nullable=False, comment="Comparison task name"
-    )
-    symbols = Column(
-        Text,
-        nullable=False,
-        comment="Symbols included in the comparison (JSON formatted)",
-    )
-    results = Column(
-        Text,
-        nullable=False,
-        comment="Serialized comparison results (JSON formatted)",
-    )
-    best_performer = Column(
-        String(100), comment="Best performing strategy or instrument"
-    )
+    comparison_name = Column(String(200), nullable=False)
+    symbols = Column(Text, nullable=False)
+    results = Column(Text, nullable=False)
+    best_performer = Column(String(100))
 
     # 审计信息
-    created_at = Column(
-        DateTime, default=datetime.now, comment="Record creation timestamp"
-    )
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     def __repr__(self) -> str:
         return f"<StrategyComparison(id={self.id}, name={self.comparison_name})>"
@@ -4,17 +4,53 @@
  封装回测记录的增删查改与常用查询逻辑。
 """
 
-import json
 import logging
-from typing import Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
 
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Row,
+    func,
+    lambda_stmt,
+    literal,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.orm import Session, aliased
 
 from src.common.dataaccess import BaseRepository
 from src.tradingservice.dataaccess.models.backtest_result import BacktestResult
+from src.tradingservice.dataaccess.models.favorite_stock import FavoriteStock
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# iter_history 每批从游标读取的行数
+_HISTORY_STREAM_CHUNK = 100
+
+# get_best_results 允许排序的指标列，未知指标回退到 total_return
+_BEST_METRICS = {
+    "total_return": BacktestResult.total_return,
+    "annualized_return": BacktestResult.annualized_return,
+    "sharpe_ratio": BacktestResult.sharpe_ratio,
+    "win_rate": BacktestResult.win_rate,
+    "max_drawdown": BacktestResult.max_drawdown,
+    "volatility": BacktestResult.volatility,
+    "total_trades": BacktestResult.total_trades,
+    "avg_trade_return": BacktestResult.avg_trade_return,
+}
+
 
 class BacktestRepository(BaseRepository[BacktestResult]):
     """面向回测结果的仓储封装。"""
@@ -46,31 +82,66 @@ class BacktestRepository(BaseRepository[BacktestResult]):
             数据库生成的主键 ID。
         """
         try:
-            payload = BacktestResult(
-                symbol=symbol,
-                strategy_name=strategy_name,
-                strategy_params=json.dumps(strategy_params, ensure_ascii=False),
-                backtest_config=json.dumps(backtest_config or {}, ensure_ascii=False),
-                total_return=results.get("total_return", 0.0),
-                annualized_return=results.get("annualized_return", 0.0),
-                sharpe_ratio=results.get("sharpe_ratio", 0.0),
-                max_drawdown=results.get("max_drawdown", 0.0),
-                volatility=results.get("volatility", 0.0),
-                win_rate=results.get("win_rate", 0.0),
-                total_trades=results.get("total_trades", 0),
-                avg_trade_return=results.get("avg_trade_return", 0.0),
-                notes=notes,
-            )
+            values = {
+                "symbol": symbol,
+                "strategy_name": strategy_name,
+                "strategy_params": strategy_params,
+                "backtest_config": backtest_config or {},
+                "total_return": results.get("total_return", 0.0),
+                "annualized_return": results.get("annualized_return", 0.0),
+                "sharpe_ratio": results.get("sharpe_ratio", 0.0),
+                "max_drawdown": results.get("max_drawdown", 0.0),
+                "volatility": results.get("volatility", 0.0),
+                "win_rate": results.get("win_rate", 0.0),
+                "total_trades": results.get("total_trades", 0),
+                "avg_trade_return": results.get("avg_trade_return", 0.0),
+                "notes": notes,
+            }
+            result_id = self.insert_returning_id(values)
 
-            record = self.add(payload)
-            logger.info("Stored backtest result with id=%s", record.id)
-            return record.id
+            # 同一事务内刷新收藏表上的最新回测指标
+            self._refresh_favorite(result_id, values)
+            self.session.commit()
+            logger.info("Stored backtest result with id=%s", result_id)
+            return result_id
 
         except Exception as exc:  # pragma: no cover - defensive
             logger.error("Failed to persist backtest result: %s", exc)
             self.rollback()
             raise
 
+    def save_results(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        批量保存回测结果（单事务），并同步收藏表上的最新回测指标。
+
+        每个标的以最后一行为准，与依次调用 save_result 的效果一致。
+
+        Args:
+            rows: 字段名到值的字典列表，字段与 save_result 写入的列一致。
+
+        Returns:
+            新记录的主键 ID 列表，与 rows 顺序一致。
+        """
+        if not rows:
+            return []
+        try:
+            result_ids = self.insert_many_returning_ids(rows)
+
+            latest = {
+                row["symbol"]: (result_id, row)
+                for result_id, row in zip(result_ids, rows)
+            }
+            for result_id, row in latest.values():
+                self._refresh_favorite(result_id, row)
+            self.session.commit()
+            logger.info("Stored %d backtest results", len(result_ids))
+            return result_ids
+
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.error("Failed to persist backtest results: %s", exc)
+            self.session.rollback()
+            raise
+
     def get_history(
         self,
         symbol: Optional[str] = None,
@@ -88,16 +159,81 @@ class BacktestRepository(BaseRepository[BacktestResult]):
         Returns:
             回测记录的序列化列表。
         """
-        query = self.session.query(BacktestResult)
+        return list(self.iter_history(symbol, strategy_name, limit))
+
+    def iter_history(
+        self,
+        symbol: Optional[str] = None,
+        strategy_name: Optional[str] = None,
+        limit: int = 50,
+    ) -> Iterator[Dict]:
+        """
+        逐条产出历史回测记录，供流式响应等场景使用。
+
+        按批从游标读取并逐行序列化，不同时持有全部 ORM 实例与字典副本。
+
+        Args:
+            symbol: 可选的标的过滤条件。
+            strategy_name: 可选的策略过滤条件。
+            limit: 返回结果数量上限。
+
+        Yields:
+            单条回测记录的序列化字典。
+        """
+        stmt = self._history_stmt(symbol, strategy_name, limit)
+        results = self.session.execute(
+            stmt, execution_options={"yield_per": _HISTORY_STREAM_CHUNK}
+        ).scalars()
+        for result in results:
+            yield self._to_dict(result)
+
+    def get_history_frame(
+        self,
+        symbol: Optional[str] = None,
+        strategy_name: Optional[str] = None,
+        limit: int = 50,
+    ) -> "pd.DataFrame":
+        """
+        以 DataFrame 形式查询历史回测记录。
+
+        直接由查询结果构建列式数据，不经过 ORM 实例和逐行 _to_dict，
+        适合看板、Notebook 等分析场景。
+
+        Args:
+            symbol: 可选的标的过滤条件。
+            strategy_name: 可选的策略过滤条件。
+            limit: 返回结果数量上限。
+
+        Returns:
+            每行一条回测记录的 DataFrame，列与表字段一致。
+        """
+        # pylint: disable=import-outside-toplevel
+        import pandas as pd
+
+        stmt = self._history_stmt(symbol, strategy_name, limit)
+        result = self.session.connection().execute(stmt)
+        return pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+
+    @staticmethod
+    def _history_stmt(
+        symbol: Optional[str], strategy_name: Optional[str], limit: int
+    ):
+        """
+        构建按条件过滤、按创建时间倒序的历史记录查询。
+
+        使用 lambda_stmt，编译结果按 lambda 代码位置缓存，
+        重复调用只替换绑定参数，不再重新构建和编译 SQL。
+        """
+        stmt = lambda_stmt(lambda: select(BacktestResult))
 
         if symbol:
-            query = query.filter(BacktestResult.symbol == symbol)
+            stmt += lambda s: s.where(BacktestResult.symbol == symbol)
 
         if strategy_name:
-            query = query.filter(BacktestResult.strategy_name == strategy_name)
+            stmt += lambda s: s.where(BacktestResult.strategy_name == strategy_name)
 
-        results = query.order_by(BacktestResult.created_at.desc()).limit(limit).all()
-        return [self._to_dict(result) for result in results]
+        stmt += lambda s: s.order_by(BacktestResult.created_at.desc()).limit(limit)
+        return stmt
 
     def get_best_results(
         self, metric: str = "total_return", limit: int = 10
@@ -112,15 +248,132 @@ class BacktestRepository(BaseRepository[BacktestResult]):
         Returns:
             按指标倒序排列的回测记录。
         """
-        order_column = getattr(BacktestResult, metric, BacktestResult.total_return)
+        order_column = _BEST_METRICS.get(metric, BacktestResult.total_return)
+
+        stmt = lambda_stmt(
+            lambda: select(BacktestResult).order_by(order_column.desc()).limit(limit)
+        )
+        results = self.session.execute(stmt).scalars().all()
+        return [self._to_dict(result) for result in results]
+
+    def get_best_results_multi(
+        self, metrics: Iterable[str], limit: int = 10
+    ) -> Dict[str, List[Dict]]:
+        """
+        一次查询获取多个指标各自的 Top-N 回测结果。
+
+        每个指标的 Top-N 作为子查询，以 UNION ALL 合并为一条语句，
+        代替逐个指标调用 get_best_results 的多次往返。
+
+        Args:
+            metrics: 指标列名列表，未知指标与 get_best_results 一样
+                按 total_return 排序。
+            limit: 每个指标返回结果数量上限。
+
+        Returns:
+            指标名到按该指标倒序排列的回测记录列表的映射。
+        """
+        order_columns = {
+            m: _BEST_METRICS.get(m, BacktestResult.total_return)
+            for m in dict.fromkeys(metrics)
+        }
+        if not order_columns:
+            return {}
+
+        parts = []
+        for metric, order_column in order_columns.items():
+            top_n = (
+                select(BacktestResult, literal(metric).label("metric"))
+                .order_by(order_column.desc())
+                .limit(limit)
+                .subquery()
+            )
+            parts.append(select(*top_n.c))
+        ranked = union_all(*parts).subquery()
+        ranked_result = aliased(BacktestResult, ranked)
+
+        grouped: Dict[str, List[BacktestResult]] = {m: [] for m in order_columns}
+        for result, metric in self.session.execute(
+            select(ranked_result, ranked.c.metric)
+        ):
+            grouped[metric].append(result)
+
+        # UNION ALL 不保证各部分的顺序，按指标重新排序（空值排在最后）
+        best: Dict[str, List[Dict]] = {}
+        for metric, results in grouped.items():
+            key = order_columns[metric].key
+            results.sort(
+                key=lambda r, k=key: (getattr(r, k) is not None, getattr(r, k) or 0),
+                reverse=True,
+            )
+            best[metric] = [self._to_dict(result) for result in results]
+        return best
+
+    def get_best_results_tuples(
+        self, symbol: str, metric: str = "sharpe_ratio", limit: int = 10
+    ) -> Sequence[Row]:
+        """
+        按指标获取某标的表现最好的回测结果（只取分析所需列）。
 
-        results = (
-            self.session.query(BacktestResult)
+        返回原始行元组，不构建 ORM 实例，适合直接构建 DataFrame。
+
+        Args:
+            symbol: 回测标的。
+            metric: 排序所依据的指标列名，未知指标回退到 total_return。
+            limit: 返回结果数量上限。
+
+        Returns:
+            (id, strategy_name, total_return, sharpe_ratio, max_drawdown,
+            win_rate, total_trades, created_at) 行序列。
+        """
+        order_column = _BEST_METRICS.get(metric, BacktestResult.total_return)
+        stmt = (
+            select(
+                BacktestResult.id,
+                BacktestResult.strategy_name,
+                BacktestResult.total_return,
+                BacktestResult.sharpe_ratio,
+                BacktestResult.max_drawdown,
+                BacktestResult.win_rate,
+                BacktestResult.total_trades,
+                BacktestResult.created_at,
+            )
+            .where(BacktestResult.symbol == symbol)
             .order_by(order_column.desc())
             .limit(limit)
-            .all()
         )
-        return [self._to_dict(result) for result in results]
+        return self.session.execute(stmt).all()
+
+    def get_strategy_metric_tuples(
+        self, symbol: str, strategy_name: str, limit: int = 50
+    ) -> Sequence[Row]:
+        """
+        获取某标的指定策略最近的绩效指标行。
+
+        Args:
+            symbol: 回测标的。
+            strategy_name: 目标策略。
+            limit: 返回结果数量上限。
+
+        Returns:
+            (total_return, sharpe_ratio, max_drawdown, win_rate) 行序列，
+            按创建时间倒序。
+        """
+        stmt = (
+            select(
+                BacktestResult.total_return,
+                BacktestResult.sharpe_ratio,
+                BacktestResult.max_drawdown,
+                BacktestResult.win_rate,
+            )
+            .where(
+                BacktestResult.symbol == symbol,
+                BacktestResult.strategy_name == strategy_name,
+            )
+            .order_by(BacktestResult.created_at.desc())
+            .limit(limit)
+        )
+        return self.session.execute(stmt).all()
 
     def get_by_strategy(self, strategy_name: str, limit: int = 50) -> List[Dict]:
         """
@@ -133,14 +386,20 @@ class BacktestRepository(BaseRepository[BacktestResult]):
         Returns:
             该策略对应的回测记录列表。
         """
-        results = (
-            self.session.query(BacktestResult)
-            .filter(BacktestResult.strategy_name == strategy_name)
-            .order_by(BacktestResult.created_at.desc())
-            .limit(limit)
-            .all()
+        return list(self.iter_history(strategy_name=strategy_name, limit=limit))
+
+    def _refresh_favorite(self, result_id: int, values: Dict[str, Any]) -> None:
+        """将一条回测结果的指标冗余到对应的收藏记录上（不提交事务）。"""
+        self.session.execute(
+            update(FavoriteStock)
+            .where(FavoriteStock.symbol == values["symbol"])
+            .values(
+                last_backtest_id=result_id,
+                last_sharpe=values.get("sharpe_ratio"),
+                last_total_return=values.get("total_return"),
+                last_backtest_at=func.now(),
+            )
         )
-        return [self._to_dict(result) for result in results]
 
     def _to_dict(self, result: BacktestResult) -> Dict:
         """将 BacktestResult ORM 实例转换为可序列化字典。"""
@@ -148,12 +407,8 @@ class BacktestRepository(BaseRepository[BacktestResult]):
             "id": result.id,
             "symbol": result.symbol,
             "strategy_name": result.strategy_name,
-            "strategy_params": (
-                json.loads(result.strategy_params) if result.strategy_params else {}
-            ),
-            "backtest_config": (
-                json.loads(result.backtest_config) if result.backtest_config else {}
-            ),
+            "strategy_params": result.strategy_params or {},
+            "backtest_config": result.backtest_config or {},
             "total_return": result.total_return,
             "annualized_return": result.annualized_return,
             "sharpe_ratio": result.sharpe_ratio,
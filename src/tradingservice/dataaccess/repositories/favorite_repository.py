@@ -5,17 +5,33 @@ Favorite Repository - 收藏股票仓储
 """
 
 import logging
-from typing import List, Optional
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import URL
 from sqlalchemy.orm import Session
 from src.common.dataaccess import BaseRepository
 from ..models.favorite_stock import FavoriteStock
 
 logger = logging.getLogger(__name__)
 
+# 支持 INSERT ... ON CONFLICT DO NOTHING RETURNING 的方言
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
 
 class FavoriteRepository(BaseRepository[FavoriteStock]):
     """收藏股票仓储"""
 
+    # 进程内收藏代码集合缓存：收藏变动少、查询频繁，is_favorite 直接查集合。
+    # 按数据库 URL 分别缓存 (加载时间, 代码集合)；每次写入递增该库的代数，
+    # 加载期间代数发生变化时丢弃加载结果，避免旧集合覆盖刚写入的收藏
+    _symbols_cache: Dict[URL, Tuple[float, Set[str]]] = {}
+    _symbols_generation: Dict[URL, int] = {}
+    _symbols_ttl = 30.0
+    _symbols_lock = threading.Lock()
+
     def __init__(self, session: Session):
         super().__init__(FavoriteStock, session)
 
@@ -27,6 +43,10 @@ class FavoriteRepository(BaseRepository[FavoriteStock]):
         notes: Optional[str] = None,
     ) -> int:
         """添加收藏股票"""
+        insert = _UPSERT_INSERTS.get(self.session.get_bind().dialect.name)
+        if insert is not None:
+            return self._insert_favorite(insert, symbol, name, sector, notes)
+
         try:
             # 检查是否已存在
             existing = self.find_one_by(symbol=symbol)
@@ -38,6 +58,7 @@ class FavoriteRepository(BaseRepository[FavoriteStock]):
                 symbol=symbol, name=name, sector=sector, notes=notes
             )
             favorite = self.add(favorite)
+            self._cache_update(add=symbol)
             logger.info(f"已添加收藏股票: {symbol}")
             return favorite.id
         except Exception as e:
@@ -45,12 +66,49 @@ class FavoriteRepository(BaseRepository[FavoriteStock]):
             self.rollback()
             raise
 
+    def _insert_favorite(
+        self,
+        insert,
+        symbol: str,
+        name: Optional[str],
+        sector: Optional[str],
+        notes: Optional[str],
+    ) -> int:
+        """单条语句插入收藏；symbol 冲突时不写入，再取已有记录的 ID"""
+        try:
+            stmt = (
+                insert(FavoriteStock)
+                .values(symbol=symbol, name=name, sector=sector, notes=notes)
+                .on_conflict_do_nothing(index_elements=["symbol"])
+                .returning(FavoriteStock.id)
+            )
+            favorite_id = self.session.execute(stmt).scalar()
+            if favorite_id is None:
+                favorite_id = (
+                    self.session.query(FavoriteStock.id)
+                    .filter(FavoriteStock.symbol == symbol)
+                    .scalar()
+                )
+                self.session.commit()
+                logger.warning(f"股票 {symbol} 已在收藏列表中")
+                return favorite_id
+
+            self.session.commit()
+            self._cache_update(add=symbol)
+            logger.info(f"已添加收藏股票: {symbol}")
+            return favorite_id
+        except Exception as e:
+            logger.error(f"添加收藏股票失败: {str(e)}")
+            self.session.rollback()
+            raise
+
     def remove_favorite(self, symbol: str) -> bool:
         """移除收藏股票"""
         try:
             favorite = self.find_one_by(symbol=symbol)
             if favorite:
                 self.delete(favorite)
+                self._cache_update(discard=symbol)
                 logger.info(f"已移除收藏股票: {symbol}")
                 return True
             return False
@@ -61,7 +119,46 @@ class FavoriteRepository(BaseRepository[FavoriteStock]):
 
     def is_favorite(self, symbol: str) -> bool:
         """检查是否已收藏"""
-        return self.exists(symbol=symbol)
+        return symbol in self._favorite_symbols()
+
+    def _favorite_symbols(self) -> Set[str]:
+        """返回收藏代码集合，缓存过期后整体从数据库重新加载"""
+        cls = type(self)
+        key = self._cache_key()
+        now = time.monotonic()
+        with cls._symbols_lock:
+            cached = cls._symbols_cache.get(key)
+            if cached is not None and now - cached[0] < cls._symbols_ttl:
+                return cached[1]
+            generation = cls._symbols_generation.get(key, 0)
+
+        symbols = {row[0] for row in self.session.query(FavoriteStock.symbol)}
+        with cls._symbols_lock:
+            # 查询期间有写入时不缓存，下次读取重新加载
+            if cls._symbols_generation.get(key, 0) == generation:
+                cls._symbols_cache[key] = (now, symbols)
+        return symbols
+
+    def _cache_key(self) -> URL:
+        return self.session.get_bind().url
+
+    def _cache_update(
+        self, add: Optional[str] = None, discard: Optional[str] = None
+    ) -> None:
+        """提交成功后同步缓存（未加载时只递增代数）"""
+        cls = type(self)
+        key = self._cache_key()
+        with cls._symbols_lock:
+            cls._symbols_generation[key] = cls._symbols_generation.get(key, 0) + 1
+            cached = cls._symbols_cache.get(key)
+            if cached is None:
+                return
+            updated = set(cached[1])
+            if add:
+                updated.add(add)
+            if discard:
+                updated.discard(discard)
+            cls._symbols_cache[key] = (cached[0], updated)
 
     def get_all_favorites(self) -> List[FavoriteStock]:
         """获取所有收藏股票"""
@@ -5,7 +5,9 @@ Optimization Repository - 参数优化仓储
 """
 
 import logging
-from typing import List, Optional
+import math
+from typing import Any, Dict, List, Optional
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.orm import Session
 from src.common.dataaccess import BaseRepository
 from ..models.optimization_record import OptimizationRecord
@@ -29,29 +31,127 @@ class OptimizationRepository(BaseRepository[OptimizationRecord]):
     ) -> int:
         """保存优化记录"""
         try:
-            record = OptimizationRecord(
-                symbol=symbol,
-                parameter_name=parameter_name,
-                parameter_value=parameter_value,
-                performance_metric=performance_metric,
-                metric_type=metric_type,
+            record_id = self.insert_returning_id(
+                {
+                    "symbol": symbol,
+                    "parameter_name": parameter_name,
+                    "parameter_value": parameter_value,
+                    "performance_metric": performance_metric,
+                    "metric_type": metric_type,
+                }
             )
-            record = self.add(record)
-            return record.id
+            self.session.commit()
+            return record_id
         except Exception as e:
             logger.error(f"保存优化记录失败: {str(e)}")
             self.rollback()
             raise
 
+    def save_many(self, records: List[Dict[str, Any]]) -> List[int]:
+        """
+        批量保存优化记录，单事务写入
+
+        参数扫描时先收集每次评估的记录，最后一次性写入，
+        避免逐条 save_optimization 的事务往返。
+
+        Args:
+            records: 字段名到值的字典列表（symbol、parameter_name 等）
+
+        Returns:
+            新记录的 ID 列表，与 records 顺序一致
+        """
+        if not records:
+            return []
+        try:
+            record_ids = self.insert_many_returning_ids(records)
+            self.session.commit()
+            logger.info(f"已批量保存优化记录: {len(record_ids)} 条")
+            return record_ids
+        except Exception as e:
+            logger.error(f"批量保存优化记录失败: {str(e)}")
+            self.session.rollback()
+            raise
+
     def get_history(
         self, symbol: str, parameter_name: Optional[str] = None
     ) -> List[OptimizationRecord]:
         """获取优化历史"""
-        query = self.session.query(OptimizationRecord).filter(
-            OptimizationRecord.symbol == symbol
+        # lambda_stmt 缓存编译结果，重复查询只替换绑定参数
+        stmt = lambda_stmt(
+            lambda: select(OptimizationRecord).where(OptimizationRecord.symbol == symbol)
         )
 
         if parameter_name:
-            query = query.filter(OptimizationRecord.parameter_name == parameter_name)
+            stmt += lambda s: s.where(OptimizationRecord.parameter_name == parameter_name)
+
+        stmt += lambda s: s.order_by(OptimizationRecord.created_at.desc())
+        return self.session.execute(stmt).scalars().all()
+
+    def get_parameter_aggregates(
+        self, symbol: str, parameter_name: str
+    ) -> List[Dict[str, Any]]:
+        """
+        按参数值分组统计优化指标（在数据库端聚合）
+
+        SQLite 没有内置 STDDEV：子查询先求每组均值，再在数据库端累加
+        与组均值之差的平方（两遍算法），避免平方和公式在指标值远大于
+        其波动时的精度损失；样本标准差在 Python 中开方得到。
 
-        return query.order_by(OptimizationRecord.created_at.desc()).all()
+        Returns:
+            每个参数值一行：parameter_value、mean、std、count、last_created_at
+        """
+        metric = OptimizationRecord.performance_metric
+        filters = (
+            OptimizationRecord.symbol == symbol,
+            OptimizationRecord.parameter_name == parameter_name,
+        )
+        groups = (
+            select(
+                OptimizationRecord.parameter_value,
+                func.avg(metric).label("mean"),
+                func.count(metric).label("count"),
+                func.max(OptimizationRecord.created_at).label("last_created_at"),
+            )
+            .where(*filters)
+            .group_by(OptimizationRecord.parameter_value)
+            .subquery()
+        )
+        deviation = metric - groups.c.mean
+        stmt = (
+            select(
+                groups.c.parameter_value,
+                groups.c.mean,
+                groups.c.count,
+                groups.c.last_created_at,
+                func.sum(deviation * deviation),
+            )
+            .join_from(
+                OptimizationRecord,
+                groups,
+                OptimizationRecord.parameter_value == groups.c.parameter_value,
+            )
+            .where(*filters)
+            .group_by(
+                groups.c.parameter_value,
+                groups.c.mean,
+                groups.c.count,
+                groups.c.last_created_at,
+            )
+        )
+
+        aggregates = []
+        rows = self.session.execute(stmt)
+        for value, mean, count, last_created, sum_sq_dev in rows:
+            std = None
+            if count > 1:
+                std = math.sqrt(sum_sq_dev / (count - 1))
+            aggregates.append(
+                {
+                    "parameter_value": value,
+                    "mean": mean,
+                    "std": std,
+                    "count": count,
+                    "last_created_at": last_created,
+                }
+            )
+        return aggregates
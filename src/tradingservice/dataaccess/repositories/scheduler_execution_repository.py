@@ -6,13 +6,25 @@
 
 from __future__ import annotations
 
-import json
+import csv
+import io
+import sys
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, Iterable, List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy.orm import (
+    Session,
+    joinedload,
+    raiseload,
+    selectinload,
+    undefer_group,
+)
+from sqlalchemy import desc, insert
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc
+from src.common.dataaccess import json_dumps
 
 from ..models import (
     AutomationRiskSnapshot,
@@ -21,6 +33,61 @@ from ..models import (
 )
 
 
+# 订单与风险快照的 Core INSERT 在模块加载时构建一次，调用时只绑定参数
+_ORDER_INSERT = insert(AutomationTaskOrder)
+_RISK_SNAPSHOT_INSERT = insert(AutomationRiskSnapshot)
+
+# 订单分批写入的行数；部分方言的单语句参数上限更低
+_ORDER_INSERT_BATCH = 1000
+_ORDER_INSERT_BATCH_BY_DIALECT = {"mssql": 500, "sqlite": 400}
+
+# PostgreSQL + psycopg2 下订单改走 COPY ... FROM STDIN（CSV），按列顺序写入；
+# created_at 为 Python 端默认值，COPY 不会触发，需要手工填充
+_ORDER_COPY_COLUMNS = (
+    "execution_id",
+    "order_id",
+    "symbol",
+    "action",
+    "status",
+    "quantity",
+    "filled_quantity",
+    "average_price",
+    "submitted_at",
+    "completed_at",
+    "raw_order_json",
+    "created_at",
+)
+_ORDER_COPY_SQL = (
+    f"COPY {AutomationTaskOrder.__tablename__} ({', '.join(_ORDER_COPY_COLUMNS)}) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+
+# Python 3.11 起 datetime.fromisoformat 原生支持 "Z" 后缀
+_FROMISO_SUPPORTS_Z = sys.version_info >= (3, 11)
+
+# 流式读取执行记录时每批加载的行数
+_EXECUTION_STREAM_CHUNK = 200
+
+# 券商订单字段别名 -> 订单列；同一列的别名按优先级排列，与原先的 `a or b or c` 取值顺序一致
+_ORDER_FIELD_ALIASES = {
+    "order_id": ("id", "order_id"),
+    "symbol": ("symbol", "instrument", "ticker"),
+    "action": ("side", "action", "type"),
+    "status": ("status",),
+    "quantity": ("quantity", "qty", "size"),
+    "filled_quantity": ("filled_quantity", "filled_qty", "filled_size"),
+    "average_price": ("filled_price", "average_price", "avg_fill_price"),
+    "submitted_at": ("submitted_at", "created_at"),
+    "completed_at": ("completed_at", "updated_at", "filled_at"),
+}
+# 展开为 别名 -> (列, 优先级, 是否为该列最后一个别名)
+_ORDER_KEY_ROUTES = {
+    alias: (column, rank, rank == len(aliases) - 1)
+    for column, aliases in _ORDER_FIELD_ALIASES.items()
+    for rank, alias in enumerate(aliases)
+}
+
+
 class SchedulerExecutionRepository:
     """Ã©ÂÂ¢Ã¥Ââ€˜Ã¨Â°Æ’Ã¥ÂºÂ¦Ã¦â€°Â§Ã¨Â¡Å’Ã§Â»â€œÃ¦Å¾Å“Ã§Å¡â€ž SQLAlchemy Ã¤Â¼Å¡Ã¨Â¯ÂÃ¥Â°ÂÃ¨Â£â€¦Ã£â‚¬â€š"""
 
@@ -48,51 +115,55 @@ class SchedulerExecutionRepository:
         orders: Iterable[Dict[str, Any]],
     ) -> AutomationTaskExecution:
         """Ã¤Â»Â¥Ã¤Âºâ€¹Ã¥Å Â¡Ã¦â€“Â¹Ã¥Â¼ÂÃ¤Â¿ÂÃ¥Â­ËœÃ¦â€°Â§Ã¨Â¡Å’Ã¨Â®Â°Ã¥Â½â€¢Ã£â‚¬ÂÃ¨Â®Â¢Ã¥Ââ€¢Ã¤Â¿Â¡Ã¦ÂÂ¯Ã¤Â¸Å½Ã©Â£Å½Ã©â„¢Â©Ã¥Â¿Â«Ã§â€¦Â§Ã£â‚¬â€š"""
-        execution = AutomationTaskExecution(
-            task_id=task_id,
-            task_name=task_name,
-            scheduler_status=scheduler_status,
-            orchestration_status=orchestration_status,
-            started_at=started_at,
-            completed_at=completed_at,
-            executed_signals=_safe_int(execution_summary.get("executed_signals")),
-            rejected_signals=_safe_int(execution_summary.get("rejected_signals")),
-            total_signals=_safe_int(
-                execution_summary.get("total_signals")
-                or execution_summary.get("total")
-            ),
-            order_count=_safe_int(execution_summary.get("orders")),
-            task_errors_json=_json_dump(task_errors or []),
-            symbol_details_json=_json_dump(symbol_details or {}),
-            summary_json=_json_dump(execution_summary or {}),
-            account_snapshot_json=_json_dump(account_snapshot or {}),
-            payload_json=_json_dump(payload or {}),
-        )
-
-        try:
-            self.session.add(execution)
-            self.session.flush()
-
-            order_models = self._build_order_models(execution.id, orders)
-            if order_models:
-                self.session.add_all(order_models)
-                execution.order_count = execution.order_count or len(order_models)
-
-            if risk_snapshot:
-                risk_model = self._build_risk_snapshot_model(
-                    execution.id, risk_snapshot
+        return self.record_executions(
+            [
+                dict(
+                    task_id=task_id,
+                    task_name=task_name,
+                    scheduler_status=scheduler_status,
+                    orchestration_status=orchestration_status,
+                    started_at=started_at,
+                    completed_at=completed_at,
+                    execution_summary=execution_summary,
+                    payload=payload,
+                    symbol_details=symbol_details,
+                    account_snapshot=account_snapshot,
+                    risk_snapshot=risk_snapshot,
+                    task_errors=task_errors,
+                    orders=orders,
                 )
-                self.session.add(risk_model)
+            ]
+        )[0]
 
+    def record_executions(
+        self, executions: Iterable[Dict[str, Any]]
+    ) -> List[AutomationTaskExecution]:
+        """
+        Persist many executions in one transaction with a single commit.
+
+        Each item takes the keyword arguments of ``record_execution``. Replays
+        and batch reconciliation avoid one commit (and fsync) per execution;
+        any failure rolls the whole batch back.
+        """
+        recorded: List[AutomationTaskExecution] = []
+        try:
+            for execution in executions:
+                recorded.append(self._stage_execution(**execution))
+            # 会话 expire_on_commit=False，提交后实例仍可用；不再 refresh，
+            # 省去回读执行行及其 selectin 关系的额外查询
             self.session.commit()
-            self.session.refresh(execution)
-            return execution
         except Exception:
             self.session.rollback()
             raise
+        return recorded
 
     def close(self) -> None:
-        """Close the underlying SQLAlchemy session."""
+        """
+        Close the underlying SQLAlchemy session.
+
+        This only returns the connection to the engine's pool; the pooled
+        connection itself stays open for the next checkout.
+        """
         self.session.close()
 
     def fetch_recent_executions(
@@ -102,15 +173,66 @@ class SchedulerExecutionRepository:
         task_id: Optional[str] = None,
         scheduler_status: Optional[str] = None,
         orchestration_status: Optional[str] = None,
+        include_payloads: bool = False,
     ) -> List[AutomationTaskExecution]:
-        """Retrieve recent automation task executions ordered by recency."""
+        """
+        Retrieve recent automation task executions ordered by recency.
+
+        The JSON payload columns are deferred; pass ``include_payloads=True``
+        to load them in the same query instead of one lazy load per row.
+        """
         limit = max(1, min(int(limit or 50), 500))
+        query = self._recent_executions_query(
+            task_id=task_id,
+            scheduler_status=scheduler_status,
+            orchestration_status=orchestration_status,
+            include_payloads=include_payloads,
+        )
+        return query.limit(limit).all()
 
+    def iter_recent_executions(
+        self,
+        *,
+        limit: Optional[int] = None,
+        task_id: Optional[str] = None,
+        scheduler_status: Optional[str] = None,
+        orchestration_status: Optional[str] = None,
+        include_payloads: bool = False,
+        chunk_size: int = _EXECUTION_STREAM_CHUNK,
+    ) -> Iterator[AutomationTaskExecution]:
+        """
+        Stream recent executions in chunks of ``chunk_size`` rows.
+
+        Unlike ``fetch_recent_executions`` the result is not capped at 500 and
+        never fully materialized, so exports over long histories keep a
+        bounded memory footprint. ``limit=None`` streams every match.
+        """
+        query = self._recent_executions_query(
+            task_id=task_id,
+            scheduler_status=scheduler_status,
+            orchestration_status=orchestration_status,
+            include_payloads=include_payloads,
+        )
+        if limit is not None:
+            query = query.limit(max(1, int(limit)))
+        yield from query.yield_per(chunk_size)
+
+    def _recent_executions_query(
+        self,
+        *,
+        task_id: Optional[str],
+        scheduler_status: Optional[str],
+        orchestration_status: Optional[str],
+        include_payloads: bool,
+    ):
         query = (
             self.session.query(AutomationTaskExecution)
             .options(
-                joinedload(AutomationTaskExecution.orders),
+                # 一对多用 IN 批量加载，避免笛卡尔积；一对一直接 JOIN，省一次查询
+                selectinload(AutomationTaskExecution.orders),
                 joinedload(AutomationTaskExecution.risk_snapshot),
+                # 其余关系一律禁止懒加载，新增关系忘记预加载时立即报错而非逐行 N+1
+                raiseload("*"),
             )
             .order_by(
                 desc(AutomationTaskExecution.started_at),
@@ -118,6 +240,9 @@ class SchedulerExecutionRepository:
             )
         )
 
+        if include_payloads:
+            query = query.options(undefer_group("payloads"))
+
         if task_id:
             query = query.filter(AutomationTaskExecution.task_id == task_id)
 
@@ -131,72 +256,143 @@ class SchedulerExecutionRepository:
                 AutomationTaskExecution.orchestration_status == orchestration_status
             )
 
-        return query.limit(limit).all()
+        return query
 
 
     # ------------------------------------------------------------------ #
     # Ã¥â€ â€¦Ã©Æ’Â¨Ã¨Â¾â€¦Ã¥Å Â©Ã¦â€“Â¹Ã¦Â³â€¢
     # ------------------------------------------------------------------ #
-    def _build_order_models(
+    def _stage_execution(
+        self,
+        *,
+        task_id: str,
+        task_name: str,
+        scheduler_status: str,
+        orchestration_status: str,
+        started_at: Optional[datetime],
+        completed_at: Optional[datetime],
+        execution_summary: Dict[str, Any],
+        payload: Dict[str, Any],
+        symbol_details: Dict[str, Any],
+        account_snapshot: Optional[Dict[str, Any]],
+        risk_snapshot: Optional[Dict[str, Any]],
+        task_errors: Optional[Iterable[str]],
+        orders: Iterable[Dict[str, Any]],
+    ) -> AutomationTaskExecution:
+        """Add one execution, its orders and risk snapshot to the current transaction."""
+        summary = execution_summary or {}
+        execution = AutomationTaskExecution(
+            task_id=task_id,
+            task_name=task_name,
+            scheduler_status=scheduler_status,
+            orchestration_status=orchestration_status,
+            started_at=started_at,
+            completed_at=completed_at,
+            executed_signals=_safe_int(summary.get("executed_signals")),
+            rejected_signals=_safe_int(summary.get("rejected_signals")),
+            total_signals=_safe_int(
+                summary.get("total_signals") or summary.get("total")
+            ),
+            order_count=_safe_int(summary.get("orders")),
+            task_errors_json=list(task_errors or []),
+            symbol_details_json=symbol_details or {},
+            summary_json=summary,
+            account_snapshot_json=account_snapshot or {},
+            payload_json=payload or {},
+        )
+
+        self.session.add(execution)
+        self.session.flush()
+
+        # 订单走 Core 多值 INSERT（PostgreSQL 下为 COPY），跳过 ORM 对象构建
+        # 与逐行 unit-of-work；按批流式写入，避免一次性物化全部订单
+        batch_size = self._order_batch_size()
+        order_rows = self._iter_order_rows(execution.id, orders)
+        write_chunk = (
+            self._copy_order_rows
+            if self._supports_order_copy()
+            else lambda rows: self.session.execute(_ORDER_INSERT, rows)
+        )
+        inserted = 0
+        while True:
+            chunk = list(islice(order_rows, batch_size))
+            if not chunk:
+                break
+            write_chunk(chunk)
+            inserted += len(chunk)
+        if inserted:
+            execution.order_count = execution.order_count or inserted
+
+        if risk_snapshot:
+            self.session.execute(
+                _RISK_SNAPSHOT_INSERT,
+                self._risk_snapshot_row(execution.id, risk_snapshot),
+            )
+
+        return execution
+
+    def _order_batch_size(self) -> int:
+        bind = self.session.get_bind()
+        return _ORDER_INSERT_BATCH_BY_DIALECT.get(
+            bind.dialect.name, _ORDER_INSERT_BATCH
+        )
+
+    def _supports_order_copy(self) -> bool:
+        dialect = self.session.get_bind().dialect
+        return dialect.name == "postgresql" and dialect.driver == "psycopg2"
+
+    def _copy_order_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Write one batch of order rows with COPY on the session's connection.
+
+        Runs inside the current transaction, so it commits or rolls back
+        together with the execution row. Unquoted empty CSV fields load as
+        NULL; _safe_str never yields an empty string, so None maps cleanly.
+        """
+        created_at = datetime.utcnow()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            row["raw_order_json"] = json_dumps(row["raw_order_json"])
+            row["created_at"] = created_at
+            writer.writerow(row[column] for column in _ORDER_COPY_COLUMNS)
+        buffer.seek(0)
+
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(_ORDER_COPY_SQL, buffer)
+        finally:
+            cursor.close()
+
+    def _iter_order_rows(
         self, execution_id: int, orders: Iterable[Dict[str, Any]]
-    ) -> List[AutomationTaskOrder]:
-        models: List[AutomationTaskOrder] = []
+    ) -> Iterator[Dict[str, Any]]:
         for order in orders or []:
             if not isinstance(order, dict):
                 continue
 
-            order_id = str(order.get("id") or order.get("order_id") or "").strip()
+            fields = _resolve_order_fields(order)
+            order_id = str(fields.get("order_id") or "").strip()
             if not order_id:
                 continue
 
-            models.append(
-                AutomationTaskOrder(
-                    execution_id=execution_id,
-                    order_id=order_id,
-                    symbol=_safe_str(
-                        order.get("symbol")
-                        or order.get("instrument")
-                        or order.get("ticker")
-                    ),
-                    action=_safe_str(
-                        order.get("side")
-                        or order.get("action")
-                        or order.get("type")
-                    ),
-                    status=_safe_str(order.get("status")),
-                    quantity=_safe_float(
-                        order.get("quantity")
-                        or order.get("qty")
-                        or order.get("size")
-                    ),
-                    filled_quantity=_safe_float(
-                        order.get("filled_quantity")
-                        or order.get("filled_qty")
-                        or order.get("filled_size")
-                    ),
-                    average_price=_safe_float(
-                        order.get("filled_price")
-                        or order.get("average_price")
-                        or order.get("avg_fill_price")
-                    ),
-                    submitted_at=_parse_datetime(
-                        order.get("submitted_at") or order.get("created_at")
-                    ),
-                    completed_at=_parse_datetime(
-                        order.get("completed_at")
-                        or order.get("updated_at")
-                        or order.get("filled_at")
-                    ),
-                    raw_order_json=_json_dump(order),
-                )
+            yield dict(
+                execution_id=execution_id,
+                order_id=order_id,
+                symbol=_safe_str(fields.get("symbol")),
+                action=_safe_str(fields.get("action")),
+                status=_safe_str(fields.get("status")),
+                quantity=_safe_float(fields.get("quantity")),
+                filled_quantity=_safe_float(fields.get("filled_quantity")),
+                average_price=_safe_float(fields.get("average_price")),
+                submitted_at=_parse_datetime(fields.get("submitted_at")),
+                completed_at=_parse_datetime(fields.get("completed_at")),
+                raw_order_json=order,
             )
 
-        return models
-
-    def _build_risk_snapshot_model(
+    def _risk_snapshot_row(
         self, execution_id: int, snapshot: Dict[str, Any]
-    ) -> AutomationRiskSnapshot:
-        return AutomationRiskSnapshot(
+    ) -> Dict[str, Any]:
+        return dict(
             execution_id=execution_id,
             equity=_safe_float(snapshot.get("equity")),
             cash=_safe_float(snapshot.get("cash")),
@@ -208,28 +404,13 @@ class SchedulerExecutionRepository:
                 snapshot.get("maintenance_margin")
                 or snapshot.get("maintenanceMargin")
             ),
-            raw_metrics_json=_json_dump(snapshot),
+            raw_metrics_json=snapshot,
         )
 
 
 # ---------------------------------------------------------------------- #
 # Ã¥Â·Â¥Ã¥â€¦Â·Ã¥â€¡Â½Ã¦â€¢Â°
 # ---------------------------------------------------------------------- #
-def _json_dump(data: Any) -> str:
-    try:
-        return json.dumps(data, ensure_ascii=False, default=_json_default)
-    except TypeError:
-        return json.dumps(str(data), ensure_ascii=False)
-
-
-def _json_default(value: Any) -> Any:
-    if isinstance(value, (datetime,)):
-        return value.isoformat()
-    if isinstance(value, Decimal):
-        return float(value)
-    return str(value)
-
-
 def _parse_datetime(value: Any) -> Optional[datetime]:
     if isinstance(value, datetime):
         return value
@@ -241,17 +422,45 @@ def _parse_datetime(value: Any) -> Optional[datetime]:
         except (ValueError, OSError):
             return None
     if isinstance(value, str):
-        candidate = value.strip()
-        if not candidate:
-            return None
-        candidate = candidate.replace("Z", "+00:00")
-        try:
-            return datetime.fromisoformat(candidate)
-        except ValueError:
-            return None
+        return _parse_iso(value)
     return None
 
 
+# 同一次执行中的订单时间戳大量重复，缓存解析结果（datetime 不可变，可安全共享）
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> Optional[datetime]:
+    candidate = value
+    if candidate[:1].isspace() or candidate[-1:].isspace():
+        candidate = candidate.strip()
+    if not candidate:
+        return None
+    if not _FROMISO_SUPPORTS_Z:
+        candidate = candidate.replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(candidate)
+    except ValueError:
+        return None
+
+
+def _resolve_order_fields(order: Dict[str, Any]) -> Dict[str, Any]:
+    """Route an order's keys to their columns in a single pass over the dict."""
+    fields: Dict[str, Any] = {}
+    ranks: Dict[str, int] = {}
+    for key, value in order.items():
+        route = _ORDER_KEY_ROUTES.get(key)
+        if route is None:
+            continue
+        column, rank, is_last = route
+        if value:
+            if rank < ranks.get(column, len(_ORDER_KEY_ROUTES)):
+                fields[column] = value
+                ranks[column] = rank
+        elif is_last and column not in fields:
+            # `a or b or c` yields the last alias when every alias is falsy
+            fields[column] = value
+    return fields
+
+
 def _safe_float(value: Any) -> Optional[float]:
     if value is None:
         return None
@@ -266,6 +475,8 @@ def _safe_float(value: Any) -> Optional[float]:
 def _safe_int(value: Any) -> Optional[int]:
     if value is None:
         return None
+    if type(value) is int:
+        return value
     try:
         return int(value)
     except (TypeError, ValueError):
@@ -2,18 +2,17 @@
 Strategy Comparison Repository - 策略对比数据仓库
 """
 
-import json
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from src.common.dataaccess import BaseRepository
+from typing import Iterable, List, Optional, Dict, Any
+from sqlalchemy.orm import Session
+from src.common.dataaccess import BaseRepository, json_dumps, json_loads
 from ..models.strategy_comparison import StrategyComparison
 
 
 class StrategyComparisonRepository(BaseRepository[StrategyComparison]):
     """策略对比数据仓库"""
 
-    def __init__(self):
-        super().__init__(StrategyComparison)
+    def __init__(self, session: Session):
+        super().__init__(StrategyComparison, session)
 
     def save_comparison(
         self,
@@ -36,13 +35,33 @@ class StrategyComparisonRepository(BaseRepository[StrategyComparison]):
         """
         comparison = StrategyComparison(
             comparison_name=comparison_name,
-            symbols=json.dumps(symbols),
-            results=json.dumps(results),
+            symbols=json_dumps(symbols),
+            results=json_dumps(results),
             best_performer=best_performer,
-            created_at=datetime.now(),
         )
         return self.add(comparison)
 
+    def save_comparisons(self, items: Iterable[Dict[str, Any]]) -> int:
+        """
+        批量保存策略对比结果（单事务）
+
+        Args:
+            items: 每项包含 comparison_name、symbols、results、best_performer
+
+        Returns:
+            写入的记录数
+        """
+        rows = [
+            {
+                "comparison_name": item["comparison_name"],
+                "symbols": json_dumps(item["symbols"]),
+                "results": json_dumps(item["results"]),
+                "best_performer": item.get("best_performer"),
+            }
+            for item in items
+        ]
+        return self.bulk_insert(rows)
+
     def get_comparison_history(
         self, comparison_name: Optional[str] = None, limit: int = 10
     ) -> List[StrategyComparison]:
@@ -85,7 +104,7 @@ class StrategyComparisonRepository(BaseRepository[StrategyComparison]):
         Returns:
             解析后的结果字典
         """
-        return json.loads(comparison.results)
+        return json_loads(comparison.results)
 
     def parse_symbols(self, comparison: StrategyComparison) -> List[str]:
         """
@@ -97,4 +116,4 @@ class StrategyComparisonRepository(BaseRepository[StrategyComparison]):
         Returns:
             股票代码列表
         """
-        return json.loads(comparison.symbols)
+        return json_loads(comparison.symbols)
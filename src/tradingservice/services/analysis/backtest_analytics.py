@@ -5,18 +5,37 @@ Backtest Analytics - 回测数据分析工具
 """
 
 import logging
+import numpy as np
 import pandas as pd
 from typing import Optional, Dict, Any
 from ...dataaccess import get_backtest_repository, get_optimization_repository
 
 logger = logging.getLogger(__name__)
 
+# 与仓储 *_tuples 查询返回的列顺序一致
+_BEST_STRATEGY_COLUMNS = [
+    "id",
+    "strategy_name",
+    "total_return",
+    "sharpe_ratio",
+    "max_drawdown",
+    "win_rate",
+    "total_trades",
+    "created_at",
+]
+_STRATEGY_METRIC_COLUMNS = ["total_return", "sharpe_ratio", "max_drawdown", "win_rate"]
+
 
 class BacktestAnalytics:
     """
     回测数据分析工具
 
     使用 Repository 层访问数据，提供各种分析功能。
+    每次分析结束即归还数据库连接；用完后调用 close()，或以 with 语句使用。
+
+    Example:
+        with BacktestAnalytics() as analytics:
+            print(analytics.generate_performance_report('AAPL'))
     """
 
     def __init__(self, db_path: Optional[str] = None):
@@ -68,52 +87,41 @@ class BacktestAnalytics:
         try:
             repo = self._get_optimization_repository()
 
-            # 获取优化历史数据
-            records = repo.get_parameter_history(symbol, parameter_name)
+            # 在数据库端按参数值分组聚合，只取回每组一行
+            aggregates = repo.get_parameter_aggregates(symbol, parameter_name)
 
-            if not records:
+            if not aggregates:
                 logger.warning(f"未找到参数优化数据: {symbol}, {parameter_name}")
                 return None
 
-            # 转换为 DataFrame
-            data = []
-            for record in records:
-                data.append(
-                    {
-                        "parameter_value": record.parameter_value,
-                        "performance_metric": record.performance_metric,
-                        "metric_type": record.metric_type,
-                        "created_at": record.created_at,
-                    }
-                )
-
-            df = pd.DataFrame(data)
-
-            # 按参数值分组分析
             analysis = (
-                df.groupby("parameter_value")
-                .agg(
+                pd.DataFrame(
                     {
-                        "performance_metric": ["mean", "std", "count"],
-                        "created_at": "max",
-                    }
+                        "performance_metric_mean": [a["mean"] for a in aggregates],
+                        "performance_metric_std": [a["std"] for a in aggregates],
+                        "performance_metric_count": [a["count"] for a in aggregates],
+                        "created_at_max": [a["last_created_at"] for a in aggregates],
+                    },
+                    index=pd.Index(
+                        [a["parameter_value"] for a in aggregates],
+                        name="parameter_value",
+                    ),
                 )
+                .sort_index()
                 .round(4)
             )
-
-            # 重命名列
-            analysis.columns = [
-                "_".join(col).strip() for col in analysis.columns.values
-            ]
+            record_count = int(analysis["performance_metric_count"].sum())
 
             logger.info(
-                f"参数敏感性分析完成: {symbol}, {parameter_name}, 记录数: {len(df)}"
+                f"参数敏感性分析完成: {symbol}, {parameter_name}, 记录数: {record_count}"
             )
             return analysis
 
         except Exception as e:
             logger.error(f"参数敏感性分析失败: {e}")
             return None
+        finally:
+            self._release()
 
     def generate_performance_report(self, symbol: str) -> str:
         """
@@ -135,60 +143,27 @@ class BacktestAnalytics:
         try:
             repo = self._get_backtest_repository()
 
-            # 获取历史回测数据
-            history = repo.get_backtest_history(symbol, limit=100)
+            # 获取历史回测数据（查询结果直接按列构建 DataFrame）
+            df = repo.get_history_frame(symbol, limit=100)
 
-            if not history:
+            if df.empty:
                 return f"📊 {symbol} 性能分析报告\n\n⚠️ 暂无历史数据"
 
-            # 转换为 DataFrame
-            data = []
-            for record in history:
-                data.append(
-                    {
-                        "total_return": record.total_return,
-                        "sharpe_ratio": record.sharpe_ratio,
-                        "max_drawdown": record.max_drawdown,
-                        "win_rate": record.win_rate,
-                        "total_trades": record.total_trades,
-                    }
-                )
-
-            df = pd.DataFrame(data)
+            # 计算统计指标：一次聚合得到各项统计（pandas 默认跳过 NaN），
+            # 全为空时结果为 NaN，统一转为 0
+            returns = df["total_return"]
+            desc = returns.agg(["mean", "max", "min", "std"])
+            avg_sharpe = df["sharpe_ratio"].mean()
+            success_rate = (returns > 0).mean() if returns.notna().any() else 0.0
 
-            # 计算统计指标
             performance_stats = {
                 "total_tests": len(df),
-                "avg_return": (
-                    df["total_return"].mean()
-                    if not df["total_return"].isna().all()
-                    else 0
-                ),
-                "best_return": (
-                    df["total_return"].max()
-                    if not df["total_return"].isna().all()
-                    else 0
-                ),
-                "worst_return": (
-                    df["total_return"].min()
-                    if not df["total_return"].isna().all()
-                    else 0
-                ),
-                "avg_sharpe": (
-                    df["sharpe_ratio"].mean()
-                    if not df["sharpe_ratio"].isna().all()
-                    else 0
-                ),
-                "stability": (
-                    df["total_return"].std()
-                    if not df["total_return"].isna().all()
-                    else 0
-                ),
-                "success_rate": (
-                    (df["total_return"] > 0).mean()
-                    if not df["total_return"].isna().all()
-                    else 0
-                ),
+                "avg_return": float(np.nan_to_num(desc["mean"], nan=0.0)),
+                "best_return": float(np.nan_to_num(desc["max"], nan=0.0)),
+                "worst_return": float(np.nan_to_num(desc["min"], nan=0.0)),
+                "avg_sharpe": float(np.nan_to_num(avg_sharpe, nan=0.0)),
+                "stability": float(np.nan_to_num(desc["std"], nan=0.0)),
+                "success_rate": float(success_rate),
             }
 
             # 生成报告
@@ -210,6 +185,8 @@ class BacktestAnalytics:
         except Exception as e:
             logger.error(f"生成性能报告失败: {e}")
             return f"📊 {symbol} 性能分析报告\n\n❌ 生成失败: {str(e)}"
+        finally:
+            self._release()
 
     def get_best_strategies(
         self, symbol: str, metric: str = "sharpe_ratio", top_n: int = 5
@@ -231,35 +208,24 @@ class BacktestAnalytics:
             repo = self._get_backtest_repository()
 
             # 获取最佳结果
-            best_results = repo.get_best_results(symbol, metric=metric, limit=top_n)
+            best_results = repo.get_best_results_tuples(
+                symbol, metric=metric, limit=top_n
+            )
 
             if not best_results:
                 logger.warning(f"未找到回测结果: {symbol}")
                 return pd.DataFrame()
 
-            # 转换为 DataFrame
-            data = []
-            for record in best_results:
-                data.append(
-                    {
-                        "id": record.id,
-                        "strategy_name": record.strategy_name,
-                        "total_return": record.total_return,
-                        "sharpe_ratio": record.sharpe_ratio,
-                        "max_drawdown": record.max_drawdown,
-                        "win_rate": record.win_rate,
-                        "total_trades": record.total_trades,
-                        "created_at": record.created_at,
-                    }
-                )
-
-            df = pd.DataFrame(data)
+            # 行元组直接构建 DataFrame，不经过 ORM 实例
+            df = pd.DataFrame(best_results, columns=_BEST_STRATEGY_COLUMNS)
             logger.info(f"获取最佳策略完成: {symbol}, 指标: {metric}, 数量: {len(df)}")
             return df
 
         except Exception as e:
             logger.error(f"获取最佳策略失败: {e}")
             return pd.DataFrame()
+        finally:
+            self._release()
 
     def compare_strategies(self, symbol: str, strategy_names: list) -> Dict[str, Any]:
         """
@@ -277,21 +243,13 @@ class BacktestAnalytics:
             comparison = {}
 
             for strategy_name in strategy_names:
-                results = repo.get_strategy_results(symbol, strategy_name, limit=50)
+                results = repo.get_strategy_metric_tuples(
+                    symbol, strategy_name, limit=50
+                )
 
                 if results:
                     # 转换为 DataFrame 计算统计
-                    data = [
-                        {
-                            "total_return": r.total_return,
-                            "sharpe_ratio": r.sharpe_ratio,
-                            "max_drawdown": r.max_drawdown,
-                            "win_rate": r.win_rate,
-                        }
-                        for r in results
-                    ]
-
-                    df = pd.DataFrame(data)
+                    df = pd.DataFrame(results, columns=_STRATEGY_METRIC_COLUMNS)
 
                     comparison[strategy_name] = {
                         "count": len(df),
@@ -308,10 +266,23 @@ class BacktestAnalytics:
         except Exception as e:
             logger.error(f"策略比较失败: {e}")
             return {}
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        """结束本次读取事务，将连接归还连接池（仓储仍可继续使用）"""
+        for repo in (self._backtest_repo, self._optimization_repo):
+            if repo is not None:
+                repo.session.close()
+
+    def close(self) -> None:
+        """释放仓储会话，将连接归还连接池"""
+        self._release()
+        self._backtest_repo = None
+        self._optimization_repo = None
+
+    def __enter__(self) -> "BacktestAnalytics":
+        return self
 
-    def __del__(self):
-        """清理资源"""
-        if self._backtest_repo:
-            self._backtest_repo.session.close()
-        if self._optimization_repo:
-            self._optimization_repo.session.close()
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -8,7 +8,8 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.common.logger import TradingLogger
 from src.tradingagent.core import IBroker
@@ -22,6 +23,24 @@ from .real_time_monitor import RealTimeMonitor
 from ..orchestration import TaskManager
 
 
+# 进程内共享的经纪商实例，按 (类型, 参数) 区分，相同凭据的运行时复用同一连接；
+# 值为 (实例, 引用计数)，最后一个运行时 close() 时断开并移除
+_BrokerKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+_shared_brokers: Dict[_BrokerKey, Tuple[IBroker, int]] = {}
+_shared_brokers_lock = threading.Lock()
+
+
+def _resolved_broker(broker_id: Optional[str]) -> Tuple[str, Dict[str, Any]]:
+    """
+    解析经纪商类型与参数。
+
+    不做缓存：解析只涉及配置查找与环境变量读取，每次返回新的参数字典，
+    凭据轮换对之后创建的运行时立即生效；昂贵的连接建立由共享实例复用承担。
+    """
+    broker_type, params = app_config.resolve_broker(broker_id)
+    return broker_type, dict(params)
+
+
 class LiveTradingRuntime:
     """
     实时交易运行时：将实时行情监控与任务管理/执行管线绑定至指定经纪商。
@@ -35,9 +54,14 @@ class LiveTradingRuntime:
         data_provider: Optional[RealTimeDataProvider] = None,
         provider: Optional[str] = None,
         poll_interval: int = 5,
+        shared_broker: bool = False,
     ) -> None:
         self.logger = TradingLogger(__name__)
         self._broker_id = broker_id
+        self._shared_broker = shared_broker
+        self._broker_key: Optional[_BrokerKey] = None
+        # 仅释放自行创建的经纪商，外部注入的实例由调用方管理
+        self._owns_broker = broker is None
         self.provider = provider or app_config.get(
             "market_data.default_provider", "alpaca"
         )
@@ -55,7 +79,8 @@ class LiveTradingRuntime:
             data_provider=self.data_provider, task_manager=self.task_manager
         )
 
-        self._symbols: List[str] = []
+        # 启动时固定为只读元组，status 直接返回，无需防御性拷贝
+        self._symbols: Tuple[str, ...] = ()
         self._strategies: Dict[str, BaseStrategy] = {}
 
         self.logger.log_system_event(
@@ -71,7 +96,7 @@ class LiveTradingRuntime:
         """
         启动指定标的与策略的实时监控。
         """
-        self._symbols = list(symbols)
+        self._symbols = tuple(symbols)
         self._strategies = dict(strategies or {})
 
         self.monitor.start_monitoring(symbols, strategies)
@@ -86,13 +111,40 @@ class LiveTradingRuntime:
         self.monitor.stop_monitoring()
         self.logger.log_system_event("Live trading runtime stopped")
 
+    def close(self) -> None:
+        """
+        停止监控并释放经纪商连接。
+
+        共享经纪商按引用计数释放，最后一个使用者关闭时才断开连接；
+        外部注入的经纪商不做处理。可重复调用。
+        """
+        self.stop()
+        if not self._owns_broker:
+            return
+        self._owns_broker = False
+
+        if self._broker_key is None:
+            self.broker.disconnect()
+            return
+
+        key, self._broker_key = self._broker_key, None
+        with _shared_brokers_lock:
+            broker, refs = _shared_brokers[key]
+            if refs > 1:
+                _shared_brokers[key] = (broker, refs - 1)
+                return
+            del _shared_brokers[key]
+        broker.disconnect()
+
     def status(self) -> Dict[str, object]:
         """
         返回当前运行时的状态快照。
+
+        ``symbols`` 为只读元组，调用方如需修改请自行转换为列表。
         """
         runtime_status = self.monitor.get_monitoring_status()
         runtime_status["provider"] = self.provider
-        runtime_status["symbols"] = list(self._symbols)
+        runtime_status["symbols"] = self._symbols
         runtime_status["broker_connected"] = self.broker.is_connected()
         return runtime_status
 
@@ -109,5 +161,15 @@ class LiveTradingRuntime:
         return list(self.monitor.execution_log)
 
     def _create_broker(self) -> IBroker:
-        broker_type, params = app_config.resolve_broker(self._broker_id)
-        return BrokerFactory.create(broker_type, **params)
+        broker_type, params = _resolved_broker(self._broker_id)
+        if not self._shared_broker:
+            return BrokerFactory.create(broker_type, **params)
+
+        key = (broker_type, tuple(sorted((k, repr(v)) for k, v in params.items())))
+        with _shared_brokers_lock:
+            broker, refs = _shared_brokers.get(key, (None, 0))
+            if broker is None:
+                broker = BrokerFactory.create(broker_type, **params)
+            _shared_brokers[key] = (broker, refs + 1)
+        self._broker_key = key
+        return broker
@@ -98,7 +98,11 @@ class ReportGenerator:
             .filter(model.created_at >= start_datetime, model.created_at <= end_datetime)
             .order_by(model.created_at.asc())
         )
-        return list(query.all())
+        try:
+            return list(query.all())
+        finally:
+            # 仓储在实例上长期持有，查询后结束读事务，归还连接
+            session.close()
 
     def generate_daily_report(self, target_date: date = None) -> str:
         """生成日报"""
@@ -8,9 +8,10 @@ import os
 import time
 import threading
 import json
-from datetime import datetime, time as dt_time, timedelta
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time, timedelta, timezone
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 import schedule
@@ -70,6 +71,25 @@ class ScheduledTask:  # pylint: disable=too-many-instance-attributes
     next_run: Optional[datetime] = None
     status: TaskStatus = TaskStatus.PENDING
     results: Dict[str, Any] = None
+    task_kind: str = "io"  # "io" | "cpu" | "hybrid", selects the execution pool
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+# Frequency -> unbound schedule job; resolved with one dict lookup per task.
+# Market-hours frequencies start at the 09:30 open; the schedule library has
+# no monthly interval, so MONTHLY falls back to daily.
+_JOB_BUILDERS: Dict[ScheduleFrequency, Callable[[], schedule.Job]] = {
+    ScheduleFrequency.MINUTE: lambda: schedule.every().minute,
+    ScheduleFrequency.EVERY_5_MINUTES: lambda: schedule.every(5).minutes,
+    ScheduleFrequency.EVERY_15_MINUTES: lambda: schedule.every(15).minutes,
+    ScheduleFrequency.EVERY_30_MINUTES: lambda: schedule.every(30).minutes,
+    ScheduleFrequency.HOUR: lambda: schedule.every().hour,
+    ScheduleFrequency.EVERY_2_HOURS: lambda: schedule.every(2).hours,
+    ScheduleFrequency.EVERY_4_HOURS: lambda: schedule.every(4).hours,
+    ScheduleFrequency.DAILY: lambda: schedule.every().day.at("09:30"),
+    ScheduleFrequency.WEEKLY: lambda: schedule.every().monday.at("09:30"),
+    ScheduleFrequency.MONTHLY: lambda: schedule.every().day,
+}
 
 
 class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
@@ -77,6 +97,9 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
 
     DEFAULT_WINDOW_START = dt_time(9, 30)
     DEFAULT_WINDOW_END = dt_time(16, 0)
+    MUTABLE_TASK_FIELDS = (
+        "name", "frequency", "symbols", "strategies", "enabled", "task_kind"
+    )
 
     def __init__(self, config_file: str = "config/scheduler_config.json"):
         """
@@ -90,12 +113,20 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
         self.notification_manager = NotificationManager()
         self.task_manager = OrchestrationTaskManager()
         self.execution_repo_factory = get_scheduler_execution_repository
+        # Execution records are encoded and inserted by one background worker
+        # so task threads do not block on it; a single worker keeps them in order.
+        # Created on first use; stop_scheduler() and close() drain and release it
+        self._persist_executor: Optional[ThreadPoolExecutor] = None
+        self._persist_lock = threading.Lock()
         self.trading_window_config = self._load_trading_window_config()
 
         # ä»»åŠ¡å­˜å‚¨
         self.scheduled_tasks: Dict[str, ScheduledTask] = {}
         self.running_tasks: Dict[str, threading.Thread] = {}
 
+        # Bumped whenever tasks or their run state change; lets callers cache
+        self.revision = 0
+
         # è°ƒåº¦å™¨çŠ¶æ€
         self.is_running = False
         self.scheduler_thread = None
@@ -140,6 +171,12 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
                             task_data["next_run"] = datetime.fromisoformat(
                                 task_data["next_run"]
                             )
+                        if "created_at" in task_data and isinstance(
+                            task_data["created_at"], str
+                        ):
+                            task_data["created_at"] = datetime.fromisoformat(
+                                task_data["created_at"]
+                            )
 
                         task = ScheduledTask(**task_data)
                         self.scheduled_tasks[task.task_id] = task
@@ -191,6 +228,7 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
 
     def save_config(self):
         """ä¿å­˜é…ç½®åˆ°æ–‡ä»¶"""
+        self.revision += 1
         try:
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
 
@@ -207,6 +245,7 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
                         "symbols": task.symbols,
                         "strategies": task.strategies,
                         "enabled": task.enabled,
+                        "task_kind": task.task_kind,
                         "last_run": (
                             task.last_run.isoformat() if task.last_run else None
                         ),
@@ -219,6 +258,7 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
                             else task.status
                         ),
                         "results": task.results,
+                        "created_at": task.created_at.isoformat(),
                     }
                     for task in self.scheduled_tasks.values()
                 ]
@@ -282,6 +322,49 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
             self.logger.error("ç§»é™¤è®¡åˆ’ä»»åŠ¡å¤±è´¥: %s", str(e))
             return False
 
+    def modify_task(self, task_id: str, **changes: Any) -> bool:
+        """
+        Update a scheduled task in place.
+
+        Only the supplied fields change; the task keeps its id and history,
+        and its schedule is rebuilt only when frequency or enabled changes.
+        None values are ignored: none of these fields may be cleared, and a
+        PATCH body can carry explicit nulls.
+
+        Args:
+            task_id: task id
+            **changes: new values for name, frequency, symbols, strategies, enabled
+
+        Returns:
+            Whether the task exists
+        """
+        task = self.scheduled_tasks.get(task_id)
+        if task is None:
+            self.logger.warning("Task not found: %s", task_id)
+            return False
+
+        changed = {
+            key: value
+            for key, value in changes.items()
+            if key in self.MUTABLE_TASK_FIELDS
+            and value is not None
+            and getattr(task, key) != value
+        }
+        if not changed:
+            return True
+
+        for key, value in changed.items():
+            setattr(task, key, value)
+
+        if "frequency" in changed or "enabled" in changed:
+            schedule.clear(task_id)
+            if self.is_running:
+                self._schedule_task(task)
+
+        self.save_config()
+        self.logger.info("Modified task %s: %s", task_id, ", ".join(changed))
+        return True
+
     def pause_task(self, task_id: str) -> bool:
         """
         æš‚åœä»»åŠ¡
@@ -345,34 +428,18 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
         def job_func():
             self.execute_task(task.task_id)
 
-        if task.frequency == ScheduleFrequency.MINUTE:
-            schedule.every().minute.do(job_func)
-        elif task.frequency == ScheduleFrequency.EVERY_5_MINUTES:
-            schedule.every(5).minutes.do(job_func)
-        elif task.frequency == ScheduleFrequency.EVERY_15_MINUTES:
-            schedule.every(15).minutes.do(job_func)
-        elif task.frequency == ScheduleFrequency.EVERY_30_MINUTES:
-            schedule.every(30).minutes.do(job_func)
-        elif task.frequency == ScheduleFrequency.HOUR:
-            schedule.every().hour.do(job_func)
-        elif task.frequency == ScheduleFrequency.EVERY_2_HOURS:
-            schedule.every(2).hours.do(job_func)
-        elif task.frequency == ScheduleFrequency.EVERY_4_HOURS:
-            schedule.every(4).hours.do(job_func)
-        elif task.frequency == ScheduleFrequency.DAILY:
-            schedule.every().day.at("09:30").do(job_func)  # å¼€ç›˜æ—¶é—´
-        elif task.frequency == ScheduleFrequency.WEEKLY:
-            schedule.every().monday.at("09:30").do(job_func)  # å‘¨ä¸€å¼€ç›˜
-        elif task.frequency == ScheduleFrequency.MONTHLY:
-            # æ³¨æ„ï¼šschedule åº“ä¸ç›´æŽ¥æ”¯æŒ monthï¼Œè¿™é‡Œç”¨ day æ›¿ä»£
-            schedule.every().day.do(job_func)
-
-    def execute_task(self, task_id: str):
+        build_job = _JOB_BUILDERS.get(task.frequency)
+        if build_job is not None:
+            build_job().do(job_func).tag(task.task_id)
+
+    def execute_task(self, task_id: str, wait: bool = False):
         """
         æ‰§è¡ŒæŒ‡å®šä»»åŠ¡
 
         Args:
             task_id: ä»»åŠ¡ID
+            wait: run the task on the calling thread and return when it
+                finishes, instead of starting a dedicated task thread
         """
         if task_id not in self.scheduled_tasks:
             self.logger.error("ä»»åŠ¡ä¸å­˜åœ¨: %s", task_id)
@@ -384,12 +451,20 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
             self.logger.warning("ä»»åŠ¡æ­£åœ¨è¿è¡Œ: %s", task.name)
             return
 
+        if wait:
+            # Caller-owned thread (e.g. a bounded pool worker): block for the run
+            self.running_tasks[task_id] = threading.current_thread()
+            self.revision += 1
+            self._run_task(task)
+            return
+
         # åˆ›å»ºä»»åŠ¡çº¿ç¨‹
         task_thread = threading.Thread(
             target=self._run_task, args=(task,), name=f"Task-{task_id}"
         )
 
         self.running_tasks[task_id] = task_thread
+        self.revision += 1
         task_thread.start()
 
     def _run_task(self, task: ScheduledTask):
@@ -465,6 +540,7 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
 
             task.status = TaskStatus.RUNNING
             task.last_run = datetime.now()
+            self.revision += 1
 
             orchestrated_task = self.task_manager.get_task(task.task_id)
             if orchestrated_task is None:
@@ -727,14 +803,10 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
         if completed_at is None:
             completed_at = getattr(scheduled_task, "last_run", None)
 
-        try:
-            repository = factory()
-        except Exception as factory_error:  # pragma: no cover - defensive logging
-            self.logger.error("åˆå§‹åŒ–è°ƒåº¦æ‰§è¡Œä»“å‚¨å¤±è´¥: %s", factory_error)
-            return
-
-        try:
-            repository.record_execution(
+        self._persistence_pool().submit(
+            self._write_execution_record,
+            factory,
+            dict(
                 task_id=scheduled_task.task_id,
                 task_name=scheduled_task.name,
                 scheduler_status=scheduler_status,
@@ -748,7 +820,37 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
                 risk_snapshot=risk_snapshot if isinstance(risk_snapshot, dict) else None,
                 task_errors=deduped_errors,
                 orders=orders_list,
-            )
+            ),
+        )
+
+    def _persistence_pool(self) -> ThreadPoolExecutor:
+        """Return the execution-record worker, creating it on first use."""
+        with self._persist_lock:
+            if self._persist_executor is None:
+                self._persist_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="execution-persist"
+                )
+            return self._persist_executor
+
+    def _drain_persistence(self) -> None:
+        """Write the queued execution records, then release the worker thread."""
+        with self._persist_lock:
+            executor, self._persist_executor = self._persist_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _write_execution_record(
+        self, factory: Callable[[], Any], record: Dict[str, Any]
+    ) -> None:
+        """Insert one execution record; runs on the persistence worker."""
+        try:
+            repository = factory()
+        except Exception as factory_error:  # pragma: no cover - defensive logging
+            self.logger.error("åˆå§‹åŒ–è°ƒåº¦æ‰§è¡Œä»“å‚¨å¤±è´¥: %s", factory_error)
+            return
+
+        try:
+            repository.record_execution(**record)
         except Exception as persist_error:  # pragma: no cover - defensive logging
             self.logger.error("æŒä¹…åŒ–è°ƒåº¦æ‰§è¡Œç»“æžœå¤±è´¥: %s", persist_error)
         finally:
@@ -765,7 +867,13 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
         scheduler_status: Optional[str] = None,
         orchestration_status: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Fetch persisted automation execution history."""
+        """
+        Fetch persisted automation execution history.
+
+        History is eventually consistent: runs are written by the background
+        persistence worker, so a run that has just finished may not be
+        listed yet.
+        """
         factory = getattr(self, "execution_repo_factory", None)
         if not callable(factory):
             return []
@@ -778,6 +886,7 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
                 task_id=task_id,
                 scheduler_status=scheduler_status,
                 orchestration_status=orchestration_status,
+                include_payloads=True,
             )
             return [self._serialize_execution_record(record) for record in records]
         except Exception as exc:  # pragma: no cover - defensive logging
@@ -795,14 +904,22 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
         def _safe_json_load(value: Any, default: Any):
             if not value:
                 return default
+            if not isinstance(value, (str, bytes)):
+                return value
             try:
                 return json.loads(value)
             except (TypeError, ValueError):
                 return default
 
-        def _iso(value: Any) -> Optional[str]:
+        def _epoch_ms(value: Any, local: bool = False) -> Optional[int]:
+            # Naive values are UTC (utcnow column defaults, broker ISO times)
+            # unless ``local``: run start/end times come from datetime.now()
             if isinstance(value, datetime):
-                return value.isoformat()
+                if value.tzinfo is None and local:
+                    value = value.astimezone()
+                elif value.tzinfo is None:
+                    value = value.replace(tzinfo=timezone.utc)
+                return int(value.timestamp() * 1000)
             return None
 
         summary = _safe_json_load(getattr(record, "summary_json", None), {})
@@ -829,8 +946,8 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
                 "quantity": getattr(order, "quantity", None),
                 "filled_quantity": getattr(order, "filled_quantity", None),
                 "average_price": getattr(order, "average_price", None),
-                "submitted_at": _iso(getattr(order, "submitted_at", None)),
-                "completed_at": _iso(getattr(order, "completed_at", None)),
+                "submitted_at_ms": _epoch_ms(getattr(order, "submitted_at", None)),
+                "completed_at_ms": _epoch_ms(getattr(order, "completed_at", None)),
                 "raw": raw_order,
             })
 
@@ -843,7 +960,7 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
                 "buying_power": getattr(risk_model, "buying_power", None),
                 "exposure": getattr(risk_model, "exposure", None),
                 "maintenance_margin": getattr(risk_model, "maintenance_margin", None),
-                "captured_at": _iso(getattr(risk_model, "captured_at", None)),
+                "captured_at_ms": _epoch_ms(getattr(risk_model, "captured_at", None)),
                 "raw": _safe_json_load(getattr(risk_model, "raw_metrics_json", None), {}),
             }
 
@@ -853,8 +970,10 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
             "task_name": getattr(record, "task_name", None),
             "scheduler_status": getattr(record, "scheduler_status", None),
             "orchestration_status": getattr(record, "orchestration_status", None),
-            "started_at": _iso(getattr(record, "started_at", None)),
-            "completed_at": _iso(getattr(record, "completed_at", None)),
+            "started_at_ms": _epoch_ms(getattr(record, "started_at", None), local=True),
+            "completed_at_ms": _epoch_ms(
+                getattr(record, "completed_at", None), local=True
+            ),
             "executed_signals": getattr(record, "executed_signals", None),
             "rejected_signals": getattr(record, "rejected_signals", None),
             "total_signals": getattr(record, "total_signals", None),
@@ -866,7 +985,7 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
             "payload": payload,
             "orders": orders_payload,
             "risk_snapshot": risk_payload,
-            "created_at": _iso(getattr(record, "created_at", None)),
+            "created_at_ms": _epoch_ms(getattr(record, "created_at", None)),
         }
 
     def _generate_report(self, task: ScheduledTask, summary: Optional[Dict[str, Any]] = None) -> str:
@@ -1059,8 +1178,18 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
         # æ¸…é™¤æ‰€æœ‰è°ƒåº¦ä»»åŠ¡
         schedule.clear()
 
+        # Write queued execution records and release the worker thread
+        self._drain_persistence()
+
         self.logger.info("è‡ªåŠ¨åŒ–äº¤æ˜“è°ƒåº¦å™¨å·²åœæ­¢")
 
+    def close(self):
+        """Stop the scheduler if it is running and flush pending execution records."""
+        if self.is_running:
+            self.stop_scheduler()
+        else:
+            self._drain_persistence()
+
     def cancel_task(self, task_id: str):
         """
         å–æ¶ˆæ­£åœ¨è¿è¡Œçš„ä»»åŠ¡
@@ -1073,6 +1202,7 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
             if task_id in self.scheduled_tasks:
                 self.scheduled_tasks[task_id].status = TaskStatus.CANCELLED
             del self.running_tasks[task_id]
+            self.revision += 1
             self.logger.info("ä»»åŠ¡å·²å–æ¶ˆ: %s", task_id)
 
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
@@ -1085,11 +1215,27 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
         Returns:
             ä»»åŠ¡çŠ¶æ€ä¿¡æ¯
         """
-        if task_id not in self.scheduled_tasks:
+        task = self.scheduled_tasks.get(task_id)
+        if task is None:
             return None
+        return self._task_status_dict(task, task_id in self.running_tasks)
 
-        task = self.scheduled_tasks[task_id]
+    def get_all_task_statuses(self) -> List[Dict[str, Any]]:
+        """
+        Status dicts for every task, built in a single pass.
 
+        Returns:
+            List of task status dicts, as returned by get_task_status
+        """
+        running = set(self.running_tasks)
+        return [
+            self._task_status_dict(task, task_id in running)
+            for task_id, task in list(self.scheduled_tasks.items())
+        ]
+
+    @staticmethod
+    def _task_status_dict(task: ScheduledTask, is_running: bool) -> Dict[str, Any]:
+        """Build the status dict of a single task."""
         # å¤„ç† frequency å¯èƒ½æ˜¯å­—ç¬¦ä¸²æˆ–æžšä¸¾çš„æƒ…å†µ
         frequency_value = (
             task.frequency.value
@@ -1104,11 +1250,15 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
             "task_id": task.task_id,
             "name": task.name,
             "frequency": frequency_value,
+            "symbols": list(task.symbols),
+            "strategies": list(task.strategies),
             "status": status_value,
             "enabled": task.enabled,
+            "task_kind": task.task_kind,
+            "created_at": task.created_at.isoformat(),
             "last_run": task.last_run.isoformat() if task.last_run else None,
             "next_run": task.next_run.isoformat() if task.next_run else None,
-            "is_running": task_id in self.running_tasks,
+            "is_running": is_running,
         }
 
     def list_all_tasks(self) -> List[Dict[str, Any]]:
@@ -1118,7 +1268,7 @@ class AutoTradingScheduler:  # pylint: disable=too-many-instance-attributes
         Returns:
             ä»»åŠ¡åˆ—è¡¨
         """
-        return [self.get_task_status(task_id) for task_id in self.scheduled_tasks]
+        return self.get_all_task_statuses()
 
 
 if __name__ == "__main__":
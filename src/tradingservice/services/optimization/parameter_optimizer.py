@@ -185,30 +185,22 @@ class ParameterOptimizer:
         if not hasattr(self, 'optimization_results') or self.optimization_results.empty:
             return False
 
+        repo = None
         try:
             # Import here to avoid circular imports
             # pylint: disable=import-outside-toplevel
             from src.tradingservice import get_backtest_repository
 
             repo = get_backtest_repository()
-            saved_count = 0
 
             # 保存前10个最佳结果
             top_results = self.optimization_results.head(10)
+            saved_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-            for _, row in top_results.iterrows():
+            rows = []
+            for rank, (_, row) in enumerate(top_results.iterrows(), start=1):
                 params = row['params']
 
-                # 准备结果数据
-                results = {
-                    'total_return': row['total_return'],
-                    'sharpe_ratio': row['sharpe_ratio'],
-                    'max_drawdown': row['max_drawdown'],
-                    'win_rate': row['win_rate'],
-                    'total_trades': row['total_trades'],
-                    'volatility': row['volatility']
-                }
-
                 # 准备回测配置
                 backtest_config = {
                     'start_date': None,
@@ -222,30 +214,26 @@ class ParameterOptimizer:
                     'optimization_method': 'GridSearch',
                     'parameter_space_size': len(self.optimization_results),
                     'optimization_target': 'sharpe_ratio',
-                    'optimization_rank': saved_count + 1
+                    'optimization_rank': rank
                 }
 
-                # 保存到数据库
-                from src.tradingservice.dataaccess.models import BacktestResult
-                
-                backtest_record = BacktestResult(
-                    symbol=symbol,
-                    strategy_name="MeanReversionStrategy",
-                    strategy_params=params,
-                    total_return=results['total_return'],
-                    sharpe_ratio=results['sharpe_ratio'],
-                    max_drawdown=results['max_drawdown'],
-                    win_rate=results['win_rate'],
-                    total_trades=results['total_trades'],
-                    volatility=results['volatility'],
-                    backtest_config=backtest_config,
-                    notes=f"参数优化结果 #{saved_count + 1} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                )
-                
-                backtest_id = repo.add(backtest_record)
-
-                if backtest_id:
-                    saved_count += 1
+                rows.append({
+                    'symbol': symbol,
+                    'strategy_name': "MeanReversionStrategy",
+                    'strategy_params': params,
+                    'total_return': float(row['total_return']),
+                    'sharpe_ratio': float(row['sharpe_ratio']),
+                    'max_drawdown': float(row['max_drawdown']),
+                    'win_rate': float(row['win_rate']),
+                    'total_trades': int(row['total_trades']),
+                    'volatility': float(row['volatility']),
+                    'backtest_config': backtest_config,
+                    'notes': f"参数优化结果 #{rank} - {saved_at}"
+                })
+
+            # 单事务批量写入，并同步收藏表的最新回测指标；
+            # 每个标的以最后一行为准，按名次倒序写入使 #1 成为最新结果
+            saved_count = len(repo.save_results(rows[::-1]))
 
             print(f"✅ 已保存 {saved_count} 个优化结果到数据库")
             return saved_count > 0
@@ -253,6 +241,9 @@ class ParameterOptimizer:
         except Exception as e:
             print(f"❌ 保存优化结果失败: {e}")
             return False
+        finally:
+            if repo is not None:
+                repo.session.close()
 
     def export_results(self, filename: str = None) -> str:
         """导出优化结果到CSV文件"""
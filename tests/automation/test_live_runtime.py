@@ -7,11 +7,14 @@ from __future__ import annotations
 
 import importlib.machinery
 import importlib.util
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
@@ -189,3 +192,54 @@ def test_live_trading_runtime_wires_monitor_and_broker():
 
     runtime.stop()
     assert provider.is_connected is False
+
+
+@pytest.fixture
+def broker_env(monkeypatch):
+    # 以环境变量模拟凭据，记录每次创建经纪商时收到的参数
+    created: List[Dict[str, Any]] = []
+
+    def resolve_broker(broker_id):
+        return "stub", {"api_key": os.environ["STUB_BROKER_KEY"]}
+
+    def create(broker_type, **params):
+        created.append(params)
+        return StubBroker()
+
+    monkeypatch.setenv("STUB_BROKER_KEY", "key-1")
+    monkeypatch.setattr(live_runtime_module.app_config, "resolve_broker", resolve_broker)
+    monkeypatch.setattr(live_runtime_module.BrokerFactory, "create", create)
+    return created
+
+
+def test_live_trading_runtime_picks_up_rotated_credentials(broker_env, monkeypatch):
+    first = LiveTradingRuntime(data_provider=StubProvider())
+    monkeypatch.setenv("STUB_BROKER_KEY", "key-2")
+    second = LiveTradingRuntime(data_provider=StubProvider())
+
+    assert broker_env == [{"api_key": "key-1"}, {"api_key": "key-2"}]
+
+    first.close()
+    second.close()
+    assert not first.broker.is_connected()
+    assert not second.broker.is_connected()
+
+
+def test_shared_broker_is_released_by_last_runtime(broker_env):
+    first = LiveTradingRuntime(data_provider=StubProvider(), shared_broker=True)
+    second = LiveTradingRuntime(data_provider=StubProvider(), shared_broker=True)
+
+    assert first.broker is second.broker
+    assert len(broker_env) == 1
+
+    first.close()
+    first.close()
+    assert second.broker.is_connected()
+
+    second.close()
+    assert not second.broker.is_connected()
+    assert live_runtime_module._shared_brokers == {}
+
+    third = LiveTradingRuntime(data_provider=StubProvider(), shared_broker=True)
+    assert third.broker is not second.broker
+    third.close()
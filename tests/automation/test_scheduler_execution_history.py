@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+调度执行历史：API 模型直接校验 ORM 记录、后台持久化的单元测试。
+"""
+
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict
+
+import pytest
+import schedule
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+API_ROOT = PROJECT_ROOT / "src" / "tradingservice"
+for path in (PROJECT_ROOT, API_ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+def _bootstrap_api_packages() -> None:
+    # 构建最小包结构，避免 api/__init__ 导入整个应用（日志文件、全部路由）
+    package_roots: Dict[str, Path] = {
+        "api": API_ROOT / "api",
+        "api.models": API_ROOT / "api" / "models",
+    }
+
+    for pkg_name, pkg_path in package_roots.items():
+        if pkg_name not in sys.modules:
+            module = importlib.util.module_from_spec(
+                importlib.machinery.ModuleSpec(pkg_name, loader=None)
+            )
+            module.__file__ = str(pkg_path / "__init__.py")
+            module.__path__ = [str(pkg_path)]
+            sys.modules[pkg_name] = module
+
+
+_bootstrap_api_packages()
+
+from src.common.dataaccess import DatabaseEngine, OrmBase
+from src.tradingservice.dataaccess import SchedulerExecutionRepository
+from src.tradingservice.services.automation import scheduler as scheduler_module
+from src.tradingservice.services.automation.scheduler import AutoTradingScheduler
+from api.models.scheduler_models import HISTORY_LIST_ADAPTER
+
+
+class StubTaskManager:
+    """替代编排层 TaskManager，避免构造真实券商连接。"""
+
+
+@pytest.fixture
+def engine(tmp_path):
+    db = DatabaseEngine(f"sqlite:///{(tmp_path / 'business.db').as_posix()}")
+    db.create_tables(OrmBase)
+    yield db
+    db.dispose()
+
+
+@pytest.fixture
+def repository(engine):
+    repo = SchedulerExecutionRepository(engine.get_session())
+    yield repo
+    repo.close()
+
+
+def test_history_adapter_validates_orm_rows_with_orders(repository):
+    started_at = datetime(2024, 3, 1, 9, 30)
+    repository.record_execution(
+        task_id="daily",
+        task_name="Daily run",
+        scheduler_status="completed",
+        orchestration_status="completed",
+        started_at=started_at,
+        completed_at=None,
+        execution_summary={"total": 2},
+        payload={"source": "test"},
+        symbol_details={},
+        account_snapshot=None,
+        risk_snapshot={"equity": 1000, "cash": 400},
+        task_errors=["late fill", ""],
+        orders=[
+            {
+                "id": "o-1",
+                "symbol": "AAPL",
+                "side": "buy",
+                "qty": 10,
+                "submitted_at": "2024-03-01T14:31:00Z",
+            },
+        ],
+    )
+
+    rows = repository.fetch_recent_executions(include_payloads=True)
+    (record,) = HISTORY_LIST_ADAPTER.validate_python(rows)
+
+    assert record.task_id == "daily"
+    assert record.started_at_ms == int(started_at.astimezone().timestamp() * 1000)
+    assert record.completed_at_ms is None
+    assert record.summary == {"total": 2}
+    assert record.account_snapshot == {}
+    assert record.task_errors == ["late fill"]
+    assert record.created_at_ms is not None
+
+    (order,) = record.orders
+    assert (order.order_id, order.symbol, order.action, order.quantity) == (
+        "o-1",
+        "AAPL",
+        "buy",
+        10.0,
+    )
+    assert order.submitted_at == datetime(2024, 3, 1, 14, 31, tzinfo=timezone.utc)
+    assert order.raw["qty"] == 10
+
+    assert record.risk_snapshot.equity == 1000.0
+    assert record.risk_snapshot.raw == {"equity": 1000, "cash": 400}
+
+
+def test_history_adapter_still_accepts_serialized_dicts():
+    (record,) = HISTORY_LIST_ADAPTER.validate_python(
+        [
+            {
+                "run_id": "r1",
+                "task_id": "daily",
+                "task_name": "Daily run",
+                "scheduler_status": "completed",
+                "orchestration_status": "completed",
+                "started_at_ms": 1_700_000_000_000,
+                "executed_signals": 1,
+                "rejected_signals": 0,
+                "total_signals": 1,
+                "order_count": 0,
+                "task_errors": [],
+                "summary": {},
+                "symbol_details": {},
+                "account_snapshot": {},
+                "payload": {},
+                "orders": [],
+                "risk_snapshot": None,
+            }
+        ]
+    )
+
+    assert record.started_at_ms == 1_700_000_000_000
+    assert "started_at_ms" in record.model_dump()
+
+
+def test_close_flushes_queued_records_and_releases_worker(engine, tmp_path, monkeypatch):
+    monkeypatch.setattr(scheduler_module, "OrchestrationTaskManager", StubTaskManager)
+    scheduler = AutoTradingScheduler(config_file=str(tmp_path / "scheduler_config.json"))
+    scheduler.execution_repo_factory = lambda: SchedulerExecutionRepository(
+        engine.get_session()
+    )
+    task = scheduler.scheduled_tasks["daily_analysis"]
+    run = SimpleNamespace(result={"orders": []}, status="completed", error=None)
+
+    try:
+        for _ in range(2):
+            scheduler._persist_execution_result(
+                scheduled_task=task, orchestrated_task=run, execution_summary={}
+            )
+            scheduler.close()
+            assert scheduler._persist_executor is None
+
+        history = scheduler.get_execution_history(task_id="daily_analysis")
+        assert len(history) == 2
+    finally:
+        schedule.clear()
+        scheduler.close()
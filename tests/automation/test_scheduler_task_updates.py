@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+任务列表 ETag/304 与 AutoTradingScheduler 原地修改任务的单元测试。
+"""
+
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+import schedule
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+API_ROOT = PROJECT_ROOT / "src" / "tradingservice"
+for path in (PROJECT_ROOT, API_ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+def _bootstrap_api_packages() -> None:
+    # 构建最小包结构，避免 api/__init__ 导入整个应用（日志文件、全部路由）
+    package_roots: Dict[str, Path] = {
+        "api": API_ROOT / "api",
+        "api.models": API_ROOT / "api" / "models",
+        "api.services": API_ROOT / "api" / "services",
+        "api.routes": API_ROOT / "api" / "routes",
+    }
+
+    for pkg_name, pkg_path in package_roots.items():
+        if pkg_name not in sys.modules:
+            module = importlib.util.module_from_spec(
+                importlib.machinery.ModuleSpec(pkg_name, loader=None)
+            )
+            module.__file__ = str(pkg_path / "__init__.py")
+            module.__path__ = [str(pkg_path)]
+            sys.modules[pkg_name] = module
+
+
+_bootstrap_api_packages()
+
+from src.tradingservice.services.automation import scheduler as scheduler_module
+from src.tradingservice.services.automation.scheduler import (
+    AutoTradingScheduler,
+    ScheduleFrequency,
+)
+from api.models.task_models import TaskResponse, TaskUpdateRequest
+from api.routes import tasks as task_routes
+from api.services.task_service import TaskService
+
+
+class StubTaskManager:
+    """替代编排层 TaskManager，避免构造真实券商连接。"""
+
+
+@pytest.fixture
+def scheduler(tmp_path, monkeypatch):
+    monkeypatch.setattr(scheduler_module, "OrchestrationTaskManager", StubTaskManager)
+    instance = AutoTradingScheduler(
+        config_file=str(tmp_path / "scheduler_config.json")
+    )
+    yield instance
+    schedule.clear()
+    instance.close()
+
+
+# ---------------------------------------------------------------------- #
+# modify_task
+# ---------------------------------------------------------------------- #
+def test_modify_task_updates_only_supplied_fields(scheduler):
+    task = scheduler.scheduled_tasks["daily_analysis"]
+    revision = scheduler.revision
+
+    assert scheduler.modify_task(
+        "daily_analysis", name="Renamed", symbols=["AAPL"], run_count=9
+    )
+
+    assert scheduler.scheduled_tasks["daily_analysis"] is task
+    assert task.name == "Renamed"
+    assert task.symbols == ["AAPL"]
+    assert task.frequency is ScheduleFrequency.DAILY
+    assert not hasattr(task, "run_count")
+    assert scheduler.revision > revision
+
+
+def test_modify_task_persists_changes(scheduler):
+    scheduler.modify_task("weekly_report", strategies=["ma"], enabled=False)
+
+    reloaded = AutoTradingScheduler(config_file=scheduler.config_file)
+    try:
+        task = reloaded.scheduled_tasks["weekly_report"]
+        assert task.strategies == ["ma"]
+        assert task.enabled is False
+    finally:
+        reloaded.close()
+
+
+def test_modify_task_without_changes_keeps_revision(scheduler):
+    task = scheduler.scheduled_tasks["daily_analysis"]
+    revision = scheduler.revision
+
+    assert scheduler.modify_task("daily_analysis", name=task.name)
+    assert scheduler.revision == revision
+
+
+def test_modify_task_unknown_task_returns_false(scheduler):
+    assert scheduler.modify_task("missing", name="x") is False
+
+
+def test_modify_task_reschedules_on_frequency_change(scheduler):
+    scheduler.is_running = True
+    scheduler._schedule_task(scheduler.scheduled_tasks["daily_analysis"])
+
+    scheduler.modify_task("daily_analysis", frequency=ScheduleFrequency.HOUR)
+    (job,) = schedule.get_jobs("daily_analysis")
+    assert job.unit == "hours"
+
+    scheduler.modify_task("daily_analysis", enabled=False)
+    assert schedule.get_jobs("daily_analysis") == []
+
+
+def test_update_task_ignores_explicit_nulls(scheduler):
+    scheduler.is_running = True
+    scheduler._schedule_task(scheduler.scheduled_tasks["daily_analysis"])
+    service = TaskService(scheduler)
+    task = scheduler.scheduled_tasks["daily_analysis"]
+    name, revision = task.name, scheduler.revision
+
+    request = TaskUpdateRequest.model_validate(
+        {"name": None, "frequency": None, "enabled": None}
+    )
+    updated = service.update_task("daily_analysis", request)
+
+    assert task.name == updated.name == name
+    assert task.frequency is ScheduleFrequency.DAILY
+    assert scheduler.revision == revision
+    assert len(schedule.get_jobs("daily_analysis")) == 1
+    assert service.get_all_tasks().total == 2
+
+
+# ---------------------------------------------------------------------- #
+# 任务列表 ETag / 304
+# ---------------------------------------------------------------------- #
+def test_task_list_response_is_cached_per_revision(scheduler):
+    service = TaskService(scheduler)
+
+    etag, tasks = service.get_all_tasks_with_etag()
+    assert tasks.total == 2
+    for task in tasks.tasks:
+        TaskResponse.model_validate(task.model_dump())
+
+    assert service.get_all_tasks_with_etag(etag) == (etag, None)
+    assert service.get_all_tasks_with_etag()[1] is tasks
+
+    scheduler.modify_task("daily_analysis", name="Renamed")
+    new_etag, refreshed = service.get_all_tasks_with_etag(etag)
+    assert new_etag != etag
+    assert "Renamed" in {task.name for task in refreshed.tasks}
+
+
+def test_task_list_route_answers_304_for_current_etag(scheduler):
+    app = FastAPI()
+    app.include_router(task_routes.router)
+    service = TaskService(scheduler)
+    app.dependency_overrides[task_routes.get_task_service] = lambda: service
+    client = TestClient(app)
+
+    first = client.get("/api/tasks")
+    assert first.status_code == 200
+    assert first.json()["total"] == 2
+    etag = first.headers["etag"]
+
+    cached = client.get("/api/tasks", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    scheduler.modify_task("daily_analysis", symbols=["NVDA"])
+    changed = client.get("/api/tasks", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+BacktestAnalytics 性能报告的单元测试（SQLite 临时库）。
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.common.dataaccess import DatabaseEngine, OrmBase
+from src.tradingservice.dataaccess import BacktestRepository
+from src.tradingservice.services.analysis.backtest_analytics import BacktestAnalytics
+
+
+@pytest.fixture
+def analytics(tmp_path):
+    db = DatabaseEngine(f"sqlite:///{(tmp_path / 'business.db').as_posix()}")
+    db.create_tables(OrmBase)
+    instance = BacktestAnalytics()
+    instance._backtest_repo = BacktestRepository(db.get_session())
+    yield instance
+    instance.close()
+    db.dispose()
+
+
+def _save(repo: BacktestRepository, symbol: str, total_return, sharpe_ratio) -> None:
+    repo.save_result(
+        symbol,
+        "MeanReversionStrategy",
+        {},
+        {"total_return": total_return, "sharpe_ratio": sharpe_ratio},
+    )
+
+
+def test_performance_report_summarizes_symbol_history(analytics):
+    repo = analytics._backtest_repo
+    _save(repo, "AAPL", 0.10, 1.0)
+    _save(repo, "AAPL", -0.05, 0.5)
+    _save(repo, "AAPL", 0.25, 2.1)
+    _save(repo, "MSFT", 0.90, 3.0)
+
+    report = analytics.generate_performance_report("AAPL")
+
+    assert "测试次数: 3" in report
+    assert "平均收益: 10.00%" in report
+    assert "最佳收益: 25.00%" in report
+    assert "最差收益: -5.00%" in report
+    assert "平均夏普: 1.200" in report
+    assert "收益稳定性: 0.1500" in report
+    assert "成功率: 66.7%" in report
+
+
+def test_performance_report_without_history(analytics):
+    report = analytics.generate_performance_report("AAPL")
+
+    assert "暂无历史数据" in report
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+业务库仓储层的单元测试（SQLite 临时库）。
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from sqlalchemy import event
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.common.dataaccess import DatabaseEngine, OrmBase, json_dumps, json_loads
+from src.tradingservice.dataaccess import (
+    AutomationRiskSnapshot,
+    AutomationTaskExecution,
+    AutomationTaskOrder,
+    BacktestRepository,
+    FavoriteRepository,
+    FavoriteStock,
+    OptimizationRecord,
+    OptimizationRepository,
+    SchedulerExecutionRepository,
+)
+from src.tradingservice.dataaccess.repositories.scheduler_execution_repository import (
+    _ORDER_FIELD_ALIASES,
+    _resolve_order_fields,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    db = DatabaseEngine(f"sqlite:///{(tmp_path / 'business.db').as_posix()}")
+    db.create_tables(OrmBase)
+    yield db
+    db.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    db_session = engine.get_session()
+    yield db_session
+    db_session.close()
+
+
+def _backtest_row(symbol: str, index: int, **overrides: Any) -> Dict[str, Any]:
+    row = {
+        "symbol": symbol,
+        "strategy_name": f"strategy_{index}",
+        "strategy_params": {"window": index},
+        "backtest_config": {},
+        "total_return": (index * 7 % 5) / 10,
+        "sharpe_ratio": float(index),
+        "max_drawdown": -index / 100,
+        "win_rate": (index % 3) / 3,
+        "volatility": 0.2,
+        "total_trades": index,
+        "notes": "",
+    }
+    row.update(overrides)
+    return row
+
+
+def _optimization_record(parameter_value: str, metric: float) -> Dict[str, Any]:
+    return {
+        "symbol": "AAPL",
+        "parameter_name": "bb_period",
+        "parameter_value": parameter_value,
+        "performance_metric": metric,
+        "metric_type": "sharpe_ratio",
+    }
+
+
+def _execution(task_id: str, orders: Any, **overrides: Any) -> Dict[str, Any]:
+    execution = {
+        "task_id": task_id,
+        "task_name": f"task {task_id}",
+        "scheduler_status": "completed",
+        "orchestration_status": "completed",
+        "started_at": None,
+        "completed_at": None,
+        "execution_summary": {"executed_signals": 2, "total": 3},
+        "payload": {},
+        "symbol_details": {},
+        "account_snapshot": None,
+        "risk_snapshot": None,
+        "task_errors": None,
+        "orders": orders,
+    }
+    execution.update(overrides)
+    return execution
+
+
+# ---------------------------------------------------------------------- #
+# BaseRepository
+# ---------------------------------------------------------------------- #
+def test_bulk_insert_writes_all_rows(session):
+    repo = OptimizationRepository(session)
+
+    assert repo.bulk_insert([]) == 0
+    inserted = repo.bulk_insert(
+        [_optimization_record(str(value), value / 10) for value in range(3)]
+    )
+
+    assert inserted == 3
+    assert repo.count(symbol="AAPL") == 3
+
+
+def test_insert_returning_id_returns_key_without_committing(engine, session):
+    repo = BacktestRepository(session)
+
+    first_id = repo.insert_returning_id(_backtest_row("AAPL", 1))
+    second_id = repo.insert_returning_id(_backtest_row("AAPL", 2))
+    assert first_id != second_id
+    assert repo.get_by_id(second_id).strategy_name == "strategy_2"
+
+    session.rollback()
+    assert repo.count() == 0
+
+
+# ---------------------------------------------------------------------- #
+# OptimizationRepository
+# ---------------------------------------------------------------------- #
+@pytest.mark.parametrize("executemany_returning", [True, False])
+def test_save_many_returns_ids_in_input_order(
+    engine, session, monkeypatch, executemany_returning
+):
+    monkeypatch.setattr(
+        engine.engine.dialect, "insert_executemany_returning", executemany_returning
+    )
+    repo = OptimizationRepository(session)
+    records = [_optimization_record(str(value), value / 10) for value in (5, 3, 9, 1)]
+
+    record_ids = repo.save_many(records)
+
+    assert len(record_ids) == len(records)
+    for record_id, record in zip(record_ids, records):
+        stored = session.get(OptimizationRecord, record_id)
+        assert stored.parameter_value == record["parameter_value"]
+
+
+def test_parameter_aggregates_std_is_stable_for_large_metrics(session):
+    repo = OptimizationRepository(session)
+    metrics = [1e9 + offset for offset in (0.001, 0.002, 0.003, 0.004)]
+    repo.save_many([_optimization_record("20", metric) for metric in metrics])
+
+    (aggregate,) = repo.get_parameter_aggregates("AAPL", "bb_period")
+
+    assert aggregate["count"] == 4
+    assert aggregate["std"] == pytest.approx(0.00129099, rel=1e-3)
+
+
+# ---------------------------------------------------------------------- #
+# BacktestRepository
+# ---------------------------------------------------------------------- #
+@pytest.mark.parametrize(
+    "metrics",
+    [
+        ["sharpe_ratio", "total_return", "win_rate"],
+        ["bogus", "max_drawdown"],
+    ],
+)
+def test_best_results_multi_matches_single_metric_rankings(session, metrics):
+    repo = BacktestRepository(session)
+    repo.save_results([_backtest_row("AAPL", index) for index in range(8)])
+
+    multi = repo.get_best_results_multi(metrics, limit=3)
+
+    assert list(multi) == metrics
+    for metric in metrics:
+        expected = [r["id"] for r in repo.get_best_results(metric, limit=3)]
+        assert [r["id"] for r in multi[metric]] == expected
+
+
+def test_best_results_multi_without_metrics_returns_empty(session):
+    assert BacktestRepository(session).get_best_results_multi([]) == {}
+
+
+def test_save_results_refreshes_favorite_with_last_row(session):
+    session.add(FavoriteStock(symbol="AAPL"))
+    session.commit()
+    repo = BacktestRepository(session)
+
+    result_ids = repo.save_results(
+        [_backtest_row("AAPL", 1), _backtest_row("MSFT", 2), _backtest_row("AAPL", 3)]
+    )
+
+    favorite = session.query(FavoriteStock).filter_by(symbol="AAPL").one()
+    session.refresh(favorite)
+    assert favorite.last_backtest_id == result_ids[2]
+    assert favorite.last_sharpe == 3.0
+    assert favorite.last_backtest_at is not None
+
+
+def test_create_tables_adds_columns_missing_from_existing_table(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE favorite_stocks (id INTEGER PRIMARY KEY, "
+            "symbol VARCHAR(20) NOT NULL UNIQUE, name VARCHAR(100), "
+            "sector VARCHAR(100), last_backtest_id INTEGER, "
+            "added_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, notes TEXT)"
+        )
+        conn.execute("INSERT INTO favorite_stocks (symbol) VALUES ('AAPL')")
+
+    db = DatabaseEngine(f"sqlite:///{db_path.as_posix()}")
+    db.create_tables(OrmBase)
+    db.create_tables(OrmBase)
+    db_session = db.get_session()
+    try:
+        favorite = db_session.query(FavoriteStock).one()
+        assert favorite.symbol == "AAPL"
+        assert favorite.last_sharpe is None
+    finally:
+        db_session.close()
+        db.dispose()
+
+
+def test_create_tables_skips_columns_it_cannot_add(tmp_path, caplog):
+    db_path = tmp_path / "legacy.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE favorite_stocks (id INTEGER PRIMARY KEY, "
+            "symbol VARCHAR(20) NOT NULL UNIQUE)"
+        )
+
+    db = DatabaseEngine(f"sqlite:///{db_path.as_posix()}")
+    try:
+        with caplog.at_level(logging.WARNING):
+            db.create_tables(OrmBase)
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute("PRAGMA table_info(favorite_stocks)").fetchall()
+        columns = {row[1] for row in rows}
+    finally:
+        db.dispose()
+
+    assert "last_sharpe" in columns
+    assert "added_at" not in columns
+    assert "favorite_stocks.added_at" in caplog.text
+
+
+# ---------------------------------------------------------------------- #
+# FavoriteRepository
+# ---------------------------------------------------------------------- #
+def test_favorite_cache_is_kept_per_database(tmp_path, session):
+    other = DatabaseEngine(f"sqlite:///{(tmp_path / 'other.db').as_posix()}")
+    other.create_tables(OrmBase)
+    other_session = other.get_session()
+    try:
+        repo = FavoriteRepository(session)
+        other_repo = FavoriteRepository(other_session)
+        assert not repo.is_favorite("AAPL")
+        assert not other_repo.is_favorite("AAPL")
+
+        repo.add_favorite("AAPL")
+
+        assert repo.is_favorite("AAPL")
+        assert not other_repo.is_favorite("AAPL")
+    finally:
+        other_session.close()
+        other.dispose()
+
+
+def test_favorite_cache_drops_load_that_races_a_write(engine, session):
+    repo = FavoriteRepository(session)
+    loads = []
+
+    def _concurrent_write(conn, cursor, statement, *args):
+        # 模拟加载查询读到写入前的数据，而另一线程在查询期间写入并更新了缓存
+        if "FROM favorite_stocks" in statement:
+            loads.append(statement)
+            if len(loads) == 1:
+                FavoriteRepository(engine.get_session())._cache_update(add="MSFT")
+
+    event.listen(engine.engine, "before_cursor_execute", _concurrent_write)
+    try:
+        assert not repo.is_favorite("MSFT")
+        # 补上那次写入的数据库行
+        session.add(FavoriteStock(symbol="MSFT"))
+        session.commit()
+
+        assert repo.is_favorite("MSFT")
+        assert len(loads) == 2
+    finally:
+        event.remove(engine.engine, "before_cursor_execute", _concurrent_write)
+
+
+# ---------------------------------------------------------------------- #
+# SchedulerExecutionRepository
+# ---------------------------------------------------------------------- #
+def test_record_executions_persists_batch(engine, session):
+    repo = SchedulerExecutionRepository(session)
+    orders = [
+        {"id": "o-1", "symbol": "AAPL", "side": "buy", "qty": "10"},
+        {"symbol": "AAPL"},  # 没有订单 ID，跳过
+        {"order_id": "o-2", "symbol": "MSFT", "action": "sell", "quantity": 5},
+    ]
+
+    recorded = repo.record_executions(
+        [
+            _execution("t1", orders, risk_snapshot={"equity": 1000, "buyingPower": 50}),
+            _execution("t2", []),
+        ]
+    )
+
+    assert [execution.task_id for execution in recorded] == ["t1", "t2"]
+    assert recorded[0].order_count == 2
+
+    check = engine.get_session()
+    try:
+        assert check.query(AutomationTaskExecution).count() == 2
+        stored_orders = (
+            check.query(AutomationTaskOrder).order_by(AutomationTaskOrder.id).all()
+        )
+        assert [(o.order_id, o.action, o.quantity) for o in stored_orders] == [
+            ("o-1", "buy", 10.0),
+            ("o-2", "sell", 5.0),
+        ]
+        snapshot = check.query(AutomationRiskSnapshot).one()
+        assert snapshot.execution_id == recorded[0].id
+        assert snapshot.buying_power == 50.0
+    finally:
+        check.close()
+
+
+def test_record_executions_rolls_back_whole_batch_on_failure(engine, session):
+    repo = SchedulerExecutionRepository(session)
+
+    with pytest.raises(TypeError):
+        repo.record_executions(
+            [
+                _execution("t1", [{"id": "o-1", "symbol": "AAPL"}]),
+                _execution("t2", 42),  # 订单不可迭代，暂存时失败
+            ]
+        )
+
+    check = engine.get_session()
+    try:
+        assert check.query(AutomationTaskExecution).count() == 0
+        assert check.query(AutomationTaskOrder).count() == 0
+    finally:
+        check.close()
+
+
+def test_record_execution_rejects_unknown_arguments(session):
+    repo = SchedulerExecutionRepository(session)
+
+    with pytest.raises(TypeError):
+        repo.record_execution(**_execution("t1", []), unexpected=True)
+
+    recorded = repo.record_execution(**_execution("t1", []))
+    assert recorded.id is not None
+
+
+def test_payloads_written_with_nan_still_load(engine, session):
+    repo = SchedulerExecutionRepository(session)
+    (recorded,) = repo.record_executions([_execution("t1", [])])
+    # 标准库 json 写入的旧数据：NaN/Infinity 不是合法 JSON，orjson 拒绝解析
+    with engine.engine.begin() as conn:
+        conn.exec_driver_sql(
+            "UPDATE automation_task_executions SET summary_json = ? WHERE id = ?",
+            ('{"sharpe": NaN, "drawdown": -Infinity}', recorded.id),
+        )
+
+    check = engine.get_session()
+    try:
+        (row,) = SchedulerExecutionRepository(check).fetch_recent_executions(
+            include_payloads=True
+        )
+        assert math.isnan(row.summary_json["sharpe"])
+        assert row.summary_json["drawdown"] == float("-inf")
+    finally:
+        check.close()
+
+
+def test_json_dumps_fallback_writes_non_finite_floats_as_null():
+    # 超出 64 位的整数走标准库编码器
+    encoded = json_dumps({"big": 2**70, "values": [float("nan"), 1.5, float("inf")]})
+
+    assert json_loads(encoded) == {"big": 2**70, "values": [None, 1.5, None]}
+    assert json_dumps({"value": float("nan")}) == '{"value":null}'
+
+
+# ---------------------------------------------------------------------- #
+# 订单字段别名解析
+# ---------------------------------------------------------------------- #
+def _or_chain(order: Dict[str, Any], aliases: List[str]) -> Any:
+    value = order.get(aliases[0])
+    for alias in aliases[1:]:
+        value = value or order.get(alias)
+    return value
+
+
+@pytest.mark.parametrize(
+    "order",
+    [
+        {"order_id": "b", "id": "a"},
+        {"id": "", "order_id": "b"},
+        {"type": "limit", "side": None, "action": "buy"},
+        {"size": 0.0, "quantity": 0},
+        {"quantity": 0},
+        {"filled_at": "t3", "updated_at": "t2", "completed_at": "t1"},
+        {"avg_fill_price": 0, "filled_price": None},
+        {"ticker": "MSFT", "instrument": "AAPL", "unrelated": 1},
+    ],
+)
+def test_resolve_order_fields_matches_or_chain_precedence(order):
+    fields = _resolve_order_fields(order)
+
+    for column, aliases in _ORDER_FIELD_ALIASES.items():
+        assert fields.get(column) == _or_chain(order, list(aliases)), column